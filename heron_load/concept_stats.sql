@@ -1,29 +1,21 @@
-select c_hlevel from ontology where 'dep' = 'naaccr_ontology';
+select c_hlevel from concept_terms where 'dep' = 'ConceptClosure';
+select depth from concept_closure where 'dep' = 'ConceptClosure';
 /* IDEA: parameterize patientIdNumber column for use with other sorts of observations. */
 select patientIdNumber from observations where 'dep' = 'naaccr_observations';
 
 
+/* concept_terms has a dense term_id per c_fullname and concept_closure
+   has an (ancestor_id, descendant_id) row for each pair of terms, so the
+   rollup is a plain equijoin rather than a prefix match over all pairs. */
 create or replace temporary view concept_stats as
 with
 
-w_hash as (
-select hash(c_fullname) term_id, ont.c_fullname, ont.c_basecode, ont.c_name, ont.c_hlevel
-from ontology ont
-),
-
-/* ISSUE: check for hash collisions? or at least compute probability? */
-
-has_code as (
-select *
-from w_hash
-where c_basecode is not null
-),
-
 closure as (
-select distinct ancestor.term_id hi_id, descendant.c_basecode
-from w_hash ancestor
-join has_code descendant on descendant.c_hlevel > ancestor.c_hlevel
-and substring(descendant.c_fullname, 1, length(ancestor.c_fullname)) = ancestor.c_fullname
+select distinct cc.ancestor_id hi_id, descendant.c_basecode
+from concept_closure cc
+join concept_terms descendant on descendant.term_id = cc.descendant_id
+where cc.depth > 0
+and descendant.c_basecode is not null
 ),
 
 agg as (
@@ -33,8 +25,7 @@ join observations obs on obs.concept_cd = closure.c_basecode
 group by hi_id
 )
 
-select w_hash.*, agg.patients, agg.facts, agg.concepts
-from w_hash
-join agg on w_hash.term_id = agg.hi_id
+select t.term_id, t.c_fullname, t.c_basecode, t.c_name, t.c_hlevel, agg.patients, agg.facts, agg.concepts
+from concept_terms t
+join agg on t.term_id = agg.hi_id
 ;
-
@@ -1970,7 +1970,8 @@ from per_tumor
 
 create or replace temporary view cs_site_factor_facts as
 with per_obs as (
-select recordId
+select tumor_key
+     , recordId
      , patientIdNumber
      , cs_schema_name
      , naaccrId
@@ -1979,12 +1980,15 @@ select recordId
      , coalesce(dateCaseLastChanged, dateOfLastContact, dateCaseCompleted, dateOfDiagnosis) update_date
 from cs_obs_raw
 )
-select recordId
+select tumor_key
+     , recordId
      , patientIdNumber
      , '@' naaccrId
-     , concat('CS|',  sra.cs_schema_name, '|',
-              substr(sra.naaccrId, length('csSiteSpecificFactor1')),
-              ':', sra.raw_value) concept_cd
+     , cast(null as int) naaccrNum
+     , sra.start_date as dateOfDiagnosis
+     , 'CS|' || sra.cs_schema_name || '|'
+       || substr(sra.naaccrId, length('csSiteSpecificFactor1'))
+       || ':' || sra.raw_value concept_cd
      , '@' provider_id
      , sra.start_date
      , '@' modifier_cd  -- IDEA: modifier for synthesized info?
@@ -267,6 +267,29 @@ cross join naaccr_top t1
 cross join i2b2_path_concept i2b2;
 
 
+create table histology_concepts as
+with ea as (
+select icdo.lvl + 1 as c_hlevel
+     , (ic.c_fullname || icdo.path) as c_fullname
+     , icdo.concept_name as c_name
+     , ('NAACCR|522:' || icdo.concept_cd) as c_basecode
+     , icdo.c_visualattributes
+     , cast(null as varchar(1000)) as c_tooltip
+from icd_o_morph icdo
+cross join (
+  select c_fullname from item_concepts where naaccrNum = 522  -- Histologic Type ICD-O-3
+) ic
+)
+select ea.*
+     , ea.c_fullname as c_dimcode
+     , i2b2.*
+     , t1.update_date
+     , t1.sourcesystem_cd
+from ea
+cross join naaccr_top t1
+cross join i2b2_path_concept i2b2;
+
+
 /* Morph--Type/Behav concepts -- TODO
 union all
 select distinct lvl + 1 as c_hlevel
@@ -389,6 +412,14 @@ from primary_site_concepts
 
 union all
 
+select c_hlevel, c_fullname, c_name, c_synonym_cd, c_visualattributes, c_totalnum, c_basecode
+     , c_facttablecolumn, c_tablename, c_columnname, c_columndatatype, c_operator
+     , c_dimcode, c_comment, c_tooltip, m_applied_path, update_date, /*import_date,*/ sourcesystem_cd
+     , valuetype_cd, c_metadataxml, m_exclusion_cd
+from histology_concepts
+
+union all
+
 select c_hlevel, c_fullname, c_name, c_synonym_cd, c_visualattributes, c_totalnum, c_basecode
      , c_facttablecolumn, c_tablename, c_columnname, c_columndatatype, c_operator
      , c_dimcode, c_comment, c_tooltip, m_applied_path, update_date, /*import_date,*/ sourcesystem_cd
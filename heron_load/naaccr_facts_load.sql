@@ -13,7 +13,7 @@ ISSUE: parameterize nightherondata schema?
 
 /* check dependencies */
 select patientIdNumber from naaccr_patients where 'dep' = 'tumor_reg_tasks.NAACCR_Patients';
-select encounter_num from naaccr_tumors where 'dep' = 'tumor_reg_tasks.NAACCR_Visits';
+select encounter_num, tumor_key from naaccr_tumors where 'dep' = 'tumor_reg_tasks.NAACCR_Visits';
 select patient_num from nightherondata.observation_fact where 'dep' = 'create_datamart';
 
 
@@ -52,10 +52,17 @@ commit;
 whenever sqlerror continue;
 drop index naaccr_tumors_pk;
 whenever sqlerror exit;
-create unique index naaccr_tumors_pk on naaccr_tumors (recordId);
-
-delete from NightHeronData.encounter_mapping
-where encounter_ide_source = :encounter_ide_source;
+create unique index naaccr_tumors_pk on naaccr_tumors (tumor_key);
+
+/* With stable encounter_nums (NAACCR_Visits.encounter_map), only new
+   tumors need mapping; drop mappings that are gone or renumbered. */
+delete from NightHeronData.encounter_mapping em
+where em.encounter_ide_source = :encounter_ide_source
+and not exists (
+  select 1 from naaccr_tumors tv
+  where tv.recordId = em.encounter_ide
+  and tv.encounter_num = em.encounter_num
+  and tv.patientIdNumber = em.patient_ide);
 commit;
 
 insert into NightHeronData.encounter_mapping
@@ -76,6 +83,10 @@ insert into NightHeronData.encounter_mapping
       , tv.dateCaseReportExported as download_date
       , :encounter_ide_source as sourcesystem_cd
   from naaccr_tumors tv
+  where not exists (
+    select 1 from NightHeronData.encounter_mapping em
+    where em.encounter_ide_source = :encounter_ide_source
+    and em.encounter_ide = tv.recordId)
 ;
 
 /* check for dups from Spark SQL:
@@ -119,7 +130,7 @@ select * from (
     -- use sub-select to be sure cardinality doesn't change
     (select encounter_num
      from naaccr_tumors t
-     where t.recordId = tf.recordId) as encounter_num
+     where t.tumor_key = tf.tumor_key) as encounter_num
   , (select min(patient_num) from naaccr_patients pat
      where pat.patientIdNumber = tf.patientIdNumber) as patient_num,
   tf.concept_cd,
@@ -787,691 +787,646 @@ drop view if exists naaccr_fields;
 create view naaccr_fields as
 select row_number() over (order by dateOfDiagnosis, dateOfBirth, dateOfLastContact, dateCaseLastChanged, dateCaseCompleted, dateCaseReportExported) tumor_id
              , patientSystemIdHosp, patientIdNumber
-             , case when trim(sequenceNumberCentral) > '' then trim(sequenceNumberCentral) end as sequenceNumberCentral
-  , case when trim(dateOfDiagnosis) > '' then date(substr(dateOfDiagnosis, 1, 4) || '-' || coalesce(substr(dateOfDiagnosis, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfDiagnosis, 7, 2), '01')) end as dateOfDiagnosis
-  , case when trim(dateOfDiagnosisFlag) > '' then trim(dateOfDiagnosisFlag) end as dateOfDiagnosisFlag
-  , case when trim(primarySite) > '' then trim(primarySite) end as primarySite
-  , case when trim(laterality) > '' then trim(laterality) end as laterality
-  , case when trim(histologyIcdO2) > '' then trim(histologyIcdO2) end as histologyIcdO2
-  , case when trim(behaviorIcdO2) > '' then trim(behaviorIcdO2) end as behaviorIcdO2
-  , case when trim(dateOfMultTumorsFlag) > '' then trim(dateOfMultTumorsFlag) end as dateOfMultTumorsFlag
-  , case when trim(grade) > '' then trim(grade) end as grade
-  , case when trim(gradePathValue) > '' then trim(gradePathValue) end as gradePathValue
-  , case when trim(ambiguousTerminologyDx) > '' then trim(ambiguousTerminologyDx) end as ambiguousTerminologyDx
-  , case when trim(dateConclusiveDx) > '' then date(substr(dateConclusiveDx, 1, 4) || '-' || coalesce(substr(dateConclusiveDx, 5, 2), '01') || '-'
-                 || coalesce(substr(dateConclusiveDx, 7, 2), '01')) end as dateConclusiveDx
-  , case when trim(multTumRptAsOnePrim) > '' then trim(multTumRptAsOnePrim) end as multTumRptAsOnePrim
-  , case when trim(dateOfMultTumors) > '' then date(substr(dateOfMultTumors, 1, 4) || '-' || coalesce(substr(dateOfMultTumors, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfMultTumors, 7, 2), '01')) end as dateOfMultTumors
-  , case when trim(multiplicityCounter) > '' then (0 + multiplicityCounter) end as multiplicityCounter
-  , case when trim(dateConclusiveDxFlag) > '' then trim(dateConclusiveDxFlag) end as dateConclusiveDxFlag
-  , case when trim(gradePathSystem) > '' then trim(gradePathSystem) end as gradePathSystem
-  , case when trim(siteCodingSysCurrent) > '' then trim(siteCodingSysCurrent) end as siteCodingSysCurrent
-  , case when trim(siteCodingSysOriginal) > '' then trim(siteCodingSysOriginal) end as siteCodingSysOriginal
-  , case when trim(morphCodingSysCurrent) > '' then trim(morphCodingSysCurrent) end as morphCodingSysCurrent
-  , case when trim(morphCodingSysOriginl) > '' then trim(morphCodingSysOriginl) end as morphCodingSysOriginl
-  , case when trim(diagnosticConfirmation) > '' then trim(diagnosticConfirmation) end as diagnosticConfirmation
-  , case when trim(typeOfReportingSource) > '' then trim(typeOfReportingSource) end as typeOfReportingSource
-  , case when trim(casefindingSource) > '' then trim(casefindingSource) end as casefindingSource
-  , case when trim(histologicTypeIcdO3) > '' then trim(histologicTypeIcdO3) end as histologicTypeIcdO3
-  , case when trim(behaviorCodeIcdO3) > '' then trim(behaviorCodeIcdO3) end as behaviorCodeIcdO3
-  , case when trim(addrAtDxState) > '' then trim(addrAtDxState) end as addrAtDxState
-  , case when trim(stateAtDxGeocode19708090) > '' then trim(stateAtDxGeocode19708090) end as stateAtDxGeocode19708090
-  , case when trim(stateAtDxGeocode2000) > '' then trim(stateAtDxGeocode2000) end as stateAtDxGeocode2000
-  , case when trim(stateAtDxGeocode2010) > '' then trim(stateAtDxGeocode2010) end as stateAtDxGeocode2010
-  , case when trim(stateAtDxGeocode2020) > '' then trim(stateAtDxGeocode2020) end as stateAtDxGeocode2020
-  , case when trim(addrAtDxCountry) > '' then trim(addrAtDxCountry) end as addrAtDxCountry
-  , case when trim(censusCodSys19708090) > '' then trim(censusCodSys19708090) end as censusCodSys19708090
-  , case when trim(censusTrPovertyIndictr) > '' then trim(censusTrPovertyIndictr) end as censusTrPovertyIndictr
-  , case when trim(maritalStatusAtDx) > '' then trim(maritalStatusAtDx) end as maritalStatusAtDx
-  , case when trim(race1) > '' then trim(race1) end as race1
-  , case when trim(race2) > '' then trim(race2) end as race2
-  , case when trim(race3) > '' then trim(race3) end as race3
-  , case when trim(race4) > '' then trim(race4) end as race4
-  , case when trim(race5) > '' then trim(race5) end as race5
-  , case when trim(raceCodingSysCurrent) > '' then trim(raceCodingSysCurrent) end as raceCodingSysCurrent
-  , case when trim(raceCodingSysOriginal) > '' then trim(raceCodingSysOriginal) end as raceCodingSysOriginal
-  , case when trim(spanishHispanicOrigin) > '' then trim(spanishHispanicOrigin) end as spanishHispanicOrigin
-  , case when trim(nhiaDerivedHispOrigin) > '' then trim(nhiaDerivedHispOrigin) end as nhiaDerivedHispOrigin
-  , case when trim(ihsLink) > '' then trim(ihsLink) end as ihsLink
-  , case when trim(raceNapiia) > '' then trim(raceNapiia) end as raceNapiia
-  , case when trim(computedEthnicity) > '' then trim(computedEthnicity) end as computedEthnicity
-  , case when trim(computedEthnicitySource) > '' then trim(computedEthnicitySource) end as computedEthnicitySource
-  , case when trim(sex) > '' then trim(sex) end as sex
-  , case when trim(dateOfBirth) > '' then date(substr(dateOfBirth, 1, 4) || '-' || coalesce(substr(dateOfBirth, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfBirth, 7, 2), '01')) end as dateOfBirth
-  , case when trim(dateOfBirthFlag) > '' then trim(dateOfBirthFlag) end as dateOfBirthFlag
-  , case when trim(birthplace) > '' then trim(birthplace) end as birthplace
-  , case when trim(birthplaceState) > '' then trim(birthplaceState) end as birthplaceState
-  , case when trim(birthplaceCountry) > '' then trim(birthplaceCountry) end as birthplaceCountry
-  , case when trim(censusOccCode19702000) > '' then trim(censusOccCode19702000) end as censusOccCode19702000
-  , case when trim(censusIndCode2010) > '' then trim(censusIndCode2010) end as censusIndCode2010
-  , case when trim(censusIndCode19702000) > '' then trim(censusIndCode19702000) end as censusIndCode19702000
-  , case when trim(censusOccCode2010) > '' then trim(censusOccCode2010) end as censusOccCode2010
-  , case when trim(occupationSource) > '' then trim(occupationSource) end as occupationSource
-  , case when trim(industrySource) > '' then trim(industrySource) end as industrySource
-  , case when trim(censusOccIndSys7000) > '' then trim(censusOccIndSys7000) end as censusOccIndSys7000
-  , case when trim(ruca2000) > '' then trim(ruca2000) end as ruca2000
-  , case when trim(ruca2010) > '' then trim(ruca2010) end as ruca2010
-  , case when trim(uric2000) > '' then trim(uric2000) end as uric2000
-  , case when trim(uric2010) > '' then trim(uric2010) end as uric2010
-  , case when trim(censusTrCert19708090) > '' then trim(censusTrCert19708090) end as censusTrCert19708090
-  , case when trim(censusTrCertainty2000) > '' then trim(censusTrCertainty2000) end as censusTrCertainty2000
-  , case when trim(gisCoordinateQuality) > '' then trim(gisCoordinateQuality) end as gisCoordinateQuality
-  , case when trim(censusTrCertainty2010) > '' then trim(censusTrCertainty2010) end as censusTrCertainty2010
-  , case when trim(censusTractCertainty2020) > '' then trim(censusTractCertainty2020) end as censusTractCertainty2020
-  , case when trim(addrCurrentCountry) > '' then trim(addrCurrentCountry) end as addrCurrentCountry
-  , case when trim(followupContactCountry) > '' then trim(followupContactCountry) end as followupContactCountry
-  , case when trim(placeOfDeathState) > '' then trim(placeOfDeathState) end as placeOfDeathState
-  , case when trim(placeOfDeathCountry) > '' then trim(placeOfDeathCountry) end as placeOfDeathCountry
-  , case when trim(ruralurbanContinuum1993) > '' then trim(ruralurbanContinuum1993) end as ruralurbanContinuum1993
-  , case when trim(ruralurbanContinuum2003) > '' then trim(ruralurbanContinuum2003) end as ruralurbanContinuum2003
-  , case when trim(ruralurbanContinuum2013) > '' then trim(ruralurbanContinuum2013) end as ruralurbanContinuum2013
-  , case when trim(siteIcdO1) > '' then trim(siteIcdO1) end as siteIcdO1
-  , case when trim(histologyIcdO1) > '' then trim(histologyIcdO1) end as histologyIcdO1
-  , case when trim(behaviorIcdO1) > '' then trim(behaviorIcdO1) end as behaviorIcdO1
-  , case when trim(gradeIcdO1) > '' then trim(gradeIcdO1) end as gradeIcdO1
-  , case when trim(icdO2ConversionFlag) > '' then trim(icdO2ConversionFlag) end as icdO2ConversionFlag
-  , case when trim(overRideSsNodespos) > '' then trim(overRideSsNodespos) end as overRideSsNodespos
-  , case when trim(overRideSsTnmN) > '' then trim(overRideSsTnmN) end as overRideSsTnmN
-  , case when trim(overRideSsTnmM) > '' then trim(overRideSsTnmM) end as overRideSsTnmM
-  , case when trim(overRideAcsnClassSeq) > '' then trim(overRideAcsnClassSeq) end as overRideAcsnClassSeq
-  , case when trim(overRideHospseqDxconf) > '' then trim(overRideHospseqDxconf) end as overRideHospseqDxconf
-  , case when trim(overRideCocSiteType) > '' then trim(overRideCocSiteType) end as overRideCocSiteType
-  , case when trim(overRideHospseqSite) > '' then trim(overRideHospseqSite) end as overRideHospseqSite
-  , case when trim(overRideSiteTnmStggrp) > '' then trim(overRideSiteTnmStggrp) end as overRideSiteTnmStggrp
-  , case when trim(overRideAgeSiteMorph) > '' then trim(overRideAgeSiteMorph) end as overRideAgeSiteMorph
-  , case when trim(overRideTnmStage) > '' then trim(overRideTnmStage) end as overRideTnmStage
-  , case when trim(overRideTnmTis) > '' then trim(overRideTnmTis) end as overRideTnmTis
-  , case when trim(overRideTnm3) > '' then trim(overRideTnm3) end as overRideTnm3
-  , case when trim(overRideSeqnoDxconf) > '' then trim(overRideSeqnoDxconf) end as overRideSeqnoDxconf
-  , case when trim(overRideSiteLatSeqno) > '' then trim(overRideSiteLatSeqno) end as overRideSiteLatSeqno
-  , case when trim(overRideSurgDxconf) > '' then trim(overRideSurgDxconf) end as overRideSurgDxconf
-  , case when trim(overRideSiteType) > '' then trim(overRideSiteType) end as overRideSiteType
-  , case when trim(overRideHistology) > '' then trim(overRideHistology) end as overRideHistology
-  , case when trim(overRideReportSource) > '' then trim(overRideReportSource) end as overRideReportSource
-  , case when trim(overRideIllDefineSite) > '' then trim(overRideIllDefineSite) end as overRideIllDefineSite
-  , case when trim(overRideLeukLymphoma) > '' then trim(overRideLeukLymphoma) end as overRideLeukLymphoma
-  , case when trim(overRideSiteBehavior) > '' then trim(overRideSiteBehavior) end as overRideSiteBehavior
-  , case when trim(overRideSiteEodDxDt) > '' then trim(overRideSiteEodDxDt) end as overRideSiteEodDxDt
-  , case when trim(overRideSiteLatEod) > '' then trim(overRideSiteLatEod) end as overRideSiteLatEod
-  , case when trim(overRideSiteLatMorph) > '' then trim(overRideSiteLatMorph) end as overRideSiteLatMorph
-  , case when trim(overRideNameSex) > '' then trim(overRideNameSex) end as overRideNameSex
-  , case when trim(dateCaseInitiated) > '' then date(substr(dateCaseInitiated, 1, 4) || '-' || coalesce(substr(dateCaseInitiated, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseInitiated, 7, 2), '01')) end as dateCaseInitiated
-  , case when trim(dateCaseCompleted) > '' then date(substr(dateCaseCompleted, 1, 4) || '-' || coalesce(substr(dateCaseCompleted, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseCompleted, 7, 2), '01')) end as dateCaseCompleted
-  , case when trim(dateCaseCompletedCoc) > '' then date(substr(dateCaseCompletedCoc, 1, 4) || '-' || coalesce(substr(dateCaseCompletedCoc, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseCompletedCoc, 7, 2), '01')) end as dateCaseCompletedCoc
-  , case when trim(dateCaseLastChanged) > '' then date(substr(dateCaseLastChanged, 1, 4) || '-' || coalesce(substr(dateCaseLastChanged, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseLastChanged, 7, 2), '01')) end as dateCaseLastChanged
-  , case when trim(dateCaseReportExported) > '' then date(substr(dateCaseReportExported, 1, 4) || '-' || coalesce(substr(dateCaseReportExported, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseReportExported, 7, 2), '01')) end as dateCaseReportExported
-  , case when trim(dateCaseReportReceived) > '' then date(substr(dateCaseReportReceived, 1, 4) || '-' || coalesce(substr(dateCaseReportReceived, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseReportReceived, 7, 2), '01')) end as dateCaseReportReceived
-  , case when trim(dateCaseReportLoaded) > '' then date(substr(dateCaseReportLoaded, 1, 4) || '-' || coalesce(substr(dateCaseReportLoaded, 5, 2), '01') || '-'
-                 || coalesce(substr(dateCaseReportLoaded, 7, 2), '01')) end as dateCaseReportLoaded
-  , case when trim(dateTumorRecordAvailbl) > '' then date(substr(dateTumorRecordAvailbl, 1, 4) || '-' || coalesce(substr(dateTumorRecordAvailbl, 5, 2), '01') || '-'
-                 || coalesce(substr(dateTumorRecordAvailbl, 7, 2), '01')) end as dateTumorRecordAvailbl
-  , case when trim(icdO3ConversionFlag) > '' then trim(icdO3ConversionFlag) end as icdO3ConversionFlag
-  , case when trim(seerCodingSysCurrent) > '' then trim(seerCodingSysCurrent) end as seerCodingSysCurrent
-  , case when trim(seerCodingSysOriginal) > '' then trim(seerCodingSysOriginal) end as seerCodingSysOriginal
-  , case when trim(cocCodingSysCurrent) > '' then trim(cocCodingSysCurrent) end as cocCodingSysCurrent
-  , case when trim(cocCodingSysOriginal) > '' then trim(cocCodingSysOriginal) end as cocCodingSysOriginal
-  , case when trim(cocAccreditedFlag) > '' then trim(cocAccreditedFlag) end as cocAccreditedFlag
-  , case when trim(rqrsNcdbSubmissionFlag) > '' then trim(rqrsNcdbSubmissionFlag) end as rqrsNcdbSubmissionFlag
-  , case when trim(vendorName) > '' then trim(vendorName) end as vendorName
-  , case when trim(seerTypeOfFollowUp) > '' then trim(seerTypeOfFollowUp) end as seerTypeOfFollowUp
-  , case when trim(seerRecordNumber) > '' then trim(seerRecordNumber) end as seerRecordNumber
-  , case when trim(overRideCs1) > '' then trim(overRideCs1) end as overRideCs1
-  , case when trim(overRideCs2) > '' then trim(overRideCs2) end as overRideCs2
-  , case when trim(overRideCs3) > '' then trim(overRideCs3) end as overRideCs3
-  , case when trim(overRideCs4) > '' then trim(overRideCs4) end as overRideCs4
-  , case when trim(overRideCs5) > '' then trim(overRideCs5) end as overRideCs5
-  , case when trim(overRideCs6) > '' then trim(overRideCs6) end as overRideCs6
-  , case when trim(overRideCs7) > '' then trim(overRideCs7) end as overRideCs7
-  , case when trim(overRideCs8) > '' then trim(overRideCs8) end as overRideCs8
-  , case when trim(overRideCs9) > '' then trim(overRideCs9) end as overRideCs9
-  , case when trim(overRideCs10) > '' then trim(overRideCs10) end as overRideCs10
-  , case when trim(overRideCs11) > '' then trim(overRideCs11) end as overRideCs11
-  , case when trim(overRideCs12) > '' then trim(overRideCs12) end as overRideCs12
-  , case when trim(overRideCs13) > '' then trim(overRideCs13) end as overRideCs13
-  , case when trim(overRideCs14) > '' then trim(overRideCs14) end as overRideCs14
-  , case when trim(overRideCs15) > '' then trim(overRideCs15) end as overRideCs15
-  , case when trim(overRideCs16) > '' then trim(overRideCs16) end as overRideCs16
-  , case when trim(overRideCs17) > '' then trim(overRideCs17) end as overRideCs17
-  , case when trim(overRideCs18) > '' then trim(overRideCs18) end as overRideCs18
-  , case when trim(overRideCs19) > '' then trim(overRideCs19) end as overRideCs19
-  , case when trim(overRideCs20) > '' then trim(overRideCs20) end as overRideCs20
-  , case when trim(dateOfLastContact) > '' then date(substr(dateOfLastContact, 1, 4) || '-' || coalesce(substr(dateOfLastContact, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfLastContact, 7, 2), '01')) end as dateOfLastContact
-  , case when trim(dateOfLastContactFlag) > '' then trim(dateOfLastContactFlag) end as dateOfLastContactFlag
-  , case when trim(dateOfDeathCanada) > '' then date(substr(dateOfDeathCanada, 1, 4) || '-' || coalesce(substr(dateOfDeathCanada, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfDeathCanada, 7, 2), '01')) end as dateOfDeathCanada
-  , case when trim(dateOfDeathCanadaFlag) > '' then trim(dateOfDeathCanadaFlag) end as dateOfDeathCanadaFlag
-  , case when trim(vitalStatus) > '' then trim(vitalStatus) end as vitalStatus
-  , case when trim(vitalStatusRecode) > '' then trim(vitalStatusRecode) end as vitalStatusRecode
-  , case when trim(cancerStatus) > '' then trim(cancerStatus) end as cancerStatus
-  , case when trim(dateOfLastCancerStatus) > '' then date(substr(dateOfLastCancerStatus, 1, 4) || '-' || coalesce(substr(dateOfLastCancerStatus, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfLastCancerStatus, 7, 2), '01')) end as dateOfLastCancerStatus
-  , case when trim(dateOfLastCancerStatusFlag) > '' then trim(dateOfLastCancerStatusFlag) end as dateOfLastCancerStatusFlag
-  , case when trim(recordNumberRecode) > '' then (0 + recordNumberRecode) end as recordNumberRecode
-  , case when trim(qualityOfSurvival) > '' then trim(qualityOfSurvival) end as qualityOfSurvival
-  , case when trim(survDateActiveFollowup) > '' then date(substr(survDateActiveFollowup, 1, 4) || '-' || coalesce(substr(survDateActiveFollowup, 5, 2), '01') || '-'
-                 || coalesce(substr(survDateActiveFollowup, 7, 2), '01')) end as survDateActiveFollowup
-  , case when trim(survFlagActiveFollowup) > '' then trim(survFlagActiveFollowup) end as survFlagActiveFollowup
-  , case when trim(survMosActiveFollowup) > '' then (0 + survMosActiveFollowup) end as survMosActiveFollowup
-  , case when trim(survDatePresumedAlive) > '' then date(substr(survDatePresumedAlive, 1, 4) || '-' || coalesce(substr(survDatePresumedAlive, 5, 2), '01') || '-'
-                 || coalesce(substr(survDatePresumedAlive, 7, 2), '01')) end as survDatePresumedAlive
-  , case when trim(survFlagPresumedAlive) > '' then trim(survFlagPresumedAlive) end as survFlagPresumedAlive
-  , case when trim(survMosPresumedAlive) > '' then (0 + survMosPresumedAlive) end as survMosPresumedAlive
-  , case when trim(survDateDxRecode) > '' then date(substr(survDateDxRecode, 1, 4) || '-' || coalesce(substr(survDateDxRecode, 5, 2), '01') || '-'
-                 || coalesce(substr(survDateDxRecode, 7, 2), '01')) end as survDateDxRecode
-  , case when trim(followUpSource) > '' then trim(followUpSource) end as followUpSource
-  , case when trim(followUpSourceCentral) > '' then trim(followUpSourceCentral) end as followUpSourceCentral
-  , case when trim(nextFollowUpSource) > '' then trim(nextFollowUpSource) end as nextFollowUpSource
-  , case when trim(addrCurrentState) > '' then trim(addrCurrentState) end as addrCurrentState
-  , case when trim(followUpContactState) > '' then trim(followUpContactState) end as followUpContactState
-  , case when trim(recurrenceDate1st) > '' then date(substr(recurrenceDate1st, 1, 4) || '-' || coalesce(substr(recurrenceDate1st, 5, 2), '01') || '-'
-                 || coalesce(substr(recurrenceDate1st, 7, 2), '01')) end as recurrenceDate1st
-  , case when trim(recurrenceDate1stFlag) > '' then trim(recurrenceDate1stFlag) end as recurrenceDate1stFlag
-  , case when trim(recurrenceType1st) > '' then trim(recurrenceType1st) end as recurrenceType1st
-  , case when trim(causeOfDeath) > '' then trim(causeOfDeath) end as causeOfDeath
-  , case when trim(seerCauseSpecificCod) > '' then trim(seerCauseSpecificCod) end as seerCauseSpecificCod
-  , case when trim(seerOtherCod) > '' then trim(seerOtherCod) end as seerOtherCod
-  , case when trim(icdRevisionNumber) > '' then trim(icdRevisionNumber) end as icdRevisionNumber
-  , case when trim(autopsy) > '' then trim(autopsy) end as autopsy
-  , case when trim(placeOfDeath) > '' then trim(placeOfDeath) end as placeOfDeath
-  , case when trim(sequenceNumberHospital) > '' then trim(sequenceNumberHospital) end as sequenceNumberHospital
-  , case when trim(abstractedBy) > '' then trim(abstractedBy) end as abstractedBy
-  , case when trim(dateOf1stContact) > '' then date(substr(dateOf1stContact, 1, 4) || '-' || coalesce(substr(dateOf1stContact, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOf1stContact, 7, 2), '01')) end as dateOf1stContact
-  , case when trim(dateOf1stContactFlag) > '' then trim(dateOf1stContactFlag) end as dateOf1stContactFlag
-  , case when trim(dateOfInptAdm) > '' then date(substr(dateOfInptAdm, 1, 4) || '-' || coalesce(substr(dateOfInptAdm, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfInptAdm, 7, 2), '01')) end as dateOfInptAdm
-  , case when trim(dateOfInptAdmFlag) > '' then trim(dateOfInptAdmFlag) end as dateOfInptAdmFlag
-  , case when trim(dateOfInptDisch) > '' then date(substr(dateOfInptDisch, 1, 4) || '-' || coalesce(substr(dateOfInptDisch, 5, 2), '01') || '-'
-                 || coalesce(substr(dateOfInptDisch, 7, 2), '01')) end as dateOfInptDisch
-  , case when trim(dateOfInptDischFlag) > '' then trim(dateOfInptDischFlag) end as dateOfInptDischFlag
-  , case when trim(inpatientStatus) > '' then trim(inpatientStatus) end as inpatientStatus
-  , case when trim(classOfCase) > '' then trim(classOfCase) end as classOfCase
-  , case when trim(primaryPayerAtDx) > '' then trim(primaryPayerAtDx) end as primaryPayerAtDx
-  , case when trim(rxHospSurgApp2010) > '' then trim(rxHospSurgApp2010) end as rxHospSurgApp2010
-  , case when trim(rxHospSurgPrimSite) > '' then trim(rxHospSurgPrimSite) end as rxHospSurgPrimSite
-  , case when trim(rxHospScopeRegLnSur) > '' then trim(rxHospScopeRegLnSur) end as rxHospScopeRegLnSur
-  , case when trim(rxHospSurgOthRegDis) > '' then trim(rxHospSurgOthRegDis) end as rxHospSurgOthRegDis
-  , case when trim(rxHospRegLnRemoved) > '' then (0 + rxHospRegLnRemoved) end as rxHospRegLnRemoved
-  , case when trim(rxHospRadiation) > '' then trim(rxHospRadiation) end as rxHospRadiation
-  , case when trim(rxHospChemo) > '' then trim(rxHospChemo) end as rxHospChemo
-  , case when trim(rxHospHormone) > '' then trim(rxHospHormone) end as rxHospHormone
-  , case when trim(rxHospBrm) > '' then trim(rxHospBrm) end as rxHospBrm
-  , case when trim(rxHospOther) > '' then trim(rxHospOther) end as rxHospOther
-  , case when trim(rxHospDxStgProc) > '' then trim(rxHospDxStgProc) end as rxHospDxStgProc
-  , case when trim(rxHospSurgSite9802) > '' then trim(rxHospSurgSite9802) end as rxHospSurgSite9802
-  , case when trim(rxHospScopeReg9802) > '' then trim(rxHospScopeReg9802) end as rxHospScopeReg9802
-  , case when trim(rxHospSurgOth9802) > '' then trim(rxHospSurgOth9802) end as rxHospSurgOth9802
-  , case when trim(rxHospPalliativeProc) > '' then trim(rxHospPalliativeProc) end as rxHospPalliativeProc
-  , case when trim(recordType) > '' then trim(recordType) end as recordType
-  , case when trim(registryType) > '' then trim(registryType) end as registryType
-  , case when trim(registryId) > '' then trim(registryId) end as registryId
-  , case when trim(npiRegistryId) > '' then trim(npiRegistryId) end as npiRegistryId
-  , case when trim(naaccrRecordVersion) > '' then trim(naaccrRecordVersion) end as naaccrRecordVersion
-  , case when trim(tumorRecordNumber) > '' then trim(tumorRecordNumber) end as tumorRecordNumber
-  , case when trim(dateRegionalLNDissection) > '' then date(substr(dateRegionalLNDissection, 1, 4) || '-' || coalesce(substr(dateRegionalLNDissection, 5, 2), '01') || '-'
-                 || coalesce(substr(dateRegionalLNDissection, 7, 2), '01')) end as dateRegionalLNDissection
-  , case when trim(dateRegionalLNDissectionFlag) > '' then trim(dateRegionalLNDissectionFlag) end as dateRegionalLNDissectionFlag
-  , case when trim(tumorSizeClinical) > '' then trim(tumorSizeClinical) end as tumorSizeClinical
-  , case when trim(tumorSizePathologic) > '' then trim(tumorSizePathologic) end as tumorSizePathologic
-  , case when trim(tumorSizeSummary) > '' then trim(tumorSizeSummary) end as tumorSizeSummary
-  , case when trim(seerSummaryStage2000) > '' then trim(seerSummaryStage2000) end as seerSummaryStage2000
-  , case when trim(seerSummaryStage1977) > '' then trim(seerSummaryStage1977) end as seerSummaryStage1977
-  , case when trim(derivedSummaryStage2018) > '' then trim(derivedSummaryStage2018) end as derivedSummaryStage2018
-  , case when trim(summaryStage2018) > '' then trim(summaryStage2018) end as summaryStage2018
-  , case when trim(eodPrimaryTumor) > '' then trim(eodPrimaryTumor) end as eodPrimaryTumor
-  , case when trim(eodRegionalNodes) > '' then trim(eodRegionalNodes) end as eodRegionalNodes
-  , case when trim(eodMets) > '' then trim(eodMets) end as eodMets
-  , case when trim(eodTumorSize) > '' then (0 + eodTumorSize) end as eodTumorSize
-  , case when trim(eodExtension) > '' then trim(eodExtension) end as eodExtension
-  , case when trim(eodExtensionProstPath) > '' then trim(eodExtensionProstPath) end as eodExtensionProstPath
-  , case when trim(eodLymphNodeInvolv) > '' then trim(eodLymphNodeInvolv) end as eodLymphNodeInvolv
-  , case when trim(regionalNodesPositive) > '' then (0 + regionalNodesPositive) end as regionalNodesPositive
-  , case when trim(regionalNodesExamined) > '' then (0 + regionalNodesExamined) end as regionalNodesExamined
-  , case when trim(dateSentinelLymphNodeBiopsy) > '' then date(substr(dateSentinelLymphNodeBiopsy, 1, 4) || '-' || coalesce(substr(dateSentinelLymphNodeBiopsy, 5, 2), '01') || '-'
-                 || coalesce(substr(dateSentinelLymphNodeBiopsy, 7, 2), '01')) end as dateSentinelLymphNodeBiopsy
-  , case when trim(dateSentinelLymphNodeBiopsyFlag) > '' then trim(dateSentinelLymphNodeBiopsyFlag) end as dateSentinelLymphNodeBiopsyFlag
-  , case when trim(sentinelLymphNodesExamined) > '' then trim(sentinelLymphNodesExamined) end as sentinelLymphNodesExamined
-  , case when trim(sentinelLymphNodesPositive) > '' then trim(sentinelLymphNodesPositive) end as sentinelLymphNodesPositive
-  , case when trim(eodOld2Digit) > '' then trim(eodOld2Digit) end as eodOld2Digit
-  , case when trim(eodOld4Digit) > '' then trim(eodOld4Digit) end as eodOld4Digit
-  , case when trim(codingSystemForEod) > '' then trim(codingSystemForEod) end as codingSystemForEod
-  , case when trim(tnmPathT) > '' then trim(tnmPathT) end as tnmPathT
-  , case when trim(tnmPathN) > '' then trim(tnmPathN) end as tnmPathN
-  , case when trim(tnmPathM) > '' then trim(tnmPathM) end as tnmPathM
-  , case when trim(tnmPathStageGroup) > '' then trim(tnmPathStageGroup) end as tnmPathStageGroup
-  , case when trim(tnmPathDescriptor) > '' then trim(tnmPathDescriptor) end as tnmPathDescriptor
-  , case when trim(tnmPathStagedBy) > '' then trim(tnmPathStagedBy) end as tnmPathStagedBy
-  , case when trim(tnmClinT) > '' then trim(tnmClinT) end as tnmClinT
-  , case when trim(tnmClinN) > '' then trim(tnmClinN) end as tnmClinN
-  , case when trim(tnmClinM) > '' then trim(tnmClinM) end as tnmClinM
-  , case when trim(tnmClinStageGroup) > '' then trim(tnmClinStageGroup) end as tnmClinStageGroup
-  , case when trim(tnmClinDescriptor) > '' then trim(tnmClinDescriptor) end as tnmClinDescriptor
-  , case when trim(tnmClinStagedBy) > '' then trim(tnmClinStagedBy) end as tnmClinStagedBy
-  , case when trim(ajccId) > '' then trim(ajccId) end as ajccId
-  , case when trim(ajccTnmClinTSuffix) > '' then trim(ajccTnmClinTSuffix) end as ajccTnmClinTSuffix
-  , case when trim(ajccTnmPathTSuffix) > '' then trim(ajccTnmPathTSuffix) end as ajccTnmPathTSuffix
-  , case when trim(ajccTnmPostTherapyTSuffix) > '' then trim(ajccTnmPostTherapyTSuffix) end as ajccTnmPostTherapyTSuffix
-  , case when trim(ajccTnmClinNSuffix) > '' then trim(ajccTnmClinNSuffix) end as ajccTnmClinNSuffix
-  , case when trim(ajccTnmPathNSuffix) > '' then trim(ajccTnmPathNSuffix) end as ajccTnmPathNSuffix
-  , case when trim(ajccTnmPostTherapyNSuffix) > '' then trim(ajccTnmPostTherapyNSuffix) end as ajccTnmPostTherapyNSuffix
-  , case when trim(tnmEditionNumber) > '' then trim(tnmEditionNumber) end as tnmEditionNumber
-  , case when trim(metsAtDxBone) > '' then trim(metsAtDxBone) end as metsAtDxBone
-  , case when trim(metsAtDxBrain) > '' then trim(metsAtDxBrain) end as metsAtDxBrain
-  , case when trim(metsAtDxDistantLn) > '' then trim(metsAtDxDistantLn) end as metsAtDxDistantLn
-  , case when trim(metsAtDxLiver) > '' then trim(metsAtDxLiver) end as metsAtDxLiver
-  , case when trim(metsAtDxLung) > '' then trim(metsAtDxLung) end as metsAtDxLung
-  , case when trim(metsAtDxOther) > '' then trim(metsAtDxOther) end as metsAtDxOther
-  , case when trim(pediatricStage) > '' then trim(pediatricStage) end as pediatricStage
-  , case when trim(pediatricStagingSystem) > '' then trim(pediatricStagingSystem) end as pediatricStagingSystem
-  , case when trim(pediatricStagedBy) > '' then trim(pediatricStagedBy) end as pediatricStagedBy
-  , case when trim(tumorMarker1) > '' then trim(tumorMarker1) end as tumorMarker1
-  , case when trim(tumorMarker2) > '' then trim(tumorMarker2) end as tumorMarker2
-  , case when trim(tumorMarker3) > '' then trim(tumorMarker3) end as tumorMarker3
-  , case when trim(lymphVascularInvasion) > '' then trim(lymphVascularInvasion) end as lymphVascularInvasion
-  , case when trim(csTumorSize) > '' then (0 + csTumorSize) end as csTumorSize
-  , case when trim(csExtension) > '' then trim(csExtension) end as csExtension
-  , case when trim(csTumorSizeExtEval) > '' then trim(csTumorSizeExtEval) end as csTumorSizeExtEval
-  , case when trim(csLymphNodes) > '' then trim(csLymphNodes) end as csLymphNodes
-  , case when trim(csLymphNodesEval) > '' then trim(csLymphNodesEval) end as csLymphNodesEval
-  , case when trim(csMetsAtDx) > '' then trim(csMetsAtDx) end as csMetsAtDx
-  , case when trim(csMetsAtDxBone) > '' then trim(csMetsAtDxBone) end as csMetsAtDxBone
-  , case when trim(csMetsAtDxBrain) > '' then trim(csMetsAtDxBrain) end as csMetsAtDxBrain
-  , case when trim(csMetsAtDxLiver) > '' then trim(csMetsAtDxLiver) end as csMetsAtDxLiver
-  , case when trim(csMetsAtDxLung) > '' then trim(csMetsAtDxLung) end as csMetsAtDxLung
-  , case when trim(csMetsEval) > '' then trim(csMetsEval) end as csMetsEval
-  , case when trim(csSiteSpecificFactor7) > '' then trim(csSiteSpecificFactor7) end as csSiteSpecificFactor7
-  , case when trim(csSiteSpecificFactor8) > '' then trim(csSiteSpecificFactor8) end as csSiteSpecificFactor8
-  , case when trim(csSiteSpecificFactor9) > '' then trim(csSiteSpecificFactor9) end as csSiteSpecificFactor9
-  , case when trim(csSiteSpecificFactor10) > '' then trim(csSiteSpecificFactor10) end as csSiteSpecificFactor10
-  , case when trim(csSiteSpecificFactor11) > '' then trim(csSiteSpecificFactor11) end as csSiteSpecificFactor11
-  , case when trim(csSiteSpecificFactor12) > '' then trim(csSiteSpecificFactor12) end as csSiteSpecificFactor12
-  , case when trim(csSiteSpecificFactor13) > '' then trim(csSiteSpecificFactor13) end as csSiteSpecificFactor13
-  , case when trim(csSiteSpecificFactor14) > '' then trim(csSiteSpecificFactor14) end as csSiteSpecificFactor14
-  , case when trim(csSiteSpecificFactor15) > '' then trim(csSiteSpecificFactor15) end as csSiteSpecificFactor15
-  , case when trim(csSiteSpecificFactor16) > '' then trim(csSiteSpecificFactor16) end as csSiteSpecificFactor16
-  , case when trim(csSiteSpecificFactor17) > '' then trim(csSiteSpecificFactor17) end as csSiteSpecificFactor17
-  , case when trim(csSiteSpecificFactor18) > '' then trim(csSiteSpecificFactor18) end as csSiteSpecificFactor18
-  , case when trim(csSiteSpecificFactor19) > '' then trim(csSiteSpecificFactor19) end as csSiteSpecificFactor19
-  , case when trim(csSiteSpecificFactor20) > '' then trim(csSiteSpecificFactor20) end as csSiteSpecificFactor20
-  , case when trim(csSiteSpecificFactor21) > '' then trim(csSiteSpecificFactor21) end as csSiteSpecificFactor21
-  , case when trim(csSiteSpecificFactor22) > '' then trim(csSiteSpecificFactor22) end as csSiteSpecificFactor22
-  , case when trim(csSiteSpecificFactor23) > '' then trim(csSiteSpecificFactor23) end as csSiteSpecificFactor23
-  , case when trim(csSiteSpecificFactor24) > '' then trim(csSiteSpecificFactor24) end as csSiteSpecificFactor24
-  , case when trim(csSiteSpecificFactor25) > '' then trim(csSiteSpecificFactor25) end as csSiteSpecificFactor25
-  , case when trim(csSiteSpecificFactor1) > '' then trim(csSiteSpecificFactor1) end as csSiteSpecificFactor1
-  , case when trim(csSiteSpecificFactor2) > '' then trim(csSiteSpecificFactor2) end as csSiteSpecificFactor2
-  , case when trim(csSiteSpecificFactor3) > '' then trim(csSiteSpecificFactor3) end as csSiteSpecificFactor3
-  , case when trim(csSiteSpecificFactor4) > '' then trim(csSiteSpecificFactor4) end as csSiteSpecificFactor4
-  , case when trim(csSiteSpecificFactor5) > '' then trim(csSiteSpecificFactor5) end as csSiteSpecificFactor5
-  , case when trim(csSiteSpecificFactor6) > '' then trim(csSiteSpecificFactor6) end as csSiteSpecificFactor6
-  , case when trim(csVersionInputOriginal) > '' then trim(csVersionInputOriginal) end as csVersionInputOriginal
-  , case when trim(csVersionDerived) > '' then trim(csVersionDerived) end as csVersionDerived
-  , case when trim(csVersionInputCurrent) > '' then trim(csVersionInputCurrent) end as csVersionInputCurrent
-  , case when trim(derivedAjcc6T) > '' then trim(derivedAjcc6T) end as derivedAjcc6T
-  , case when trim(derivedAjcc6TDescript) > '' then trim(derivedAjcc6TDescript) end as derivedAjcc6TDescript
-  , case when trim(derivedAjcc6N) > '' then trim(derivedAjcc6N) end as derivedAjcc6N
-  , case when trim(derivedAjcc6NDescript) > '' then trim(derivedAjcc6NDescript) end as derivedAjcc6NDescript
-  , case when trim(derivedAjcc6M) > '' then trim(derivedAjcc6M) end as derivedAjcc6M
-  , case when trim(derivedAjcc6MDescript) > '' then trim(derivedAjcc6MDescript) end as derivedAjcc6MDescript
-  , case when trim(derivedAjcc6StageGrp) > '' then trim(derivedAjcc6StageGrp) end as derivedAjcc6StageGrp
-  , case when trim(derivedSs1977) > '' then trim(derivedSs1977) end as derivedSs1977
-  , case when trim(derivedSs2000) > '' then trim(derivedSs2000) end as derivedSs2000
-  , case when trim(derivedAjccFlag) > '' then trim(derivedAjccFlag) end as derivedAjccFlag
-  , case when trim(derivedSs1977Flag) > '' then trim(derivedSs1977Flag) end as derivedSs1977Flag
-  , case when trim(derivedSs2000Flag) > '' then trim(derivedSs2000Flag) end as derivedSs2000Flag
-  , case when trim(comorbidComplication1) > '' then trim(comorbidComplication1) end as comorbidComplication1
-  , case when trim(comorbidComplication2) > '' then trim(comorbidComplication2) end as comorbidComplication2
-  , case when trim(comorbidComplication3) > '' then trim(comorbidComplication3) end as comorbidComplication3
-  , case when trim(comorbidComplication4) > '' then trim(comorbidComplication4) end as comorbidComplication4
-  , case when trim(comorbidComplication5) > '' then trim(comorbidComplication5) end as comorbidComplication5
-  , case when trim(comorbidComplication6) > '' then trim(comorbidComplication6) end as comorbidComplication6
-  , case when trim(comorbidComplication7) > '' then trim(comorbidComplication7) end as comorbidComplication7
-  , case when trim(comorbidComplication8) > '' then trim(comorbidComplication8) end as comorbidComplication8
-  , case when trim(comorbidComplication9) > '' then trim(comorbidComplication9) end as comorbidComplication9
-  , case when trim(comorbidComplication10) > '' then trim(comorbidComplication10) end as comorbidComplication10
-  , case when trim(icdRevisionComorbid) > '' then trim(icdRevisionComorbid) end as icdRevisionComorbid
-  , case when trim(derivedAjcc7T) > '' then trim(derivedAjcc7T) end as derivedAjcc7T
-  , case when trim(derivedAjcc7TDescript) > '' then trim(derivedAjcc7TDescript) end as derivedAjcc7TDescript
-  , case when trim(derivedAjcc7N) > '' then trim(derivedAjcc7N) end as derivedAjcc7N
-  , case when trim(derivedAjcc7NDescript) > '' then trim(derivedAjcc7NDescript) end as derivedAjcc7NDescript
-  , case when trim(derivedAjcc7M) > '' then trim(derivedAjcc7M) end as derivedAjcc7M
-  , case when trim(derivedAjcc7MDescript) > '' then trim(derivedAjcc7MDescript) end as derivedAjcc7MDescript
-  , case when trim(derivedAjcc7StageGrp) > '' then trim(derivedAjcc7StageGrp) end as derivedAjcc7StageGrp
-  , case when trim(derivedPrerx7T) > '' then trim(derivedPrerx7T) end as derivedPrerx7T
-  , case when trim(derivedPrerx7TDescrip) > '' then trim(derivedPrerx7TDescrip) end as derivedPrerx7TDescrip
-  , case when trim(derivedPrerx7N) > '' then trim(derivedPrerx7N) end as derivedPrerx7N
-  , case when trim(derivedPrerx7NDescrip) > '' then trim(derivedPrerx7NDescrip) end as derivedPrerx7NDescrip
-  , case when trim(derivedPrerx7M) > '' then trim(derivedPrerx7M) end as derivedPrerx7M
-  , case when trim(derivedPrerx7MDescrip) > '' then trim(derivedPrerx7MDescrip) end as derivedPrerx7MDescrip
-  , case when trim(derivedPrerx7StageGrp) > '' then trim(derivedPrerx7StageGrp) end as derivedPrerx7StageGrp
-  , case when trim(derivedPostrx7T) > '' then trim(derivedPostrx7T) end as derivedPostrx7T
-  , case when trim(derivedPostrx7N) > '' then trim(derivedPostrx7N) end as derivedPostrx7N
-  , case when trim(derivedPostrx7M) > '' then trim(derivedPostrx7M) end as derivedPostrx7M
-  , case when trim(derivedPostrx7StgeGrp) > '' then trim(derivedPostrx7StgeGrp) end as derivedPostrx7StgeGrp
-  , case when trim(derivedNeoadjuvRxFlag) > '' then trim(derivedNeoadjuvRxFlag) end as derivedNeoadjuvRxFlag
-  , case when trim(derivedSeerPathStgGrp) > '' then trim(derivedSeerPathStgGrp) end as derivedSeerPathStgGrp
-  , case when trim(derivedSeerClinStgGrp) > '' then trim(derivedSeerClinStgGrp) end as derivedSeerClinStgGrp
-  , case when trim(derivedSeerCmbStgGrp) > '' then trim(derivedSeerCmbStgGrp) end as derivedSeerCmbStgGrp
-  , case when trim(derivedSeerCombinedT) > '' then trim(derivedSeerCombinedT) end as derivedSeerCombinedT
-  , case when trim(derivedSeerCombinedN) > '' then trim(derivedSeerCombinedN) end as derivedSeerCombinedN
-  , case when trim(derivedSeerCombinedM) > '' then trim(derivedSeerCombinedM) end as derivedSeerCombinedM
-  , case when trim(derivedSeerCmbTSrc) > '' then trim(derivedSeerCmbTSrc) end as derivedSeerCmbTSrc
-  , case when trim(derivedSeerCmbNSrc) > '' then trim(derivedSeerCmbNSrc) end as derivedSeerCmbNSrc
-  , case when trim(derivedSeerCmbMSrc) > '' then trim(derivedSeerCmbMSrc) end as derivedSeerCmbMSrc
-  , case when trim(npcrDerivedClinStgGrp) > '' then trim(npcrDerivedClinStgGrp) end as npcrDerivedClinStgGrp
-  , case when trim(npcrDerivedPathStgGrp) > '' then trim(npcrDerivedPathStgGrp) end as npcrDerivedPathStgGrp
-  , case when trim(seerSiteSpecificFact1) > '' then trim(seerSiteSpecificFact1) end as seerSiteSpecificFact1
-  , case when trim(seerSiteSpecificFact2) > '' then trim(seerSiteSpecificFact2) end as seerSiteSpecificFact2
-  , case when trim(seerSiteSpecificFact3) > '' then trim(seerSiteSpecificFact3) end as seerSiteSpecificFact3
-  , case when trim(seerSiteSpecificFact4) > '' then trim(seerSiteSpecificFact4) end as seerSiteSpecificFact4
-  , case when trim(seerSiteSpecificFact5) > '' then trim(seerSiteSpecificFact5) end as seerSiteSpecificFact5
-  , case when trim(seerSiteSpecificFact6) > '' then trim(seerSiteSpecificFact6) end as seerSiteSpecificFact6
-  , case when trim(secondaryDiagnosis1) > '' then trim(secondaryDiagnosis1) end as secondaryDiagnosis1
-  , case when trim(secondaryDiagnosis2) > '' then trim(secondaryDiagnosis2) end as secondaryDiagnosis2
-  , case when trim(secondaryDiagnosis3) > '' then trim(secondaryDiagnosis3) end as secondaryDiagnosis3
-  , case when trim(secondaryDiagnosis4) > '' then trim(secondaryDiagnosis4) end as secondaryDiagnosis4
-  , case when trim(secondaryDiagnosis5) > '' then trim(secondaryDiagnosis5) end as secondaryDiagnosis5
-  , case when trim(secondaryDiagnosis6) > '' then trim(secondaryDiagnosis6) end as secondaryDiagnosis6
-  , case when trim(secondaryDiagnosis7) > '' then trim(secondaryDiagnosis7) end as secondaryDiagnosis7
-  , case when trim(secondaryDiagnosis8) > '' then trim(secondaryDiagnosis8) end as secondaryDiagnosis8
-  , case when trim(secondaryDiagnosis9) > '' then trim(secondaryDiagnosis9) end as secondaryDiagnosis9
-  , case when trim(secondaryDiagnosis10) > '' then trim(secondaryDiagnosis10) end as secondaryDiagnosis10
-  , case when trim(schemaId) > '' then trim(schemaId) end as schemaId
-  , case when trim(chromosome1pLossHeterozygosity) > '' then trim(chromosome1pLossHeterozygosity) end as chromosome1pLossHeterozygosity
-  , case when trim(chromosome19qLossHeterozygosity) > '' then trim(chromosome19qLossHeterozygosity) end as chromosome19qLossHeterozygosity
-  , case when trim(adenoidCysticBasaloidPattern) > '' then trim(adenoidCysticBasaloidPattern) end as adenoidCysticBasaloidPattern
-  , case when trim(adenopathy) > '' then trim(adenopathy) end as adenopathy
-  , case when trim(afpPostOrchiectomyLabValue) > '' then (0 + afpPostOrchiectomyLabValue) end as afpPostOrchiectomyLabValue
-  , case when trim(afpPostOrchiectomyRange) > '' then trim(afpPostOrchiectomyRange) end as afpPostOrchiectomyRange
-  , case when trim(afpPreOrchiectomyLabValue) > '' then (0 + afpPreOrchiectomyLabValue) end as afpPreOrchiectomyLabValue
-  , case when trim(afpPreOrchiectomyRange) > '' then trim(afpPreOrchiectomyRange) end as afpPreOrchiectomyRange
-  , case when trim(afpPretreatmentInterpretation) > '' then trim(afpPretreatmentInterpretation) end as afpPretreatmentInterpretation
-  , case when trim(afpPretreatmentLabValue) > '' then (0 + afpPretreatmentLabValue) end as afpPretreatmentLabValue
-  , case when trim(anemia) > '' then trim(anemia) end as anemia
-  , case when trim(bSymptoms) > '' then trim(bSymptoms) end as bSymptoms
-  , case when trim(bilirubinPretxTotalLabValue) > '' then trim(bilirubinPretxTotalLabValue) end as bilirubinPretxTotalLabValue
-  , case when trim(bilirubinPretxUnitOfMeasure) > '' then trim(bilirubinPretxUnitOfMeasure) end as bilirubinPretxUnitOfMeasure
-  , case when trim(boneInvasion) > '' then trim(boneInvasion) end as boneInvasion
-  , case when trim(brainMolecularMarkers) > '' then trim(brainMolecularMarkers) end as brainMolecularMarkers
-  , case when trim(breslowTumorThickness) > '' then trim(breslowTumorThickness) end as breslowTumorThickness
-  , case when trim(ca125PretreatmentInterpretation) > '' then trim(ca125PretreatmentInterpretation) end as ca125PretreatmentInterpretation
-  , case when trim(ceaPretreatmentInterpretation) > '' then trim(ceaPretreatmentInterpretation) end as ceaPretreatmentInterpretation
-  , case when trim(ceaPretreatmentLabValue) > '' then (0 + ceaPretreatmentLabValue) end as ceaPretreatmentLabValue
-  , case when trim(chromosome3Status) > '' then trim(chromosome3Status) end as chromosome3Status
-  , case when trim(chromosome8qStatus) > '' then trim(chromosome8qStatus) end as chromosome8qStatus
-  , case when trim(circumferentialResectionMargin) > '' then trim(circumferentialResectionMargin) end as circumferentialResectionMargin
-  , case when trim(creatininePretreatmentLabValue) > '' then trim(creatininePretreatmentLabValue) end as creatininePretreatmentLabValue
-  , case when trim(creatininePretxUnitOfMeasure) > '' then trim(creatininePretxUnitOfMeasure) end as creatininePretxUnitOfMeasure
-  , case when trim(estrogenReceptorPercntPosOrRange) > '' then trim(estrogenReceptorPercntPosOrRange) end as estrogenReceptorPercntPosOrRange
-  , case when trim(estrogenReceptorSummary) > '' then trim(estrogenReceptorSummary) end as estrogenReceptorSummary
-  , case when trim(estrogenReceptorTotalAllredScore) > '' then trim(estrogenReceptorTotalAllredScore) end as estrogenReceptorTotalAllredScore
-  , case when trim(esophagusAndEgjTumorEpicenter) > '' then trim(esophagusAndEgjTumorEpicenter) end as esophagusAndEgjTumorEpicenter
-  , case when trim(extranodalExtensionClin) > '' then trim(extranodalExtensionClin) end as extranodalExtensionClin
-  , case when trim(extranodalExtensionHeadNeckClin) > '' then trim(extranodalExtensionHeadNeckClin) end as extranodalExtensionHeadNeckClin
-  , case when trim(extranodalExtensionHeadNeckPath) > '' then trim(extranodalExtensionHeadNeckPath) end as extranodalExtensionHeadNeckPath
-  , case when trim(extranodalExtensionPath) > '' then trim(extranodalExtensionPath) end as extranodalExtensionPath
-  , case when trim(extravascularMatrixPatterns) > '' then trim(extravascularMatrixPatterns) end as extravascularMatrixPatterns
-  , case when trim(fibrosisScore) > '' then trim(fibrosisScore) end as fibrosisScore
-  , case when trim(figoStage) > '' then trim(figoStage) end as figoStage
-  , case when trim(gestationalTrophoblasticPxIndex) > '' then trim(gestationalTrophoblasticPxIndex) end as gestationalTrophoblasticPxIndex
-  , case when trim(gleasonPatternsClinical) > '' then trim(gleasonPatternsClinical) end as gleasonPatternsClinical
-  , case when trim(gleasonPatternsPathological) > '' then trim(gleasonPatternsPathological) end as gleasonPatternsPathological
-  , case when trim(gleasonScoreClinical) > '' then trim(gleasonScoreClinical) end as gleasonScoreClinical
-  , case when trim(gleasonScorePathological) > '' then trim(gleasonScorePathological) end as gleasonScorePathological
-  , case when trim(gleasonTertiaryPattern) > '' then trim(gleasonTertiaryPattern) end as gleasonTertiaryPattern
-  , case when trim(gradeClinical) > '' then trim(gradeClinical) end as gradeClinical
-  , case when trim(gradePathological) > '' then trim(gradePathological) end as gradePathological
-  , case when trim(gradePostTherapy) > '' then trim(gradePostTherapy) end as gradePostTherapy
-  , case when trim(hcgPostOrchiectomyLabValue) > '' then (0 + hcgPostOrchiectomyLabValue) end as hcgPostOrchiectomyLabValue
-  , case when trim(hcgPostOrchiectomyRange) > '' then trim(hcgPostOrchiectomyRange) end as hcgPostOrchiectomyRange
-  , case when trim(hcgPreOrchiectomyLabValue) > '' then (0 + hcgPreOrchiectomyLabValue) end as hcgPreOrchiectomyLabValue
-  , case when trim(hcgPreOrchiectomyRange) > '' then trim(hcgPreOrchiectomyRange) end as hcgPreOrchiectomyRange
-  , case when trim(her2IhcSummary) > '' then trim(her2IhcSummary) end as her2IhcSummary
-  , case when trim(her2IshDualProbeCopyNumber) > '' then trim(her2IshDualProbeCopyNumber) end as her2IshDualProbeCopyNumber
-  , case when trim(her2IshDualProbeRatio) > '' then trim(her2IshDualProbeRatio) end as her2IshDualProbeRatio
-  , case when trim(her2IshSingleProbeCopyNumber) > '' then trim(her2IshSingleProbeCopyNumber) end as her2IshSingleProbeCopyNumber
-  , case when trim(her2IshSummary) > '' then trim(her2IshSummary) end as her2IshSummary
-  , case when trim(her2OverallSummary) > '' then trim(her2OverallSummary) end as her2OverallSummary
-  , case when trim(heritableTrait) > '' then trim(heritableTrait) end as heritableTrait
-  , case when trim(highRiskCytogenetics) > '' then trim(highRiskCytogenetics) end as highRiskCytogenetics
-  , case when trim(highRiskHistologicFeatures) > '' then trim(highRiskHistologicFeatures) end as highRiskHistologicFeatures
-  , case when trim(hivStatus) > '' then trim(hivStatus) end as hivStatus
-  , case when trim(iNRProthrombinTime) > '' then trim(iNRProthrombinTime) end as iNRProthrombinTime
-  , case when trim(ipsilateralAdrenalGlandInvolve) > '' then trim(ipsilateralAdrenalGlandInvolve) end as ipsilateralAdrenalGlandInvolve
-  , case when trim(jak2) > '' then trim(jak2) end as jak2
-  , case when trim(ki67) > '' then trim(ki67) end as ki67
-  , case when trim(invasionBeyondCapsule) > '' then trim(invasionBeyondCapsule) end as invasionBeyondCapsule
-  , case when trim(kitGeneImmunohistochemistry) > '' then trim(kitGeneImmunohistochemistry) end as kitGeneImmunohistochemistry
-  , case when trim(kras) > '' then trim(kras) end as kras
-  , case when trim(ldhPostOrchiectomyRange) > '' then trim(ldhPostOrchiectomyRange) end as ldhPostOrchiectomyRange
-  , case when trim(ldhPreOrchiectomyRange) > '' then trim(ldhPreOrchiectomyRange) end as ldhPreOrchiectomyRange
-  , case when trim(ldhPretreatmentLevel) > '' then trim(ldhPretreatmentLevel) end as ldhPretreatmentLevel
-  , case when trim(ldhUpperLimitsOfNormal) > '' then trim(ldhUpperLimitsOfNormal) end as ldhUpperLimitsOfNormal
-  , case when trim(lnAssessMethodFemoralInguinal) > '' then trim(lnAssessMethodFemoralInguinal) end as lnAssessMethodFemoralInguinal
-  , case when trim(lnAssessMethodParaaortic) > '' then trim(lnAssessMethodParaaortic) end as lnAssessMethodParaaortic
-  , case when trim(lnAssessMethodPelvic) > '' then trim(lnAssessMethodPelvic) end as lnAssessMethodPelvic
-  , case when trim(lnDistantAssessMethod) > '' then trim(lnDistantAssessMethod) end as lnDistantAssessMethod
-  , case when trim(lnDistantMediastinalScalene) > '' then trim(lnDistantMediastinalScalene) end as lnDistantMediastinalScalene
-  , case when trim(lnHeadAndNeckLevels1To3) > '' then trim(lnHeadAndNeckLevels1To3) end as lnHeadAndNeckLevels1To3
-  , case when trim(lnHeadAndNeckLevels4To5) > '' then trim(lnHeadAndNeckLevels4To5) end as lnHeadAndNeckLevels4To5
-  , case when trim(lnHeadAndNeckLevels6To7) > '' then trim(lnHeadAndNeckLevels6To7) end as lnHeadAndNeckLevels6To7
-  , case when trim(lnHeadAndNeckOther) > '' then trim(lnHeadAndNeckOther) end as lnHeadAndNeckOther
-  , case when trim(lnIsolatedTumorCells) > '' then trim(lnIsolatedTumorCells) end as lnIsolatedTumorCells
-  , case when trim(lnLaterality) > '' then trim(lnLaterality) end as lnLaterality
-  , case when trim(lnPositiveAxillaryLevel1To2) > '' then trim(lnPositiveAxillaryLevel1To2) end as lnPositiveAxillaryLevel1To2
-  , case when trim(lnSize) > '' then trim(lnSize) end as lnSize
-  , case when trim(lnStatusFemorInguinParaaortPelv) > '' then trim(lnStatusFemorInguinParaaortPelv) end as lnStatusFemorInguinParaaortPelv
-  , case when trim(lymphocytosis) > '' then trim(lymphocytosis) end as lymphocytosis
-  , case when trim(majorVeinInvolvement) > '' then trim(majorVeinInvolvement) end as majorVeinInvolvement
-  , case when trim(measuredBasalDiameter) > '' then trim(measuredBasalDiameter) end as measuredBasalDiameter
-  , case when trim(measuredThickness) > '' then trim(measuredThickness) end as measuredThickness
-  , case when trim(methylationOfO6MGMT) > '' then trim(methylationOfO6MGMT) end as methylationOfO6MGMT
-  , case when trim(microsatelliteInstability) > '' then trim(microsatelliteInstability) end as microsatelliteInstability
-  , case when trim(microvascularDensity) > '' then trim(microvascularDensity) end as microvascularDensity
-  , case when trim(mitoticCountUvealMelanoma) > '' then trim(mitoticCountUvealMelanoma) end as mitoticCountUvealMelanoma
-  , case when trim(mitoticRateMelanoma) > '' then trim(mitoticRateMelanoma) end as mitoticRateMelanoma
-  , case when trim(multigeneSignatureMethod) > '' then trim(multigeneSignatureMethod) end as multigeneSignatureMethod
-  , case when trim(multigeneSignatureResults) > '' then trim(multigeneSignatureResults) end as multigeneSignatureResults
-  , case when trim(nccnInternationalPrognosticIndex) > '' then trim(nccnInternationalPrognosticIndex) end as nccnInternationalPrognosticIndex
-  , case when trim(numberOfCoresExamined) > '' then trim(numberOfCoresExamined) end as numberOfCoresExamined
-  , case when trim(numberOfCoresPositive) > '' then trim(numberOfCoresPositive) end as numberOfCoresPositive
-  , case when trim(numberOfExaminedParaAorticNodes) > '' then trim(numberOfExaminedParaAorticNodes) end as numberOfExaminedParaAorticNodes
-  , case when trim(numberOfExaminedPelvicNodes) > '' then trim(numberOfExaminedPelvicNodes) end as numberOfExaminedPelvicNodes
-  , case when trim(numberOfPositiveParaAorticNodes) > '' then trim(numberOfPositiveParaAorticNodes) end as numberOfPositiveParaAorticNodes
-  , case when trim(numberOfPositivePelvicNodes) > '' then trim(numberOfPositivePelvicNodes) end as numberOfPositivePelvicNodes
-  , case when trim(oncotypeDxRecurrenceScoreDcis) > '' then trim(oncotypeDxRecurrenceScoreDcis) end as oncotypeDxRecurrenceScoreDcis
-  , case when trim(oncotypeDxRecurrenceScoreInvasiv) > '' then trim(oncotypeDxRecurrenceScoreInvasiv) end as oncotypeDxRecurrenceScoreInvasiv
-  , case when trim(oncotypeDxRiskLevelDcis) > '' then trim(oncotypeDxRiskLevelDcis) end as oncotypeDxRiskLevelDcis
-  , case when trim(oncotypeDxRiskLevelInvasive) > '' then trim(oncotypeDxRiskLevelInvasive) end as oncotypeDxRiskLevelInvasive
-  , case when trim(organomegaly) > '' then trim(organomegaly) end as organomegaly
-  , case when trim(percentNecrosisPostNeoadjuvant) > '' then trim(percentNecrosisPostNeoadjuvant) end as percentNecrosisPostNeoadjuvant
-  , case when trim(perineuralInvasion) > '' then trim(perineuralInvasion) end as perineuralInvasion
-  , case when trim(peripheralBloodInvolvement) > '' then trim(peripheralBloodInvolvement) end as peripheralBloodInvolvement
-  , case when trim(peritonealCytology) > '' then trim(peritonealCytology) end as peritonealCytology
-  , case when trim(pleuralEffusion) > '' then trim(pleuralEffusion) end as pleuralEffusion
-  , case when trim(progesteroneRecepPrcntPosOrRange) > '' then trim(progesteroneRecepPrcntPosOrRange) end as progesteroneRecepPrcntPosOrRange
-  , case when trim(progesteroneRecepSummary) > '' then trim(progesteroneRecepSummary) end as progesteroneRecepSummary
-  , case when trim(progesteroneRecepTotalAllredScor) > '' then trim(progesteroneRecepTotalAllredScor) end as progesteroneRecepTotalAllredScor
-  , case when trim(primarySclerosingCholangitis) > '' then trim(primarySclerosingCholangitis) end as primarySclerosingCholangitis
-  , case when trim(profoundImmuneSuppression) > '' then trim(profoundImmuneSuppression) end as profoundImmuneSuppression
-  , case when trim(prostatePathologicalExtension) > '' then trim(prostatePathologicalExtension) end as prostatePathologicalExtension
-  , case when trim(psaLabValue) > '' then trim(psaLabValue) end as psaLabValue
-  , case when trim(residualTumVolPostCytoreduction) > '' then trim(residualTumVolPostCytoreduction) end as residualTumVolPostCytoreduction
-  , case when trim(responseToNeoadjuvantTherapy) > '' then trim(responseToNeoadjuvantTherapy) end as responseToNeoadjuvantTherapy
-  , case when trim(sCategoryClinical) > '' then trim(sCategoryClinical) end as sCategoryClinical
-  , case when trim(sCategoryPathological) > '' then trim(sCategoryPathological) end as sCategoryPathological
-  , case when trim(sarcomatoidFeatures) > '' then trim(sarcomatoidFeatures) end as sarcomatoidFeatures
-  , case when trim(schemaDiscriminator1) > '' then trim(schemaDiscriminator1) end as schemaDiscriminator1
-  , case when trim(schemaDiscriminator2) > '' then trim(schemaDiscriminator2) end as schemaDiscriminator2
-  , case when trim(schemaDiscriminator3) > '' then trim(schemaDiscriminator3) end as schemaDiscriminator3
-  , case when trim(separateTumorNodules) > '' then trim(separateTumorNodules) end as separateTumorNodules
-  , case when trim(serumAlbuminPretreatmentLevel) > '' then trim(serumAlbuminPretreatmentLevel) end as serumAlbuminPretreatmentLevel
-  , case when trim(serumBeta2MicroglobulinPretxLvl) > '' then trim(serumBeta2MicroglobulinPretxLvl) end as serumBeta2MicroglobulinPretxLvl
-  , case when trim(ldhPretreatmentLabValue) > '' then (0 + ldhPretreatmentLabValue) end as ldhPretreatmentLabValue
-  , case when trim(thrombocytopenia) > '' then trim(thrombocytopenia) end as thrombocytopenia
-  , case when trim(tumorDeposits) > '' then trim(tumorDeposits) end as tumorDeposits
-  , case when trim(tumorGrowthPattern) > '' then trim(tumorGrowthPattern) end as tumorGrowthPattern
-  , case when trim(ulceration) > '' then trim(ulceration) end as ulceration
-  , case when trim(visceralParietalPleuralInvasion) > '' then trim(visceralParietalPleuralInvasion) end as visceralParietalPleuralInvasion
-  , case when trim(rxDateSurgery) > '' then date(substr(rxDateSurgery, 1, 4) || '-' || coalesce(substr(rxDateSurgery, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateSurgery, 7, 2), '01')) end as rxDateSurgery
-  , case when trim(rxDateSurgeryFlag) > '' then trim(rxDateSurgeryFlag) end as rxDateSurgeryFlag
-  , case when trim(rxDateRadiation) > '' then date(substr(rxDateRadiation, 1, 4) || '-' || coalesce(substr(rxDateRadiation, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateRadiation, 7, 2), '01')) end as rxDateRadiation
-  , case when trim(rxDateRadiationFlag) > '' then trim(rxDateRadiationFlag) end as rxDateRadiationFlag
-  , case when trim(rxDateChemo) > '' then date(substr(rxDateChemo, 1, 4) || '-' || coalesce(substr(rxDateChemo, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateChemo, 7, 2), '01')) end as rxDateChemo
-  , case when trim(rxDateChemoFlag) > '' then trim(rxDateChemoFlag) end as rxDateChemoFlag
-  , case when trim(rxDateHormone) > '' then date(substr(rxDateHormone, 1, 4) || '-' || coalesce(substr(rxDateHormone, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateHormone, 7, 2), '01')) end as rxDateHormone
-  , case when trim(rxDateHormoneFlag) > '' then trim(rxDateHormoneFlag) end as rxDateHormoneFlag
-  , case when trim(rxDateBrm) > '' then date(substr(rxDateBrm, 1, 4) || '-' || coalesce(substr(rxDateBrm, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateBrm, 7, 2), '01')) end as rxDateBrm
-  , case when trim(rxDateBrmFlag) > '' then trim(rxDateBrmFlag) end as rxDateBrmFlag
-  , case when trim(rxDateOther) > '' then date(substr(rxDateOther, 1, 4) || '-' || coalesce(substr(rxDateOther, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateOther, 7, 2), '01')) end as rxDateOther
-  , case when trim(rxDateOtherFlag) > '' then trim(rxDateOtherFlag) end as rxDateOtherFlag
-  , case when trim(dateInitialRxSeer) > '' then date(substr(dateInitialRxSeer, 1, 4) || '-' || coalesce(substr(dateInitialRxSeer, 5, 2), '01') || '-'
-                 || coalesce(substr(dateInitialRxSeer, 7, 2), '01')) end as dateInitialRxSeer
-  , case when trim(dateInitialRxSeerFlag) > '' then trim(dateInitialRxSeerFlag) end as dateInitialRxSeerFlag
-  , case when trim(date1stCrsRxCoc) > '' then date(substr(date1stCrsRxCoc, 1, 4) || '-' || coalesce(substr(date1stCrsRxCoc, 5, 2), '01') || '-'
-                 || coalesce(substr(date1stCrsRxCoc, 7, 2), '01')) end as date1stCrsRxCoc
-  , case when trim(date1stCrsRxCocFlag) > '' then trim(date1stCrsRxCocFlag) end as date1stCrsRxCocFlag
-  , case when trim(rxDateDxStgProc) > '' then date(substr(rxDateDxStgProc, 1, 4) || '-' || coalesce(substr(rxDateDxStgProc, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateDxStgProc, 7, 2), '01')) end as rxDateDxStgProc
-  , case when trim(rxDateDxStgProcFlag) > '' then trim(rxDateDxStgProcFlag) end as rxDateDxStgProcFlag
-  , case when trim(rxSummTreatmentStatus) > '' then trim(rxSummTreatmentStatus) end as rxSummTreatmentStatus
-  , case when trim(rxSummSurgPrimSite) > '' then trim(rxSummSurgPrimSite) end as rxSummSurgPrimSite
-  , case when trim(rxSummScopeRegLnSur) > '' then trim(rxSummScopeRegLnSur) end as rxSummScopeRegLnSur
-  , case when trim(rxSummSurgOthRegDis) > '' then trim(rxSummSurgOthRegDis) end as rxSummSurgOthRegDis
-  , case when trim(rxSummRegLnExamined) > '' then (0 + rxSummRegLnExamined) end as rxSummRegLnExamined
-  , case when trim(rxSummSurgicalApproch) > '' then trim(rxSummSurgicalApproch) end as rxSummSurgicalApproch
-  , case when trim(rxSummSurgicalMargins) > '' then trim(rxSummSurgicalMargins) end as rxSummSurgicalMargins
-  , case when trim(rxSummReconstruct1st) > '' then trim(rxSummReconstruct1st) end as rxSummReconstruct1st
-  , case when trim(reasonForNoSurgery) > '' then trim(reasonForNoSurgery) end as reasonForNoSurgery
-  , case when trim(rxSummDxStgProc) > '' then trim(rxSummDxStgProc) end as rxSummDxStgProc
-  , case when trim(rxSummRadiation) > '' then trim(rxSummRadiation) end as rxSummRadiation
-  , case when trim(rxSummRadToCns) > '' then trim(rxSummRadToCns) end as rxSummRadToCns
-  , case when trim(rxSummSurgRadSeq) > '' then trim(rxSummSurgRadSeq) end as rxSummSurgRadSeq
-  , case when trim(rxSummChemo) > '' then trim(rxSummChemo) end as rxSummChemo
-  , case when trim(rxSummHormone) > '' then trim(rxSummHormone) end as rxSummHormone
-  , case when trim(rxSummBrm) > '' then trim(rxSummBrm) end as rxSummBrm
-  , case when trim(rxSummOther) > '' then trim(rxSummOther) end as rxSummOther
-  , case when trim(reasonForNoRadiation) > '' then trim(reasonForNoRadiation) end as reasonForNoRadiation
-  , case when trim(rxCodingSystemCurrent) > '' then trim(rxCodingSystemCurrent) end as rxCodingSystemCurrent
-  , case when trim(phase1DosePerFraction) > '' then (0 + phase1DosePerFraction) end as phase1DosePerFraction
-  , case when trim(phase1RadiationExternalBeamTech) > '' then trim(phase1RadiationExternalBeamTech) end as phase1RadiationExternalBeamTech
-  , case when trim(phase1NumberOfFractions) > '' then (0 + phase1NumberOfFractions) end as phase1NumberOfFractions
-  , case when trim(phase1RadiationPrimaryTxVolume) > '' then trim(phase1RadiationPrimaryTxVolume) end as phase1RadiationPrimaryTxVolume
-  , case when trim(phase1RadiationToDrainingLN) > '' then trim(phase1RadiationToDrainingLN) end as phase1RadiationToDrainingLN
-  , case when trim(phase1RadiationTreatmentModality) > '' then trim(phase1RadiationTreatmentModality) end as phase1RadiationTreatmentModality
-  , case when trim(phase1TotalDose) > '' then (0 + phase1TotalDose) end as phase1TotalDose
-  , case when trim(radRegionalDoseCgy) > '' then (0 + radRegionalDoseCgy) end as radRegionalDoseCgy
-  , case when trim(phase2DosePerFraction) > '' then (0 + phase2DosePerFraction) end as phase2DosePerFraction
-  , case when trim(phase2RadiationExternalBeamTech) > '' then trim(phase2RadiationExternalBeamTech) end as phase2RadiationExternalBeamTech
-  , case when trim(phase2NumberOfFractions) > '' then (0 + phase2NumberOfFractions) end as phase2NumberOfFractions
-  , case when trim(phase2RadiationPrimaryTxVolume) > '' then trim(phase2RadiationPrimaryTxVolume) end as phase2RadiationPrimaryTxVolume
-  , case when trim(phase2RadiationToDrainingLN) > '' then trim(phase2RadiationToDrainingLN) end as phase2RadiationToDrainingLN
-  , case when trim(phase2RadiationTreatmentModality) > '' then trim(phase2RadiationTreatmentModality) end as phase2RadiationTreatmentModality
-  , case when trim(phase2TotalDose) > '' then (0 + phase2TotalDose) end as phase2TotalDose
-  , case when trim(radNoOfTreatmentVol) > '' then (0 + radNoOfTreatmentVol) end as radNoOfTreatmentVol
-  , case when trim(phase3DosePerFraction) > '' then (0 + phase3DosePerFraction) end as phase3DosePerFraction
-  , case when trim(phase3RadiationExternalBeamTech) > '' then trim(phase3RadiationExternalBeamTech) end as phase3RadiationExternalBeamTech
-  , case when trim(phase3NumberOfFractions) > '' then (0 + phase3NumberOfFractions) end as phase3NumberOfFractions
-  , case when trim(phase3RadiationPrimaryTxVolume) > '' then trim(phase3RadiationPrimaryTxVolume) end as phase3RadiationPrimaryTxVolume
-  , case when trim(phase3RadiationToDrainingLN) > '' then trim(phase3RadiationToDrainingLN) end as phase3RadiationToDrainingLN
-  , case when trim(phase3RadiationTreatmentModality) > '' then trim(phase3RadiationTreatmentModality) end as phase3RadiationTreatmentModality
-  , case when trim(phase3TotalDose) > '' then (0 + phase3TotalDose) end as phase3TotalDose
-  , case when trim(radiationTxDiscontinuedEarly) > '' then trim(radiationTxDiscontinuedEarly) end as radiationTxDiscontinuedEarly
-  , case when trim(numberPhasesOfRadTxToVolume) > '' then (0 + numberPhasesOfRadTxToVolume) end as numberPhasesOfRadTxToVolume
-  , case when trim(totalDose) > '' then (0 + totalDose) end as totalDose
-  , case when trim(radTreatmentVolume) > '' then trim(radTreatmentVolume) end as radTreatmentVolume
-  , case when trim(radLocationOfRx) > '' then trim(radLocationOfRx) end as radLocationOfRx
-  , case when trim(radRegionalRxModality) > '' then trim(radRegionalRxModality) end as radRegionalRxModality
-  , case when trim(rxSummSystemicSurSeq) > '' then trim(rxSummSystemicSurSeq) end as rxSummSystemicSurSeq
-  , case when trim(rxSummSurgeryType) > '' then trim(rxSummSurgeryType) end as rxSummSurgeryType
-  , case when trim(rxSummSurgSite9802) > '' then trim(rxSummSurgSite9802) end as rxSummSurgSite9802
-  , case when trim(rxSummScopeReg9802) > '' then trim(rxSummScopeReg9802) end as rxSummScopeReg9802
-  , case when trim(rxSummSurgOth9802) > '' then trim(rxSummSurgOth9802) end as rxSummSurgOth9802
-  , case when trim(rxDateMostDefinSurg) > '' then date(substr(rxDateMostDefinSurg, 1, 4) || '-' || coalesce(substr(rxDateMostDefinSurg, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateMostDefinSurg, 7, 2), '01')) end as rxDateMostDefinSurg
-  , case when trim(rxDateMostDefinSurgFlag) > '' then trim(rxDateMostDefinSurgFlag) end as rxDateMostDefinSurgFlag
-  , case when trim(rxDateSurgicalDisch) > '' then date(substr(rxDateSurgicalDisch, 1, 4) || '-' || coalesce(substr(rxDateSurgicalDisch, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateSurgicalDisch, 7, 2), '01')) end as rxDateSurgicalDisch
-  , case when trim(rxDateSurgicalDischFlag) > '' then trim(rxDateSurgicalDischFlag) end as rxDateSurgicalDischFlag
-  , case when trim(readmSameHosp30Days) > '' then trim(readmSameHosp30Days) end as readmSameHosp30Days
-  , case when trim(radBoostRxModality) > '' then trim(radBoostRxModality) end as radBoostRxModality
-  , case when trim(radBoostDoseCgy) > '' then (0 + radBoostDoseCgy) end as radBoostDoseCgy
-  , case when trim(rxDateRadiationEnded) > '' then date(substr(rxDateRadiationEnded, 1, 4) || '-' || coalesce(substr(rxDateRadiationEnded, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateRadiationEnded, 7, 2), '01')) end as rxDateRadiationEnded
-  , case when trim(rxDateRadiationEndedFlag) > '' then trim(rxDateRadiationEndedFlag) end as rxDateRadiationEndedFlag
-  , case when trim(rxDateSystemic) > '' then date(substr(rxDateSystemic, 1, 4) || '-' || coalesce(substr(rxDateSystemic, 5, 2), '01') || '-'
-                 || coalesce(substr(rxDateSystemic, 7, 2), '01')) end as rxDateSystemic
-  , case when trim(rxDateSystemicFlag) > '' then trim(rxDateSystemicFlag) end as rxDateSystemicFlag
-  , case when trim(rxSummTransplntEndocr) > '' then trim(rxSummTransplntEndocr) end as rxSummTransplntEndocr
-  , case when trim(rxSummPalliativeProc) > '' then trim(rxSummPalliativeProc) end as rxSummPalliativeProc
-  , case when trim(subsqRx2ndCourseDate) > '' then date(substr(subsqRx2ndCourseDate, 1, 4) || '-' || coalesce(substr(subsqRx2ndCourseDate, 5, 2), '01') || '-'
-                 || coalesce(substr(subsqRx2ndCourseDate, 7, 2), '01')) end as subsqRx2ndCourseDate
-  , case when trim(subsqRx2ndcrsDateFlag) > '' then trim(subsqRx2ndcrsDateFlag) end as subsqRx2ndcrsDateFlag
-  , case when trim(subsqRx2ndCourseSurg) > '' then trim(subsqRx2ndCourseSurg) end as subsqRx2ndCourseSurg
-  , case when trim(subsqRx2ndCourseRad) > '' then trim(subsqRx2ndCourseRad) end as subsqRx2ndCourseRad
-  , case when trim(subsqRx2ndCourseChemo) > '' then trim(subsqRx2ndCourseChemo) end as subsqRx2ndCourseChemo
-  , case when trim(subsqRx2ndCourseHorm) > '' then trim(subsqRx2ndCourseHorm) end as subsqRx2ndCourseHorm
-  , case when trim(subsqRx2ndCourseBrm) > '' then trim(subsqRx2ndCourseBrm) end as subsqRx2ndCourseBrm
-  , case when trim(subsqRx2ndCourseOth) > '' then trim(subsqRx2ndCourseOth) end as subsqRx2ndCourseOth
-  , case when trim(subsqRx2ndScopeLnSu) > '' then trim(subsqRx2ndScopeLnSu) end as subsqRx2ndScopeLnSu
-  , case when trim(subsqRx2ndSurgOth) > '' then trim(subsqRx2ndSurgOth) end as subsqRx2ndSurgOth
-  , case when trim(subsqRx2ndRegLnRem) > '' then trim(subsqRx2ndRegLnRem) end as subsqRx2ndRegLnRem
-  , case when trim(subsqRx3rdCourseDate) > '' then date(substr(subsqRx3rdCourseDate, 1, 4) || '-' || coalesce(substr(subsqRx3rdCourseDate, 5, 2), '01') || '-'
-                 || coalesce(substr(subsqRx3rdCourseDate, 7, 2), '01')) end as subsqRx3rdCourseDate
-  , case when trim(subsqRx3rdcrsDateFlag) > '' then trim(subsqRx3rdcrsDateFlag) end as subsqRx3rdcrsDateFlag
-  , case when trim(subsqRx3rdCourseSurg) > '' then trim(subsqRx3rdCourseSurg) end as subsqRx3rdCourseSurg
-  , case when trim(subsqRx3rdCourseRad) > '' then trim(subsqRx3rdCourseRad) end as subsqRx3rdCourseRad
-  , case when trim(subsqRx3rdCourseChemo) > '' then trim(subsqRx3rdCourseChemo) end as subsqRx3rdCourseChemo
-  , case when trim(subsqRx3rdCourseHorm) > '' then trim(subsqRx3rdCourseHorm) end as subsqRx3rdCourseHorm
-  , case when trim(subsqRx3rdCourseBrm) > '' then trim(subsqRx3rdCourseBrm) end as subsqRx3rdCourseBrm
-  , case when trim(subsqRx3rdCourseOth) > '' then trim(subsqRx3rdCourseOth) end as subsqRx3rdCourseOth
-  , case when trim(subsqRx3rdScopeLnSu) > '' then trim(subsqRx3rdScopeLnSu) end as subsqRx3rdScopeLnSu
-  , case when trim(subsqRx3rdSurgOth) > '' then trim(subsqRx3rdSurgOth) end as subsqRx3rdSurgOth
-  , case when trim(subsqRx3rdRegLnRem) > '' then trim(subsqRx3rdRegLnRem) end as subsqRx3rdRegLnRem
-  , case when trim(subsqRx4thCourseDate) > '' then date(substr(subsqRx4thCourseDate, 1, 4) || '-' || coalesce(substr(subsqRx4thCourseDate, 5, 2), '01') || '-'
-                 || coalesce(substr(subsqRx4thCourseDate, 7, 2), '01')) end as subsqRx4thCourseDate
-  , case when trim(subsqRx4thcrsDateFlag) > '' then trim(subsqRx4thcrsDateFlag) end as subsqRx4thcrsDateFlag
-  , case when trim(subsqRx4thCourseSurg) > '' then trim(subsqRx4thCourseSurg) end as subsqRx4thCourseSurg
-  , case when trim(subsqRx4thCourseRad) > '' then trim(subsqRx4thCourseRad) end as subsqRx4thCourseRad
-  , case when trim(subsqRx4thCourseChemo) > '' then trim(subsqRx4thCourseChemo) end as subsqRx4thCourseChemo
-  , case when trim(subsqRx4thCourseHorm) > '' then trim(subsqRx4thCourseHorm) end as subsqRx4thCourseHorm
-  , case when trim(subsqRx4thCourseBrm) > '' then trim(subsqRx4thCourseBrm) end as subsqRx4thCourseBrm
-  , case when trim(subsqRx4thCourseOth) > '' then trim(subsqRx4thCourseOth) end as subsqRx4thCourseOth
-  , case when trim(subsqRx4thScopeLnSu) > '' then trim(subsqRx4thScopeLnSu) end as subsqRx4thScopeLnSu
-  , case when trim(subsqRx4thSurgOth) > '' then trim(subsqRx4thSurgOth) end as subsqRx4thSurgOth
-  , case when trim(subsqRx4thRegLnRem) > '' then trim(subsqRx4thRegLnRem) end as subsqRx4thRegLnRem
-  , case when trim(subsqRxReconstructDel) > '' then trim(subsqRxReconstructDel) end as subsqRxReconstructDel
-  , case when trim(pathDateSpecCollect1) > '' then date(substr(pathDateSpecCollect1, 1, 4) || '-' || coalesce(substr(pathDateSpecCollect1, 5, 2), '01') || '-'
-                 || coalesce(substr(pathDateSpecCollect1, 7, 2), '01')) end as pathDateSpecCollect1
-  , case when trim(pathDateSpecCollect2) > '' then date(substr(pathDateSpecCollect2, 1, 4) || '-' || coalesce(substr(pathDateSpecCollect2, 5, 2), '01') || '-'
-                 || coalesce(substr(pathDateSpecCollect2, 7, 2), '01')) end as pathDateSpecCollect2
-  , case when trim(pathDateSpecCollect3) > '' then date(substr(pathDateSpecCollect3, 1, 4) || '-' || coalesce(substr(pathDateSpecCollect3, 5, 2), '01') || '-'
-                 || coalesce(substr(pathDateSpecCollect3, 7, 2), '01')) end as pathDateSpecCollect3
-  , case when trim(pathDateSpecCollect4) > '' then date(substr(pathDateSpecCollect4, 1, 4) || '-' || coalesce(substr(pathDateSpecCollect4, 5, 2), '01') || '-'
-                 || coalesce(substr(pathDateSpecCollect4, 7, 2), '01')) end as pathDateSpecCollect4
-  , case when trim(pathDateSpecCollect5) > '' then date(substr(pathDateSpecCollect5, 1, 4) || '-' || coalesce(substr(pathDateSpecCollect5, 5, 2), '01') || '-'
-                 || coalesce(substr(pathDateSpecCollect5, 7, 2), '01')) end as pathDateSpecCollect5
-  , case when trim(pathReportType1) > '' then trim(pathReportType1) end as pathReportType1
-  , case when trim(pathReportType2) > '' then trim(pathReportType2) end as pathReportType2
-  , case when trim(pathReportType3) > '' then trim(pathReportType3) end as pathReportType3
-  , case when trim(pathReportType4) > '' then trim(pathReportType4) end as pathReportType4
-  , case when trim(pathReportType5) > '' then trim(pathReportType5) end as pathReportType5
+             , naaccr_code(sequenceNumberCentral) as sequenceNumberCentral
+  , naaccr_date(dateOfDiagnosis) as dateOfDiagnosis
+  , naaccr_code(dateOfDiagnosisFlag) as dateOfDiagnosisFlag
+  , naaccr_code(primarySite) as primarySite
+  , naaccr_code(laterality) as laterality
+  , naaccr_code(histologyIcdO2) as histologyIcdO2
+  , naaccr_code(behaviorIcdO2) as behaviorIcdO2
+  , naaccr_code(dateOfMultTumorsFlag) as dateOfMultTumorsFlag
+  , naaccr_code(grade) as grade
+  , naaccr_code(gradePathValue) as gradePathValue
+  , naaccr_code(ambiguousTerminologyDx) as ambiguousTerminologyDx
+  , naaccr_date(dateConclusiveDx) as dateConclusiveDx
+  , naaccr_code(multTumRptAsOnePrim) as multTumRptAsOnePrim
+  , naaccr_date(dateOfMultTumors) as dateOfMultTumors
+  , naaccr_num(multiplicityCounter) as multiplicityCounter
+  , naaccr_code(dateConclusiveDxFlag) as dateConclusiveDxFlag
+  , naaccr_code(gradePathSystem) as gradePathSystem
+  , naaccr_code(siteCodingSysCurrent) as siteCodingSysCurrent
+  , naaccr_code(siteCodingSysOriginal) as siteCodingSysOriginal
+  , naaccr_code(morphCodingSysCurrent) as morphCodingSysCurrent
+  , naaccr_code(morphCodingSysOriginl) as morphCodingSysOriginl
+  , naaccr_code(diagnosticConfirmation) as diagnosticConfirmation
+  , naaccr_code(typeOfReportingSource) as typeOfReportingSource
+  , naaccr_code(casefindingSource) as casefindingSource
+  , naaccr_code(histologicTypeIcdO3) as histologicTypeIcdO3
+  , naaccr_code(behaviorCodeIcdO3) as behaviorCodeIcdO3
+  , naaccr_code(addrAtDxState) as addrAtDxState
+  , naaccr_code(stateAtDxGeocode19708090) as stateAtDxGeocode19708090
+  , naaccr_code(stateAtDxGeocode2000) as stateAtDxGeocode2000
+  , naaccr_code(stateAtDxGeocode2010) as stateAtDxGeocode2010
+  , naaccr_code(stateAtDxGeocode2020) as stateAtDxGeocode2020
+  , naaccr_code(addrAtDxCountry) as addrAtDxCountry
+  , naaccr_code(censusCodSys19708090) as censusCodSys19708090
+  , naaccr_code(censusTrPovertyIndictr) as censusTrPovertyIndictr
+  , naaccr_code(maritalStatusAtDx) as maritalStatusAtDx
+  , naaccr_code(race1) as race1
+  , naaccr_code(race2) as race2
+  , naaccr_code(race3) as race3
+  , naaccr_code(race4) as race4
+  , naaccr_code(race5) as race5
+  , naaccr_code(raceCodingSysCurrent) as raceCodingSysCurrent
+  , naaccr_code(raceCodingSysOriginal) as raceCodingSysOriginal
+  , naaccr_code(spanishHispanicOrigin) as spanishHispanicOrigin
+  , naaccr_code(nhiaDerivedHispOrigin) as nhiaDerivedHispOrigin
+  , naaccr_code(ihsLink) as ihsLink
+  , naaccr_code(raceNapiia) as raceNapiia
+  , naaccr_code(computedEthnicity) as computedEthnicity
+  , naaccr_code(computedEthnicitySource) as computedEthnicitySource
+  , naaccr_code(sex) as sex
+  , naaccr_date(dateOfBirth) as dateOfBirth
+  , naaccr_code(dateOfBirthFlag) as dateOfBirthFlag
+  , naaccr_code(birthplace) as birthplace
+  , naaccr_code(birthplaceState) as birthplaceState
+  , naaccr_code(birthplaceCountry) as birthplaceCountry
+  , naaccr_code(censusOccCode19702000) as censusOccCode19702000
+  , naaccr_code(censusIndCode2010) as censusIndCode2010
+  , naaccr_code(censusIndCode19702000) as censusIndCode19702000
+  , naaccr_code(censusOccCode2010) as censusOccCode2010
+  , naaccr_code(occupationSource) as occupationSource
+  , naaccr_code(industrySource) as industrySource
+  , naaccr_code(censusOccIndSys7000) as censusOccIndSys7000
+  , naaccr_code(ruca2000) as ruca2000
+  , naaccr_code(ruca2010) as ruca2010
+  , naaccr_code(uric2000) as uric2000
+  , naaccr_code(uric2010) as uric2010
+  , naaccr_code(censusTrCert19708090) as censusTrCert19708090
+  , naaccr_code(censusTrCertainty2000) as censusTrCertainty2000
+  , naaccr_code(gisCoordinateQuality) as gisCoordinateQuality
+  , naaccr_code(censusTrCertainty2010) as censusTrCertainty2010
+  , naaccr_code(censusTractCertainty2020) as censusTractCertainty2020
+  , naaccr_code(addrCurrentCountry) as addrCurrentCountry
+  , naaccr_code(followupContactCountry) as followupContactCountry
+  , naaccr_code(placeOfDeathState) as placeOfDeathState
+  , naaccr_code(placeOfDeathCountry) as placeOfDeathCountry
+  , naaccr_code(ruralurbanContinuum1993) as ruralurbanContinuum1993
+  , naaccr_code(ruralurbanContinuum2003) as ruralurbanContinuum2003
+  , naaccr_code(ruralurbanContinuum2013) as ruralurbanContinuum2013
+  , naaccr_code(siteIcdO1) as siteIcdO1
+  , naaccr_code(histologyIcdO1) as histologyIcdO1
+  , naaccr_code(behaviorIcdO1) as behaviorIcdO1
+  , naaccr_code(gradeIcdO1) as gradeIcdO1
+  , naaccr_code(icdO2ConversionFlag) as icdO2ConversionFlag
+  , naaccr_code(overRideSsNodespos) as overRideSsNodespos
+  , naaccr_code(overRideSsTnmN) as overRideSsTnmN
+  , naaccr_code(overRideSsTnmM) as overRideSsTnmM
+  , naaccr_code(overRideAcsnClassSeq) as overRideAcsnClassSeq
+  , naaccr_code(overRideHospseqDxconf) as overRideHospseqDxconf
+  , naaccr_code(overRideCocSiteType) as overRideCocSiteType
+  , naaccr_code(overRideHospseqSite) as overRideHospseqSite
+  , naaccr_code(overRideSiteTnmStggrp) as overRideSiteTnmStggrp
+  , naaccr_code(overRideAgeSiteMorph) as overRideAgeSiteMorph
+  , naaccr_code(overRideTnmStage) as overRideTnmStage
+  , naaccr_code(overRideTnmTis) as overRideTnmTis
+  , naaccr_code(overRideTnm3) as overRideTnm3
+  , naaccr_code(overRideSeqnoDxconf) as overRideSeqnoDxconf
+  , naaccr_code(overRideSiteLatSeqno) as overRideSiteLatSeqno
+  , naaccr_code(overRideSurgDxconf) as overRideSurgDxconf
+  , naaccr_code(overRideSiteType) as overRideSiteType
+  , naaccr_code(overRideHistology) as overRideHistology
+  , naaccr_code(overRideReportSource) as overRideReportSource
+  , naaccr_code(overRideIllDefineSite) as overRideIllDefineSite
+  , naaccr_code(overRideLeukLymphoma) as overRideLeukLymphoma
+  , naaccr_code(overRideSiteBehavior) as overRideSiteBehavior
+  , naaccr_code(overRideSiteEodDxDt) as overRideSiteEodDxDt
+  , naaccr_code(overRideSiteLatEod) as overRideSiteLatEod
+  , naaccr_code(overRideSiteLatMorph) as overRideSiteLatMorph
+  , naaccr_code(overRideNameSex) as overRideNameSex
+  , naaccr_date(dateCaseInitiated) as dateCaseInitiated
+  , naaccr_date(dateCaseCompleted) as dateCaseCompleted
+  , naaccr_date(dateCaseCompletedCoc) as dateCaseCompletedCoc
+  , naaccr_date(dateCaseLastChanged) as dateCaseLastChanged
+  , naaccr_date(dateCaseReportExported) as dateCaseReportExported
+  , naaccr_date(dateCaseReportReceived) as dateCaseReportReceived
+  , naaccr_date(dateCaseReportLoaded) as dateCaseReportLoaded
+  , naaccr_date(dateTumorRecordAvailbl) as dateTumorRecordAvailbl
+  , naaccr_code(icdO3ConversionFlag) as icdO3ConversionFlag
+  , naaccr_code(seerCodingSysCurrent) as seerCodingSysCurrent
+  , naaccr_code(seerCodingSysOriginal) as seerCodingSysOriginal
+  , naaccr_code(cocCodingSysCurrent) as cocCodingSysCurrent
+  , naaccr_code(cocCodingSysOriginal) as cocCodingSysOriginal
+  , naaccr_code(cocAccreditedFlag) as cocAccreditedFlag
+  , naaccr_code(rqrsNcdbSubmissionFlag) as rqrsNcdbSubmissionFlag
+  , naaccr_code(vendorName) as vendorName
+  , naaccr_code(seerTypeOfFollowUp) as seerTypeOfFollowUp
+  , naaccr_code(seerRecordNumber) as seerRecordNumber
+  , naaccr_code(overRideCs1) as overRideCs1
+  , naaccr_code(overRideCs2) as overRideCs2
+  , naaccr_code(overRideCs3) as overRideCs3
+  , naaccr_code(overRideCs4) as overRideCs4
+  , naaccr_code(overRideCs5) as overRideCs5
+  , naaccr_code(overRideCs6) as overRideCs6
+  , naaccr_code(overRideCs7) as overRideCs7
+  , naaccr_code(overRideCs8) as overRideCs8
+  , naaccr_code(overRideCs9) as overRideCs9
+  , naaccr_code(overRideCs10) as overRideCs10
+  , naaccr_code(overRideCs11) as overRideCs11
+  , naaccr_code(overRideCs12) as overRideCs12
+  , naaccr_code(overRideCs13) as overRideCs13
+  , naaccr_code(overRideCs14) as overRideCs14
+  , naaccr_code(overRideCs15) as overRideCs15
+  , naaccr_code(overRideCs16) as overRideCs16
+  , naaccr_code(overRideCs17) as overRideCs17
+  , naaccr_code(overRideCs18) as overRideCs18
+  , naaccr_code(overRideCs19) as overRideCs19
+  , naaccr_code(overRideCs20) as overRideCs20
+  , naaccr_date(dateOfLastContact) as dateOfLastContact
+  , naaccr_code(dateOfLastContactFlag) as dateOfLastContactFlag
+  , naaccr_date(dateOfDeathCanada) as dateOfDeathCanada
+  , naaccr_code(dateOfDeathCanadaFlag) as dateOfDeathCanadaFlag
+  , naaccr_code(vitalStatus) as vitalStatus
+  , naaccr_code(vitalStatusRecode) as vitalStatusRecode
+  , naaccr_code(cancerStatus) as cancerStatus
+  , naaccr_date(dateOfLastCancerStatus) as dateOfLastCancerStatus
+  , naaccr_code(dateOfLastCancerStatusFlag) as dateOfLastCancerStatusFlag
+  , naaccr_num(recordNumberRecode) as recordNumberRecode
+  , naaccr_code(qualityOfSurvival) as qualityOfSurvival
+  , naaccr_date(survDateActiveFollowup) as survDateActiveFollowup
+  , naaccr_code(survFlagActiveFollowup) as survFlagActiveFollowup
+  , naaccr_num(survMosActiveFollowup) as survMosActiveFollowup
+  , naaccr_date(survDatePresumedAlive) as survDatePresumedAlive
+  , naaccr_code(survFlagPresumedAlive) as survFlagPresumedAlive
+  , naaccr_num(survMosPresumedAlive) as survMosPresumedAlive
+  , naaccr_date(survDateDxRecode) as survDateDxRecode
+  , naaccr_code(followUpSource) as followUpSource
+  , naaccr_code(followUpSourceCentral) as followUpSourceCentral
+  , naaccr_code(nextFollowUpSource) as nextFollowUpSource
+  , naaccr_code(addrCurrentState) as addrCurrentState
+  , naaccr_code(followUpContactState) as followUpContactState
+  , naaccr_date(recurrenceDate1st) as recurrenceDate1st
+  , naaccr_code(recurrenceDate1stFlag) as recurrenceDate1stFlag
+  , naaccr_code(recurrenceType1st) as recurrenceType1st
+  , naaccr_code(causeOfDeath) as causeOfDeath
+  , naaccr_code(seerCauseSpecificCod) as seerCauseSpecificCod
+  , naaccr_code(seerOtherCod) as seerOtherCod
+  , naaccr_code(icdRevisionNumber) as icdRevisionNumber
+  , naaccr_code(autopsy) as autopsy
+  , naaccr_code(placeOfDeath) as placeOfDeath
+  , naaccr_code(sequenceNumberHospital) as sequenceNumberHospital
+  , naaccr_code(abstractedBy) as abstractedBy
+  , naaccr_date(dateOf1stContact) as dateOf1stContact
+  , naaccr_code(dateOf1stContactFlag) as dateOf1stContactFlag
+  , naaccr_date(dateOfInptAdm) as dateOfInptAdm
+  , naaccr_code(dateOfInptAdmFlag) as dateOfInptAdmFlag
+  , naaccr_date(dateOfInptDisch) as dateOfInptDisch
+  , naaccr_code(dateOfInptDischFlag) as dateOfInptDischFlag
+  , naaccr_code(inpatientStatus) as inpatientStatus
+  , naaccr_code(classOfCase) as classOfCase
+  , naaccr_code(primaryPayerAtDx) as primaryPayerAtDx
+  , naaccr_code(rxHospSurgApp2010) as rxHospSurgApp2010
+  , naaccr_code(rxHospSurgPrimSite) as rxHospSurgPrimSite
+  , naaccr_code(rxHospScopeRegLnSur) as rxHospScopeRegLnSur
+  , naaccr_code(rxHospSurgOthRegDis) as rxHospSurgOthRegDis
+  , naaccr_num(rxHospRegLnRemoved) as rxHospRegLnRemoved
+  , naaccr_code(rxHospRadiation) as rxHospRadiation
+  , naaccr_code(rxHospChemo) as rxHospChemo
+  , naaccr_code(rxHospHormone) as rxHospHormone
+  , naaccr_code(rxHospBrm) as rxHospBrm
+  , naaccr_code(rxHospOther) as rxHospOther
+  , naaccr_code(rxHospDxStgProc) as rxHospDxStgProc
+  , naaccr_code(rxHospSurgSite9802) as rxHospSurgSite9802
+  , naaccr_code(rxHospScopeReg9802) as rxHospScopeReg9802
+  , naaccr_code(rxHospSurgOth9802) as rxHospSurgOth9802
+  , naaccr_code(rxHospPalliativeProc) as rxHospPalliativeProc
+  , naaccr_code(recordType) as recordType
+  , naaccr_code(registryType) as registryType
+  , naaccr_code(registryId) as registryId
+  , naaccr_code(npiRegistryId) as npiRegistryId
+  , naaccr_code(naaccrRecordVersion) as naaccrRecordVersion
+  , naaccr_code(tumorRecordNumber) as tumorRecordNumber
+  , naaccr_date(dateRegionalLNDissection) as dateRegionalLNDissection
+  , naaccr_code(dateRegionalLNDissectionFlag) as dateRegionalLNDissectionFlag
+  , naaccr_code(tumorSizeClinical) as tumorSizeClinical
+  , naaccr_code(tumorSizePathologic) as tumorSizePathologic
+  , naaccr_code(tumorSizeSummary) as tumorSizeSummary
+  , naaccr_code(seerSummaryStage2000) as seerSummaryStage2000
+  , naaccr_code(seerSummaryStage1977) as seerSummaryStage1977
+  , naaccr_code(derivedSummaryStage2018) as derivedSummaryStage2018
+  , naaccr_code(summaryStage2018) as summaryStage2018
+  , naaccr_code(eodPrimaryTumor) as eodPrimaryTumor
+  , naaccr_code(eodRegionalNodes) as eodRegionalNodes
+  , naaccr_code(eodMets) as eodMets
+  , naaccr_num(eodTumorSize) as eodTumorSize
+  , naaccr_code(eodExtension) as eodExtension
+  , naaccr_code(eodExtensionProstPath) as eodExtensionProstPath
+  , naaccr_code(eodLymphNodeInvolv) as eodLymphNodeInvolv
+  , naaccr_num(regionalNodesPositive) as regionalNodesPositive
+  , naaccr_num(regionalNodesExamined) as regionalNodesExamined
+  , naaccr_date(dateSentinelLymphNodeBiopsy) as dateSentinelLymphNodeBiopsy
+  , naaccr_code(dateSentinelLymphNodeBiopsyFlag) as dateSentinelLymphNodeBiopsyFlag
+  , naaccr_code(sentinelLymphNodesExamined) as sentinelLymphNodesExamined
+  , naaccr_code(sentinelLymphNodesPositive) as sentinelLymphNodesPositive
+  , naaccr_code(eodOld2Digit) as eodOld2Digit
+  , naaccr_code(eodOld4Digit) as eodOld4Digit
+  , naaccr_code(codingSystemForEod) as codingSystemForEod
+  , naaccr_code(tnmPathT) as tnmPathT
+  , naaccr_code(tnmPathN) as tnmPathN
+  , naaccr_code(tnmPathM) as tnmPathM
+  , naaccr_code(tnmPathStageGroup) as tnmPathStageGroup
+  , naaccr_code(tnmPathDescriptor) as tnmPathDescriptor
+  , naaccr_code(tnmPathStagedBy) as tnmPathStagedBy
+  , naaccr_code(tnmClinT) as tnmClinT
+  , naaccr_code(tnmClinN) as tnmClinN
+  , naaccr_code(tnmClinM) as tnmClinM
+  , naaccr_code(tnmClinStageGroup) as tnmClinStageGroup
+  , naaccr_code(tnmClinDescriptor) as tnmClinDescriptor
+  , naaccr_code(tnmClinStagedBy) as tnmClinStagedBy
+  , naaccr_code(ajccId) as ajccId
+  , naaccr_code(ajccTnmClinTSuffix) as ajccTnmClinTSuffix
+  , naaccr_code(ajccTnmPathTSuffix) as ajccTnmPathTSuffix
+  , naaccr_code(ajccTnmPostTherapyTSuffix) as ajccTnmPostTherapyTSuffix
+  , naaccr_code(ajccTnmClinNSuffix) as ajccTnmClinNSuffix
+  , naaccr_code(ajccTnmPathNSuffix) as ajccTnmPathNSuffix
+  , naaccr_code(ajccTnmPostTherapyNSuffix) as ajccTnmPostTherapyNSuffix
+  , naaccr_code(tnmEditionNumber) as tnmEditionNumber
+  , naaccr_code(metsAtDxBone) as metsAtDxBone
+  , naaccr_code(metsAtDxBrain) as metsAtDxBrain
+  , naaccr_code(metsAtDxDistantLn) as metsAtDxDistantLn
+  , naaccr_code(metsAtDxLiver) as metsAtDxLiver
+  , naaccr_code(metsAtDxLung) as metsAtDxLung
+  , naaccr_code(metsAtDxOther) as metsAtDxOther
+  , naaccr_code(pediatricStage) as pediatricStage
+  , naaccr_code(pediatricStagingSystem) as pediatricStagingSystem
+  , naaccr_code(pediatricStagedBy) as pediatricStagedBy
+  , naaccr_code(tumorMarker1) as tumorMarker1
+  , naaccr_code(tumorMarker2) as tumorMarker2
+  , naaccr_code(tumorMarker3) as tumorMarker3
+  , naaccr_code(lymphVascularInvasion) as lymphVascularInvasion
+  , naaccr_num(csTumorSize) as csTumorSize
+  , naaccr_code(csExtension) as csExtension
+  , naaccr_code(csTumorSizeExtEval) as csTumorSizeExtEval
+  , naaccr_code(csLymphNodes) as csLymphNodes
+  , naaccr_code(csLymphNodesEval) as csLymphNodesEval
+  , naaccr_code(csMetsAtDx) as csMetsAtDx
+  , naaccr_code(csMetsAtDxBone) as csMetsAtDxBone
+  , naaccr_code(csMetsAtDxBrain) as csMetsAtDxBrain
+  , naaccr_code(csMetsAtDxLiver) as csMetsAtDxLiver
+  , naaccr_code(csMetsAtDxLung) as csMetsAtDxLung
+  , naaccr_code(csMetsEval) as csMetsEval
+  , naaccr_code(csSiteSpecificFactor7) as csSiteSpecificFactor7
+  , naaccr_code(csSiteSpecificFactor8) as csSiteSpecificFactor8
+  , naaccr_code(csSiteSpecificFactor9) as csSiteSpecificFactor9
+  , naaccr_code(csSiteSpecificFactor10) as csSiteSpecificFactor10
+  , naaccr_code(csSiteSpecificFactor11) as csSiteSpecificFactor11
+  , naaccr_code(csSiteSpecificFactor12) as csSiteSpecificFactor12
+  , naaccr_code(csSiteSpecificFactor13) as csSiteSpecificFactor13
+  , naaccr_code(csSiteSpecificFactor14) as csSiteSpecificFactor14
+  , naaccr_code(csSiteSpecificFactor15) as csSiteSpecificFactor15
+  , naaccr_code(csSiteSpecificFactor16) as csSiteSpecificFactor16
+  , naaccr_code(csSiteSpecificFactor17) as csSiteSpecificFactor17
+  , naaccr_code(csSiteSpecificFactor18) as csSiteSpecificFactor18
+  , naaccr_code(csSiteSpecificFactor19) as csSiteSpecificFactor19
+  , naaccr_code(csSiteSpecificFactor20) as csSiteSpecificFactor20
+  , naaccr_code(csSiteSpecificFactor21) as csSiteSpecificFactor21
+  , naaccr_code(csSiteSpecificFactor22) as csSiteSpecificFactor22
+  , naaccr_code(csSiteSpecificFactor23) as csSiteSpecificFactor23
+  , naaccr_code(csSiteSpecificFactor24) as csSiteSpecificFactor24
+  , naaccr_code(csSiteSpecificFactor25) as csSiteSpecificFactor25
+  , naaccr_code(csSiteSpecificFactor1) as csSiteSpecificFactor1
+  , naaccr_code(csSiteSpecificFactor2) as csSiteSpecificFactor2
+  , naaccr_code(csSiteSpecificFactor3) as csSiteSpecificFactor3
+  , naaccr_code(csSiteSpecificFactor4) as csSiteSpecificFactor4
+  , naaccr_code(csSiteSpecificFactor5) as csSiteSpecificFactor5
+  , naaccr_code(csSiteSpecificFactor6) as csSiteSpecificFactor6
+  , naaccr_code(csVersionInputOriginal) as csVersionInputOriginal
+  , naaccr_code(csVersionDerived) as csVersionDerived
+  , naaccr_code(csVersionInputCurrent) as csVersionInputCurrent
+  , naaccr_code(derivedAjcc6T) as derivedAjcc6T
+  , naaccr_code(derivedAjcc6TDescript) as derivedAjcc6TDescript
+  , naaccr_code(derivedAjcc6N) as derivedAjcc6N
+  , naaccr_code(derivedAjcc6NDescript) as derivedAjcc6NDescript
+  , naaccr_code(derivedAjcc6M) as derivedAjcc6M
+  , naaccr_code(derivedAjcc6MDescript) as derivedAjcc6MDescript
+  , naaccr_code(derivedAjcc6StageGrp) as derivedAjcc6StageGrp
+  , naaccr_code(derivedSs1977) as derivedSs1977
+  , naaccr_code(derivedSs2000) as derivedSs2000
+  , naaccr_code(derivedAjccFlag) as derivedAjccFlag
+  , naaccr_code(derivedSs1977Flag) as derivedSs1977Flag
+  , naaccr_code(derivedSs2000Flag) as derivedSs2000Flag
+  , naaccr_code(comorbidComplication1) as comorbidComplication1
+  , naaccr_code(comorbidComplication2) as comorbidComplication2
+  , naaccr_code(comorbidComplication3) as comorbidComplication3
+  , naaccr_code(comorbidComplication4) as comorbidComplication4
+  , naaccr_code(comorbidComplication5) as comorbidComplication5
+  , naaccr_code(comorbidComplication6) as comorbidComplication6
+  , naaccr_code(comorbidComplication7) as comorbidComplication7
+  , naaccr_code(comorbidComplication8) as comorbidComplication8
+  , naaccr_code(comorbidComplication9) as comorbidComplication9
+  , naaccr_code(comorbidComplication10) as comorbidComplication10
+  , naaccr_code(icdRevisionComorbid) as icdRevisionComorbid
+  , naaccr_code(derivedAjcc7T) as derivedAjcc7T
+  , naaccr_code(derivedAjcc7TDescript) as derivedAjcc7TDescript
+  , naaccr_code(derivedAjcc7N) as derivedAjcc7N
+  , naaccr_code(derivedAjcc7NDescript) as derivedAjcc7NDescript
+  , naaccr_code(derivedAjcc7M) as derivedAjcc7M
+  , naaccr_code(derivedAjcc7MDescript) as derivedAjcc7MDescript
+  , naaccr_code(derivedAjcc7StageGrp) as derivedAjcc7StageGrp
+  , naaccr_code(derivedPrerx7T) as derivedPrerx7T
+  , naaccr_code(derivedPrerx7TDescrip) as derivedPrerx7TDescrip
+  , naaccr_code(derivedPrerx7N) as derivedPrerx7N
+  , naaccr_code(derivedPrerx7NDescrip) as derivedPrerx7NDescrip
+  , naaccr_code(derivedPrerx7M) as derivedPrerx7M
+  , naaccr_code(derivedPrerx7MDescrip) as derivedPrerx7MDescrip
+  , naaccr_code(derivedPrerx7StageGrp) as derivedPrerx7StageGrp
+  , naaccr_code(derivedPostrx7T) as derivedPostrx7T
+  , naaccr_code(derivedPostrx7N) as derivedPostrx7N
+  , naaccr_code(derivedPostrx7M) as derivedPostrx7M
+  , naaccr_code(derivedPostrx7StgeGrp) as derivedPostrx7StgeGrp
+  , naaccr_code(derivedNeoadjuvRxFlag) as derivedNeoadjuvRxFlag
+  , naaccr_code(derivedSeerPathStgGrp) as derivedSeerPathStgGrp
+  , naaccr_code(derivedSeerClinStgGrp) as derivedSeerClinStgGrp
+  , naaccr_code(derivedSeerCmbStgGrp) as derivedSeerCmbStgGrp
+  , naaccr_code(derivedSeerCombinedT) as derivedSeerCombinedT
+  , naaccr_code(derivedSeerCombinedN) as derivedSeerCombinedN
+  , naaccr_code(derivedSeerCombinedM) as derivedSeerCombinedM
+  , naaccr_code(derivedSeerCmbTSrc) as derivedSeerCmbTSrc
+  , naaccr_code(derivedSeerCmbNSrc) as derivedSeerCmbNSrc
+  , naaccr_code(derivedSeerCmbMSrc) as derivedSeerCmbMSrc
+  , naaccr_code(npcrDerivedClinStgGrp) as npcrDerivedClinStgGrp
+  , naaccr_code(npcrDerivedPathStgGrp) as npcrDerivedPathStgGrp
+  , naaccr_code(seerSiteSpecificFact1) as seerSiteSpecificFact1
+  , naaccr_code(seerSiteSpecificFact2) as seerSiteSpecificFact2
+  , naaccr_code(seerSiteSpecificFact3) as seerSiteSpecificFact3
+  , naaccr_code(seerSiteSpecificFact4) as seerSiteSpecificFact4
+  , naaccr_code(seerSiteSpecificFact5) as seerSiteSpecificFact5
+  , naaccr_code(seerSiteSpecificFact6) as seerSiteSpecificFact6
+  , naaccr_code(secondaryDiagnosis1) as secondaryDiagnosis1
+  , naaccr_code(secondaryDiagnosis2) as secondaryDiagnosis2
+  , naaccr_code(secondaryDiagnosis3) as secondaryDiagnosis3
+  , naaccr_code(secondaryDiagnosis4) as secondaryDiagnosis4
+  , naaccr_code(secondaryDiagnosis5) as secondaryDiagnosis5
+  , naaccr_code(secondaryDiagnosis6) as secondaryDiagnosis6
+  , naaccr_code(secondaryDiagnosis7) as secondaryDiagnosis7
+  , naaccr_code(secondaryDiagnosis8) as secondaryDiagnosis8
+  , naaccr_code(secondaryDiagnosis9) as secondaryDiagnosis9
+  , naaccr_code(secondaryDiagnosis10) as secondaryDiagnosis10
+  , naaccr_code(schemaId) as schemaId
+  , naaccr_code(chromosome1pLossHeterozygosity) as chromosome1pLossHeterozygosity
+  , naaccr_code(chromosome19qLossHeterozygosity) as chromosome19qLossHeterozygosity
+  , naaccr_code(adenoidCysticBasaloidPattern) as adenoidCysticBasaloidPattern
+  , naaccr_code(adenopathy) as adenopathy
+  , naaccr_num(afpPostOrchiectomyLabValue) as afpPostOrchiectomyLabValue
+  , naaccr_code(afpPostOrchiectomyRange) as afpPostOrchiectomyRange
+  , naaccr_num(afpPreOrchiectomyLabValue) as afpPreOrchiectomyLabValue
+  , naaccr_code(afpPreOrchiectomyRange) as afpPreOrchiectomyRange
+  , naaccr_code(afpPretreatmentInterpretation) as afpPretreatmentInterpretation
+  , naaccr_num(afpPretreatmentLabValue) as afpPretreatmentLabValue
+  , naaccr_code(anemia) as anemia
+  , naaccr_code(bSymptoms) as bSymptoms
+  , naaccr_code(bilirubinPretxTotalLabValue) as bilirubinPretxTotalLabValue
+  , naaccr_code(bilirubinPretxUnitOfMeasure) as bilirubinPretxUnitOfMeasure
+  , naaccr_code(boneInvasion) as boneInvasion
+  , naaccr_code(brainMolecularMarkers) as brainMolecularMarkers
+  , naaccr_code(breslowTumorThickness) as breslowTumorThickness
+  , naaccr_code(ca125PretreatmentInterpretation) as ca125PretreatmentInterpretation
+  , naaccr_code(ceaPretreatmentInterpretation) as ceaPretreatmentInterpretation
+  , naaccr_num(ceaPretreatmentLabValue) as ceaPretreatmentLabValue
+  , naaccr_code(chromosome3Status) as chromosome3Status
+  , naaccr_code(chromosome8qStatus) as chromosome8qStatus
+  , naaccr_code(circumferentialResectionMargin) as circumferentialResectionMargin
+  , naaccr_code(creatininePretreatmentLabValue) as creatininePretreatmentLabValue
+  , naaccr_code(creatininePretxUnitOfMeasure) as creatininePretxUnitOfMeasure
+  , naaccr_code(estrogenReceptorPercntPosOrRange) as estrogenReceptorPercntPosOrRange
+  , naaccr_code(estrogenReceptorSummary) as estrogenReceptorSummary
+  , naaccr_code(estrogenReceptorTotalAllredScore) as estrogenReceptorTotalAllredScore
+  , naaccr_code(esophagusAndEgjTumorEpicenter) as esophagusAndEgjTumorEpicenter
+  , naaccr_code(extranodalExtensionClin) as extranodalExtensionClin
+  , naaccr_code(extranodalExtensionHeadNeckClin) as extranodalExtensionHeadNeckClin
+  , naaccr_code(extranodalExtensionHeadNeckPath) as extranodalExtensionHeadNeckPath
+  , naaccr_code(extranodalExtensionPath) as extranodalExtensionPath
+  , naaccr_code(extravascularMatrixPatterns) as extravascularMatrixPatterns
+  , naaccr_code(fibrosisScore) as fibrosisScore
+  , naaccr_code(figoStage) as figoStage
+  , naaccr_code(gestationalTrophoblasticPxIndex) as gestationalTrophoblasticPxIndex
+  , naaccr_code(gleasonPatternsClinical) as gleasonPatternsClinical
+  , naaccr_code(gleasonPatternsPathological) as gleasonPatternsPathological
+  , naaccr_code(gleasonScoreClinical) as gleasonScoreClinical
+  , naaccr_code(gleasonScorePathological) as gleasonScorePathological
+  , naaccr_code(gleasonTertiaryPattern) as gleasonTertiaryPattern
+  , naaccr_code(gradeClinical) as gradeClinical
+  , naaccr_code(gradePathological) as gradePathological
+  , naaccr_code(gradePostTherapy) as gradePostTherapy
+  , naaccr_num(hcgPostOrchiectomyLabValue) as hcgPostOrchiectomyLabValue
+  , naaccr_code(hcgPostOrchiectomyRange) as hcgPostOrchiectomyRange
+  , naaccr_num(hcgPreOrchiectomyLabValue) as hcgPreOrchiectomyLabValue
+  , naaccr_code(hcgPreOrchiectomyRange) as hcgPreOrchiectomyRange
+  , naaccr_code(her2IhcSummary) as her2IhcSummary
+  , naaccr_code(her2IshDualProbeCopyNumber) as her2IshDualProbeCopyNumber
+  , naaccr_code(her2IshDualProbeRatio) as her2IshDualProbeRatio
+  , naaccr_code(her2IshSingleProbeCopyNumber) as her2IshSingleProbeCopyNumber
+  , naaccr_code(her2IshSummary) as her2IshSummary
+  , naaccr_code(her2OverallSummary) as her2OverallSummary
+  , naaccr_code(heritableTrait) as heritableTrait
+  , naaccr_code(highRiskCytogenetics) as highRiskCytogenetics
+  , naaccr_code(highRiskHistologicFeatures) as highRiskHistologicFeatures
+  , naaccr_code(hivStatus) as hivStatus
+  , naaccr_code(iNRProthrombinTime) as iNRProthrombinTime
+  , naaccr_code(ipsilateralAdrenalGlandInvolve) as ipsilateralAdrenalGlandInvolve
+  , naaccr_code(jak2) as jak2
+  , naaccr_code(ki67) as ki67
+  , naaccr_code(invasionBeyondCapsule) as invasionBeyondCapsule
+  , naaccr_code(kitGeneImmunohistochemistry) as kitGeneImmunohistochemistry
+  , naaccr_code(kras) as kras
+  , naaccr_code(ldhPostOrchiectomyRange) as ldhPostOrchiectomyRange
+  , naaccr_code(ldhPreOrchiectomyRange) as ldhPreOrchiectomyRange
+  , naaccr_code(ldhPretreatmentLevel) as ldhPretreatmentLevel
+  , naaccr_code(ldhUpperLimitsOfNormal) as ldhUpperLimitsOfNormal
+  , naaccr_code(lnAssessMethodFemoralInguinal) as lnAssessMethodFemoralInguinal
+  , naaccr_code(lnAssessMethodParaaortic) as lnAssessMethodParaaortic
+  , naaccr_code(lnAssessMethodPelvic) as lnAssessMethodPelvic
+  , naaccr_code(lnDistantAssessMethod) as lnDistantAssessMethod
+  , naaccr_code(lnDistantMediastinalScalene) as lnDistantMediastinalScalene
+  , naaccr_code(lnHeadAndNeckLevels1To3) as lnHeadAndNeckLevels1To3
+  , naaccr_code(lnHeadAndNeckLevels4To5) as lnHeadAndNeckLevels4To5
+  , naaccr_code(lnHeadAndNeckLevels6To7) as lnHeadAndNeckLevels6To7
+  , naaccr_code(lnHeadAndNeckOther) as lnHeadAndNeckOther
+  , naaccr_code(lnIsolatedTumorCells) as lnIsolatedTumorCells
+  , naaccr_code(lnLaterality) as lnLaterality
+  , naaccr_code(lnPositiveAxillaryLevel1To2) as lnPositiveAxillaryLevel1To2
+  , naaccr_code(lnSize) as lnSize
+  , naaccr_code(lnStatusFemorInguinParaaortPelv) as lnStatusFemorInguinParaaortPelv
+  , naaccr_code(lymphocytosis) as lymphocytosis
+  , naaccr_code(majorVeinInvolvement) as majorVeinInvolvement
+  , naaccr_code(measuredBasalDiameter) as measuredBasalDiameter
+  , naaccr_code(measuredThickness) as measuredThickness
+  , naaccr_code(methylationOfO6MGMT) as methylationOfO6MGMT
+  , naaccr_code(microsatelliteInstability) as microsatelliteInstability
+  , naaccr_code(microvascularDensity) as microvascularDensity
+  , naaccr_code(mitoticCountUvealMelanoma) as mitoticCountUvealMelanoma
+  , naaccr_code(mitoticRateMelanoma) as mitoticRateMelanoma
+  , naaccr_code(multigeneSignatureMethod) as multigeneSignatureMethod
+  , naaccr_code(multigeneSignatureResults) as multigeneSignatureResults
+  , naaccr_code(nccnInternationalPrognosticIndex) as nccnInternationalPrognosticIndex
+  , naaccr_code(numberOfCoresExamined) as numberOfCoresExamined
+  , naaccr_code(numberOfCoresPositive) as numberOfCoresPositive
+  , naaccr_code(numberOfExaminedParaAorticNodes) as numberOfExaminedParaAorticNodes
+  , naaccr_code(numberOfExaminedPelvicNodes) as numberOfExaminedPelvicNodes
+  , naaccr_code(numberOfPositiveParaAorticNodes) as numberOfPositiveParaAorticNodes
+  , naaccr_code(numberOfPositivePelvicNodes) as numberOfPositivePelvicNodes
+  , naaccr_code(oncotypeDxRecurrenceScoreDcis) as oncotypeDxRecurrenceScoreDcis
+  , naaccr_code(oncotypeDxRecurrenceScoreInvasiv) as oncotypeDxRecurrenceScoreInvasiv
+  , naaccr_code(oncotypeDxRiskLevelDcis) as oncotypeDxRiskLevelDcis
+  , naaccr_code(oncotypeDxRiskLevelInvasive) as oncotypeDxRiskLevelInvasive
+  , naaccr_code(organomegaly) as organomegaly
+  , naaccr_code(percentNecrosisPostNeoadjuvant) as percentNecrosisPostNeoadjuvant
+  , naaccr_code(perineuralInvasion) as perineuralInvasion
+  , naaccr_code(peripheralBloodInvolvement) as peripheralBloodInvolvement
+  , naaccr_code(peritonealCytology) as peritonealCytology
+  , naaccr_code(pleuralEffusion) as pleuralEffusion
+  , naaccr_code(progesteroneRecepPrcntPosOrRange) as progesteroneRecepPrcntPosOrRange
+  , naaccr_code(progesteroneRecepSummary) as progesteroneRecepSummary
+  , naaccr_code(progesteroneRecepTotalAllredScor) as progesteroneRecepTotalAllredScor
+  , naaccr_code(primarySclerosingCholangitis) as primarySclerosingCholangitis
+  , naaccr_code(profoundImmuneSuppression) as profoundImmuneSuppression
+  , naaccr_code(prostatePathologicalExtension) as prostatePathologicalExtension
+  , naaccr_code(psaLabValue) as psaLabValue
+  , naaccr_code(residualTumVolPostCytoreduction) as residualTumVolPostCytoreduction
+  , naaccr_code(responseToNeoadjuvantTherapy) as responseToNeoadjuvantTherapy
+  , naaccr_code(sCategoryClinical) as sCategoryClinical
+  , naaccr_code(sCategoryPathological) as sCategoryPathological
+  , naaccr_code(sarcomatoidFeatures) as sarcomatoidFeatures
+  , naaccr_code(schemaDiscriminator1) as schemaDiscriminator1
+  , naaccr_code(schemaDiscriminator2) as schemaDiscriminator2
+  , naaccr_code(schemaDiscriminator3) as schemaDiscriminator3
+  , naaccr_code(separateTumorNodules) as separateTumorNodules
+  , naaccr_code(serumAlbuminPretreatmentLevel) as serumAlbuminPretreatmentLevel
+  , naaccr_code(serumBeta2MicroglobulinPretxLvl) as serumBeta2MicroglobulinPretxLvl
+  , naaccr_num(ldhPretreatmentLabValue) as ldhPretreatmentLabValue
+  , naaccr_code(thrombocytopenia) as thrombocytopenia
+  , naaccr_code(tumorDeposits) as tumorDeposits
+  , naaccr_code(tumorGrowthPattern) as tumorGrowthPattern
+  , naaccr_code(ulceration) as ulceration
+  , naaccr_code(visceralParietalPleuralInvasion) as visceralParietalPleuralInvasion
+  , naaccr_date(rxDateSurgery) as rxDateSurgery
+  , naaccr_code(rxDateSurgeryFlag) as rxDateSurgeryFlag
+  , naaccr_date(rxDateRadiation) as rxDateRadiation
+  , naaccr_code(rxDateRadiationFlag) as rxDateRadiationFlag
+  , naaccr_date(rxDateChemo) as rxDateChemo
+  , naaccr_code(rxDateChemoFlag) as rxDateChemoFlag
+  , naaccr_date(rxDateHormone) as rxDateHormone
+  , naaccr_code(rxDateHormoneFlag) as rxDateHormoneFlag
+  , naaccr_date(rxDateBrm) as rxDateBrm
+  , naaccr_code(rxDateBrmFlag) as rxDateBrmFlag
+  , naaccr_date(rxDateOther) as rxDateOther
+  , naaccr_code(rxDateOtherFlag) as rxDateOtherFlag
+  , naaccr_date(dateInitialRxSeer) as dateInitialRxSeer
+  , naaccr_code(dateInitialRxSeerFlag) as dateInitialRxSeerFlag
+  , naaccr_date(date1stCrsRxCoc) as date1stCrsRxCoc
+  , naaccr_code(date1stCrsRxCocFlag) as date1stCrsRxCocFlag
+  , naaccr_date(rxDateDxStgProc) as rxDateDxStgProc
+  , naaccr_code(rxDateDxStgProcFlag) as rxDateDxStgProcFlag
+  , naaccr_code(rxSummTreatmentStatus) as rxSummTreatmentStatus
+  , naaccr_code(rxSummSurgPrimSite) as rxSummSurgPrimSite
+  , naaccr_code(rxSummScopeRegLnSur) as rxSummScopeRegLnSur
+  , naaccr_code(rxSummSurgOthRegDis) as rxSummSurgOthRegDis
+  , naaccr_num(rxSummRegLnExamined) as rxSummRegLnExamined
+  , naaccr_code(rxSummSurgicalApproch) as rxSummSurgicalApproch
+  , naaccr_code(rxSummSurgicalMargins) as rxSummSurgicalMargins
+  , naaccr_code(rxSummReconstruct1st) as rxSummReconstruct1st
+  , naaccr_code(reasonForNoSurgery) as reasonForNoSurgery
+  , naaccr_code(rxSummDxStgProc) as rxSummDxStgProc
+  , naaccr_code(rxSummRadiation) as rxSummRadiation
+  , naaccr_code(rxSummRadToCns) as rxSummRadToCns
+  , naaccr_code(rxSummSurgRadSeq) as rxSummSurgRadSeq
+  , naaccr_code(rxSummChemo) as rxSummChemo
+  , naaccr_code(rxSummHormone) as rxSummHormone
+  , naaccr_code(rxSummBrm) as rxSummBrm
+  , naaccr_code(rxSummOther) as rxSummOther
+  , naaccr_code(reasonForNoRadiation) as reasonForNoRadiation
+  , naaccr_code(rxCodingSystemCurrent) as rxCodingSystemCurrent
+  , naaccr_num(phase1DosePerFraction) as phase1DosePerFraction
+  , naaccr_code(phase1RadiationExternalBeamTech) as phase1RadiationExternalBeamTech
+  , naaccr_num(phase1NumberOfFractions) as phase1NumberOfFractions
+  , naaccr_code(phase1RadiationPrimaryTxVolume) as phase1RadiationPrimaryTxVolume
+  , naaccr_code(phase1RadiationToDrainingLN) as phase1RadiationToDrainingLN
+  , naaccr_code(phase1RadiationTreatmentModality) as phase1RadiationTreatmentModality
+  , naaccr_num(phase1TotalDose) as phase1TotalDose
+  , naaccr_num(radRegionalDoseCgy) as radRegionalDoseCgy
+  , naaccr_num(phase2DosePerFraction) as phase2DosePerFraction
+  , naaccr_code(phase2RadiationExternalBeamTech) as phase2RadiationExternalBeamTech
+  , naaccr_num(phase2NumberOfFractions) as phase2NumberOfFractions
+  , naaccr_code(phase2RadiationPrimaryTxVolume) as phase2RadiationPrimaryTxVolume
+  , naaccr_code(phase2RadiationToDrainingLN) as phase2RadiationToDrainingLN
+  , naaccr_code(phase2RadiationTreatmentModality) as phase2RadiationTreatmentModality
+  , naaccr_num(phase2TotalDose) as phase2TotalDose
+  , naaccr_num(radNoOfTreatmentVol) as radNoOfTreatmentVol
+  , naaccr_num(phase3DosePerFraction) as phase3DosePerFraction
+  , naaccr_code(phase3RadiationExternalBeamTech) as phase3RadiationExternalBeamTech
+  , naaccr_num(phase3NumberOfFractions) as phase3NumberOfFractions
+  , naaccr_code(phase3RadiationPrimaryTxVolume) as phase3RadiationPrimaryTxVolume
+  , naaccr_code(phase3RadiationToDrainingLN) as phase3RadiationToDrainingLN
+  , naaccr_code(phase3RadiationTreatmentModality) as phase3RadiationTreatmentModality
+  , naaccr_num(phase3TotalDose) as phase3TotalDose
+  , naaccr_code(radiationTxDiscontinuedEarly) as radiationTxDiscontinuedEarly
+  , naaccr_num(numberPhasesOfRadTxToVolume) as numberPhasesOfRadTxToVolume
+  , naaccr_num(totalDose) as totalDose
+  , naaccr_code(radTreatmentVolume) as radTreatmentVolume
+  , naaccr_code(radLocationOfRx) as radLocationOfRx
+  , naaccr_code(radRegionalRxModality) as radRegionalRxModality
+  , naaccr_code(rxSummSystemicSurSeq) as rxSummSystemicSurSeq
+  , naaccr_code(rxSummSurgeryType) as rxSummSurgeryType
+  , naaccr_code(rxSummSurgSite9802) as rxSummSurgSite9802
+  , naaccr_code(rxSummScopeReg9802) as rxSummScopeReg9802
+  , naaccr_code(rxSummSurgOth9802) as rxSummSurgOth9802
+  , naaccr_date(rxDateMostDefinSurg) as rxDateMostDefinSurg
+  , naaccr_code(rxDateMostDefinSurgFlag) as rxDateMostDefinSurgFlag
+  , naaccr_date(rxDateSurgicalDisch) as rxDateSurgicalDisch
+  , naaccr_code(rxDateSurgicalDischFlag) as rxDateSurgicalDischFlag
+  , naaccr_code(readmSameHosp30Days) as readmSameHosp30Days
+  , naaccr_code(radBoostRxModality) as radBoostRxModality
+  , naaccr_num(radBoostDoseCgy) as radBoostDoseCgy
+  , naaccr_date(rxDateRadiationEnded) as rxDateRadiationEnded
+  , naaccr_code(rxDateRadiationEndedFlag) as rxDateRadiationEndedFlag
+  , naaccr_date(rxDateSystemic) as rxDateSystemic
+  , naaccr_code(rxDateSystemicFlag) as rxDateSystemicFlag
+  , naaccr_code(rxSummTransplntEndocr) as rxSummTransplntEndocr
+  , naaccr_code(rxSummPalliativeProc) as rxSummPalliativeProc
+  , naaccr_date(subsqRx2ndCourseDate) as subsqRx2ndCourseDate
+  , naaccr_code(subsqRx2ndcrsDateFlag) as subsqRx2ndcrsDateFlag
+  , naaccr_code(subsqRx2ndCourseSurg) as subsqRx2ndCourseSurg
+  , naaccr_code(subsqRx2ndCourseRad) as subsqRx2ndCourseRad
+  , naaccr_code(subsqRx2ndCourseChemo) as subsqRx2ndCourseChemo
+  , naaccr_code(subsqRx2ndCourseHorm) as subsqRx2ndCourseHorm
+  , naaccr_code(subsqRx2ndCourseBrm) as subsqRx2ndCourseBrm
+  , naaccr_code(subsqRx2ndCourseOth) as subsqRx2ndCourseOth
+  , naaccr_code(subsqRx2ndScopeLnSu) as subsqRx2ndScopeLnSu
+  , naaccr_code(subsqRx2ndSurgOth) as subsqRx2ndSurgOth
+  , naaccr_code(subsqRx2ndRegLnRem) as subsqRx2ndRegLnRem
+  , naaccr_date(subsqRx3rdCourseDate) as subsqRx3rdCourseDate
+  , naaccr_code(subsqRx3rdcrsDateFlag) as subsqRx3rdcrsDateFlag
+  , naaccr_code(subsqRx3rdCourseSurg) as subsqRx3rdCourseSurg
+  , naaccr_code(subsqRx3rdCourseRad) as subsqRx3rdCourseRad
+  , naaccr_code(subsqRx3rdCourseChemo) as subsqRx3rdCourseChemo
+  , naaccr_code(subsqRx3rdCourseHorm) as subsqRx3rdCourseHorm
+  , naaccr_code(subsqRx3rdCourseBrm) as subsqRx3rdCourseBrm
+  , naaccr_code(subsqRx3rdCourseOth) as subsqRx3rdCourseOth
+  , naaccr_code(subsqRx3rdScopeLnSu) as subsqRx3rdScopeLnSu
+  , naaccr_code(subsqRx3rdSurgOth) as subsqRx3rdSurgOth
+  , naaccr_code(subsqRx3rdRegLnRem) as subsqRx3rdRegLnRem
+  , naaccr_date(subsqRx4thCourseDate) as subsqRx4thCourseDate
+  , naaccr_code(subsqRx4thcrsDateFlag) as subsqRx4thcrsDateFlag
+  , naaccr_code(subsqRx4thCourseSurg) as subsqRx4thCourseSurg
+  , naaccr_code(subsqRx4thCourseRad) as subsqRx4thCourseRad
+  , naaccr_code(subsqRx4thCourseChemo) as subsqRx4thCourseChemo
+  , naaccr_code(subsqRx4thCourseHorm) as subsqRx4thCourseHorm
+  , naaccr_code(subsqRx4thCourseBrm) as subsqRx4thCourseBrm
+  , naaccr_code(subsqRx4thCourseOth) as subsqRx4thCourseOth
+  , naaccr_code(subsqRx4thScopeLnSu) as subsqRx4thScopeLnSu
+  , naaccr_code(subsqRx4thSurgOth) as subsqRx4thSurgOth
+  , naaccr_code(subsqRx4thRegLnRem) as subsqRx4thRegLnRem
+  , naaccr_code(subsqRxReconstructDel) as subsqRxReconstructDel
+  , naaccr_date(pathDateSpecCollect1) as pathDateSpecCollect1
+  , naaccr_date(pathDateSpecCollect2) as pathDateSpecCollect2
+  , naaccr_date(pathDateSpecCollect3) as pathDateSpecCollect3
+  , naaccr_date(pathDateSpecCollect4) as pathDateSpecCollect4
+  , naaccr_date(pathDateSpecCollect5) as pathDateSpecCollect5
+  , naaccr_code(pathReportType1) as pathReportType1
+  , naaccr_code(pathReportType2) as pathReportType2
+  , naaccr_code(pathReportType3) as pathReportType3
+  , naaccr_code(pathReportType4) as pathReportType4
+  , naaccr_code(pathReportType5) as pathReportType5
         from naaccr_fields_raw;
 
 
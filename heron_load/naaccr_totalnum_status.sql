@@ -0,0 +1,21 @@
+/** naaccr_totalnum_status -- which facts and ontology build c_totalnum was computed from
+
+NAACCR_TotalNum is complete when there is a row for the current
+NAACCR_Facts and NAACCR_Ontology1 task_ids.
+*/
+
+select task_id from naaccr_observations where 'dep' = 'NAACCR_Facts';
+select c_totalnum from naaccr_ontology where 'dep' = 'NAACCR_Ontology1';
+
+whenever sqlerror continue;
+create table naaccr_totalnum_status (
+  task_id varchar2(1024) not null,
+  facts_task_id varchar2(1024) not null,
+  ontology_task_id varchar2(1024) not null,
+  patient_qty int,
+  completed date not null
+);
+whenever sqlerror exit;
+
+insert into naaccr_totalnum_status (task_id, facts_task_id, ontology_task_id, patient_qty, completed)
+values (:task_id, :facts_task_id, :ontology_task_id, :patient_qty, sysdate);
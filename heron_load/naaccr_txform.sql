@@ -105,7 +105,7 @@ left join tumor_item_type ty
 
 create or replace view tumor_item_value as
 select raw.*
-     , ty.valtype_cd, ty.naaccrNum
+     , ty.valtype_cd, ty.naaccrNum, ty.sectionId, ty.length as field_length
      , case when ty.valtype_cd in ('Ni', 'Ti')
        then true
        else false
@@ -115,14 +115,13 @@ select raw.*
        end as code_value
      , case
        when ty.valtype_cd in ('N', 'Ni')
-       and regexp_like(value, '^[0-9].*')
-       then cast(value as float)
+       and substr(value, 1, 1) between '0' and '9'
+       then naaccr_num(value)
        end as numeric_value
      , case
        when ty.valtype_cd = 'D'
-       -- TODO: length 14 datetime
-       then parseDateEx(substring(concat(value, '0101'), 1, 8),
-                    'yyyyMMdd')
+       -- partial dates (yyyy, yyyymm) are the first of the year, month
+       then naaccr_date(substr(value || '0101', 1, 8))
        end as date_value
      , case when ty.valtype_cd in ('T', 'Ti')
        then value
@@ -151,17 +150,10 @@ and concept_cd not like 'NAACCR|31%';
  */
 
 create or replace view tumor_reg_facts as
-with obs_w_section as (
-  select tiv.*, rl.length as field_length, s.sectionId
-  from tumor_item_value tiv
-  join record_layout rl on rl.`naaccr-item-num` = tiv.naaccrNum
-  join section s on s.section = rl.section
-),
-
-obs_detail as (
+with obs_detail as (
   select case when valtype_cd = '@'
-         then concat('NAACCR|', naaccrNum, ':', code_value)
-         else concat('NAACCR|', naaccrNum, ':')
+         then 'NAACCR|' || naaccrNum || ':' || code_value
+         else 'NAACCR|' || naaccrNum || ':'
          end as concept_cd
        , case
          -- Use Date of Last Contact for Follow-up/Recurrence/Death
@@ -173,11 +165,10 @@ obs_detail as (
          -- POSTPONED: Ti de-identification
          when valtype_cd = 'T' then text_value
          when valtype_cd = 'D' then
-           to_char(date_value,
-                       case
-                       when field_length = 14 then 'yyyy-MM-dd HH:mm:ss'
-                       else 'yyyy-MM-dd'
-                       end)
+           case
+           when field_length = 14 then date_value || ' 00:00:00'
+           else date_value
+           end
          when valtype_cd = 'N' then 'E'  -- Equal for lab-style comparisons
          end as tval_char
        , case
@@ -188,10 +179,11 @@ obs_detail as (
        , coalesce(dateCaseLastChanged, dateOfLastContact, dateCaseCompleted, dateOfDiagnosis)
          as update_date
        , obs.*
-  from obs_w_section obs
+  from tumor_item_value obs
 )
 
-select recordId         -- becomes encounter_num via patient_mapping
+select tumor_key        -- becomes encounter_num via naaccr_tumors
+     , recordId         -- readable tumor id (encounter_ide)
      , patientIdNumber  -- pending patient_num via encounter_mapping
      , naaccrId         -- for QA
      , naaccrNum
@@ -0,0 +1,143 @@
+'''csschema_index -- select Collaborative Staging schema by site, histology
+
+csterms.py renders the schema selection notes as a SQL CASE expression
+with one clause per schema (csschema.sql), tested in turn for each
+tumor. The same constraints, saved as JSON by `csterms.py index`, make
+an index: candidate schemas by primary site in a hash table, then
+histology checks by bisection over merged intervals.
+
+For example, with a schema that applies by site and one that applies
+by histology, except at some sites::
+
+    >>> ix = SchemaIndex([
+    ...     Rule('Breast', ['C500', 'C501', 'C509'], [], [], []),
+    ...     Rule('HemeRetic', [], [],
+    ...          [([('9590', '9699'), ('9738', None)], [('C441', None), ('C695', 'C696')])], []),
+    ...     Rule('MycosisFungoides', [], [], [], [('9700', []), ('9701', [])])])
+    >>> ix.schema('C501', '8500'), ix.schema('C501', '9650')
+    ('Breast', 'Breast')
+    >>> ix.schema('C180', '9650'), ix.schema('C695', '9650'), ix.schema('C180', '9701')
+    ('HemeRetic', None, 'MycosisFungoides')
+
+As in SQL, a constraint on a missing (NULL) site or histology is not met::
+
+    >>> ix.schema(None, '9700'), ix.schema(None, '9650'), ix.schema('C180', None)
+    ('MycosisFungoides', None, None)
+
+The index round-trips through JSON::
+
+    >>> SchemaIndex.loads(ix.dumps()).schema('C180', '9738')
+    'HemeRetic'
+'''
+
+from bisect import bisect_right
+from heapq import merge
+from typing import Dict, Iterable, List, NamedTuple, Optional as Opt, Tuple
+import json
+
+Range = Tuple[str, Opt[str]]
+
+
+class Rule(NamedTuple('Rule', [('csschemaid', str),
+                               ('sites', List[str]),
+                               ('site_excl', List[str]),
+                               ('morph', List[Tuple[List[Range], List[Range]]]),
+                               ('hist', List[Tuple[str, List[Range]]])])):
+    '''Constraints from one schema's notes; see csterms.Site.schema_constraint.
+
+    sites: primary site must be one of these (if any)
+    site_excl: ... and not one of these
+    morph: some (histology ranges, excluded site ranges) must match (if any)
+    hist: some (histology, excluded site ranges) must match (if any)
+    '''
+    @classmethod
+    def from_json(cls, obj: Dict[str, object]) -> 'Rule':
+        def rngs(pairs: object) -> List[Range]:
+            return [(lo, hi) for lo, hi in pairs]  # type: ignore
+        return cls(obj['csschemaid'],  # type: ignore
+                   obj['sites'], obj['site_excl'],  # type: ignore
+                   [(rngs(hs), rngs(ss)) for hs, ss in obj['morph']],  # type: ignore
+                   [(h, rngs(ss)) for h, ss in obj['hist']])  # type: ignore
+
+
+class Intervals(object):
+    '''Union of closed code ranges, as sorted disjoint intervals.
+
+    >>> iv = Intervals([('9590', '9699'), ('9650', '9710'), ('9738', None)])
+    >>> iv.spans
+    [('9590', '9710'), ('9738', '9738')]
+    >>> [code in iv for code in ['9589', '9590', '9700', '9711', '9738']]
+    [False, True, True, False, True]
+    '''
+    def __init__(self, ranges: Iterable[Range]) -> None:
+        spans = []  # type: List[Tuple[str, str]]
+        for lo, hi in sorted((lo, hi or lo) for lo, hi in ranges):
+            if spans and lo <= spans[-1][1]:
+                spans[-1] = (spans[-1][0], max(hi, spans[-1][1]))
+            else:
+                spans.append((lo, hi))
+        self.spans = spans
+        self._los = [lo for lo, _ in spans]
+
+    def __contains__(self, code: str) -> bool:
+        ix = bisect_right(self._los, code) - 1
+        return ix >= 0 and code <= self.spans[ix][1]
+
+    def __bool__(self) -> bool:
+        return bool(self.spans)
+
+
+class SchemaIndex(object):
+    format_version = 1
+
+    def __init__(self, rules: List[Rule]) -> None:
+        self.rules = rules
+        self._by_site = {}  # type: Dict[str, List[int]]
+        for ix, rule in enumerate(rules):
+            for site in rule.sites:
+                self._by_site.setdefault(site, []).append(ix)
+        self._any_site = [ix for ix, rule in enumerate(rules) if not rule.sites]
+        self._excl = [frozenset(rule.site_excl) for rule in rules]
+        self._morph = [[(Intervals(hs), Intervals(ss)) for hs, ss in rule.morph] for rule in rules]
+        self._hist = [[(h, Intervals(ss)) for h, ss in rule.hist] for rule in rules]
+        self._candidates = {}  # type: Dict[str, Tuple[int, ...]]
+
+    def candidates(self, site: str) -> Tuple[int, ...]:
+        '''Rules that may apply at site, in the order of the CASE clauses.'''
+        found = self._candidates.get(site)
+        if found is None:
+            found = self._candidates[site] = tuple(merge(self._by_site.get(site, []), self._any_site))
+        return found
+
+    def schema(self, site: Opt[str], histology: Opt[str]) -> Opt[str]:
+        for ix in (self._any_site if site is None else self.candidates(site)):
+            if self._matches(ix, site, histology):
+                return self.rules[ix].csschemaid
+        return None
+
+    def _matches(self, ix: int, site: Opt[str], histology: Opt[str]) -> bool:
+        def not_at(excl: Intervals) -> bool:
+            return not excl or (site is not None and site not in excl)
+
+        if self._excl[ix] and (site is None or site in self._excl[ix]):
+            return False
+        morph = self._morph[ix]
+        if morph and not (histology is not None and
+                          any(histology in hs and not_at(ss) for hs, ss in morph)):
+            return False
+        hist = self._hist[ix]
+        if hist and not (histology is not None and
+                         any(histology == h and not_at(ss) for h, ss in hist)):
+            return False
+        return True
+
+    def dumps(self) -> str:
+        return json.dumps({'format': self.format_version,
+                           'rules': [rule._asdict() for rule in self.rules]})
+
+    @classmethod
+    def loads(cls, text: str) -> 'SchemaIndex':
+        obj = json.loads(text)
+        if obj.get('format') != cls.format_version:
+            raise ValueError('unsupported csschema index format: %s' % obj.get('format'))
+        return cls([Rule.from_json(rule) for rule in obj['rules']])
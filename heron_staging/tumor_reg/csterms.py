@@ -3,6 +3,7 @@ r'''csterms -- i2b2 ontology for Collaborative Staging site-specific factors
 Usage:
   csterms.py [options] terms
   csterms.py [options] sql
+  csterms.py [options] index
 
 Options:
  terms                  Write i2b2 metadata terms (less update_date)
@@ -15,6 +16,9 @@ Options:
                         and produce concept codes corresponding to terms.
  -t F --template=FILE   SQL template [default: csschema_tpl.sql]
  -s F --sql=FILE        where to write SQL [default: csschema.sql]
+ index                  Save the schema selection constraints as JSON
+                        for csschema_index.SchemaIndex.
+ -i F --index=FILE      where to write the index [default: csschema_index.json]
  --help                 Show this help and exit.
 
 .. note: This line separates usage doc above from design/test notes below.
@@ -145,6 +149,7 @@ from lxml import etree  # type: ignore
 from docopt import docopt
 
 from i2b2mdmk import I2B2MetaData, Term
+from csschema_index import Rule as IndexRule, SchemaIndex
 
 USAGE = __doc__.split('\n.. ')[0]
 log = logging.getLogger(__name__)
@@ -232,6 +237,12 @@ def main(argv: List[str], cwd: Path_T) -> None:
 
             out.write(bottom)
 
+    elif opts['index']:
+        rules = [rule for site in cs.each_site()
+                 for rule in [Site.index_rule(site)] if rule]
+        with (cwd / opts['--index']).open('w') as out:
+            out.write(SchemaIndex(rules).dumps())
+
 
 class SchemaTerm(I2B2MetaData):
     r'''i2b2 term(s) for CS Schema
@@ -424,6 +435,31 @@ class Site(NamedTuple('Site',
 
         return comment, case, None
 
+    @classmethod
+    def index_rule(cls, site: 'Site') -> Opt[IndexRule]:
+        '''Schema constraint as data for csschema_index, rather than SQL.
+
+        >>> breast = Site.from_doc(Site._test_doc())
+        >>> Site.index_rule(breast)
+        ... # doctest: +NORMALIZE_WHITESPACE
+        Rule(csschemaid='Breast',
+             sites=['C500', 'C501', 'C502', 'C503', 'C504', 'C505', 'C506', 'C508', 'C509'],
+             site_excl=[], morph=[], hist=[])
+
+        Sites skipped by schema_constraint() are left out likewise.
+        '''
+        clauses = cls._parse_notes(site.notes)
+        if NoneItem.filter(clauses):
+            return None
+        site_items = SiteItem.filter(clauses)
+        return IndexRule(site.csschemaid,
+                         [i.val for i in site_items],
+                         [i.excl for i in site_items if i.excl],
+                         [(_item_ranges(i.expr), _item_ranges(i.excl) if i.excl else [])
+                          for i in MItem.filter(clauses)],
+                         [(i.hist, _item_ranges(i.site_excl) if i.site_excl else [])
+                          for i in HistItem.filter(clauses)])
+
     @classmethod
     def _parse_notes(cls, notes: List[str]) -> List[Item]:
         '''Interpret site notes as SQL constraint
@@ -568,13 +604,20 @@ def _item_expr(expr: str, col: str) -> str:
       or c1 = '690'
       or c1 between '695' and '696')
     '''
-    r = _sql_ranges(col,
-                    [(lo, hi)
-                     for lo_hi in expr.split(',')
-                     for (lo, hi) in [(lo_hi.split('-') + [None])[:2]]])  # type: ignore
+    r = _sql_ranges(col, _item_ranges(expr))
     return r
 
 
+def _item_ranges(expr: str) -> List[Tuple[str, Opt[str]]]:
+    '''
+    >>> _item_ranges('441,690,695-696')
+    [('441', None), ('690', None), ('695', '696')]
+    '''
+    return [(lo, hi)
+            for lo_hi in expr.split(',')
+            for (lo, hi) in [(lo_hi.split('-') + [None])[:2]]]  # type: ignore
+
+
 def _sql_and(conjuncts: Sequence[Opt[str]]) -> Opt[str]:
     flat = [c for c in conjuncts if c is not None]
     return (None if not flat else
@@ -31,10 +31,11 @@ __ http://seer.cancer.gov/siterecode/icdo3_dwhoheme/index.txt
 
 import logging
 from collections import namedtuple
+from bisect import bisect_left
 from itertools import dropwhile, takewhile
 from functools import reduce
 from typing import (
-    Callable, Iterable, Iterator, List, Optional as Opt, TextIO, Tuple
+    Callable, Dict, Iterable, Iterator, List, Optional as Opt, TextIO, Tuple
 )
 import csv
 
@@ -182,6 +183,130 @@ class Rule(namedtuple('Rule', 'site_group site histology recode')):
             self.site_group.strip(), clause, self.recode)
 
 
+    def matches(self, site: Opt[str], histology: Opt[str]) -> bool:
+        '''Evaluate the as_sql() condition; None plays the role of NULL.
+
+        >>> r = Rule.from_lines(test_lines)
+        >>> r[1].matches('C161', '8000'), r[1].matches('C161', '9140')
+        (True, False)
+        >>> r[1].matches(None, '8000'), r[1].matches('C161', None)
+        (False, False)
+        '''
+        for (excl, bounds), value in [(ranges(self.site), site),
+                                      (ranges(self.histology), histology)]:
+            if not bounds:
+                continue
+            if value is None:
+                return False
+            hit = any((lo <= value <= hi) if hi else value == lo
+                      for lo, hi in bounds)
+            if hit == excl:
+                return False
+        return True
+
+
+def site_recode(rules: List[Rule], site: Opt[str], histology: Opt[str],
+                invalid: str = '99999') -> str:
+    '''Recode site, histology using the first matching rule, as in main()
+
+    >>> r = Rule.from_lines(test_lines)
+    >>> site_recode(r, 'C500', '8500'), site_recode(r, 'C710', '9530')
+    ('26000', '31040')
+    >>> site_recode(r, 'C999', '8000')
+    '99999'
+    '''
+    for rule in rules:
+        if rule.recode and rule.site_group != 'Invalid' and rule.matches(site, histology):
+            return rule.recode
+    return invalid
+
+
+class Segments(object):
+    '''Elementary intervals of code space, split at a set of bounds.
+
+    With bounds b0 < b1 < ..., segment 2i is the open interval below bi
+    (and above b(i-1)) and segment 2i + 1 is the point bi itself, so
+    any union of `ranges()` is a union of whole segments.
+
+    >>> seg = Segments(['C500', 'C509'])
+    >>> [seg.find(code) for code in ['C400', 'C500', 'C501', 'C509', 'C999']]
+    [0, 1, 2, 3, 4]
+    >>> seg.covers(ranges('C500-C509'))
+    [False, True, True, True, False]
+    >>> seg.covers(ranges('All sites except C509'))
+    [True, True, True, False, True]
+    '''
+    def __init__(self, bounds: Iterable[str]) -> None:
+        self.bounds = sorted(set(bounds))
+        self._ix = {b: ix for ix, b in enumerate(self.bounds)}
+
+    def __len__(self) -> int:
+        return 2 * len(self.bounds) + 1
+
+    def find(self, code: str) -> int:
+        ix = bisect_left(self.bounds, code)
+        return 2 * ix + 1 if ix < len(self.bounds) and self.bounds[ix] == code else 2 * ix
+
+    def covers(self, spec: Tuple[bool, List[Range]]) -> List[bool]:
+        excl, bounds = spec
+        if not bounds:
+            return [True] * len(self)
+        hit = [False] * len(self)
+        for lo, hi in bounds:
+            first = 2 * self._ix[lo] + 1
+            last = 2 * self._ix[hi] + 1 if hi else first
+            hit[first:last + 1] = [True] * max(0, last + 1 - first)
+        return [h != excl for h in hit]
+
+
+class Recoder(object):
+    '''Site recode compiled to interval lookups; same results as site_recode().
+
+    Rules are grouped by the site segment they apply to; within each
+    group, histology segments map straight to the first matching
+    rule's recode. So a lookup is two bisections rather than a scan
+    of the rules:
+
+    >>> rc = Recoder(Rule.from_lines(test_lines))
+    >>> rc('C500', '8500'), rc('C710', '9530'), rc('C710', '8000')
+    ('26000', '31040', '31010')
+    >>> rc('C999', '8000'), rc('C161', None), rc(None, '8000')
+    ('99999', '99999', '99999')
+    '''
+    Table = Tuple[Segments, List[str], str]  # histology segments, recodes, recode for NULL histology
+
+    def __init__(self, rules: List[Rule], invalid: str = '99999') -> None:
+        self.invalid = invalid
+        active = [(ranges(r.site), ranges(r.histology), r.recode) for r in rules
+                  if r.recode and r.site_group != 'Invalid']
+        self.sites = Segments(b for (_, site), _h, _r in active for lo, hi in site for b in [lo, hi] if b)
+        site_hits = [self.sites.covers(site) for site, _h, _r in active]
+        tables = {}  # type: Dict[Tuple[int, ...], Recoder.Table]
+
+        def table(rule_ixs: Tuple[int, ...]) -> 'Recoder.Table':
+            if rule_ixs not in tables:
+                tables[rule_ixs] = self._histology_table([active[ix] for ix in rule_ixs])
+            return tables[rule_ixs]
+
+        self._by_site = [table(tuple(ix for ix, hits in enumerate(site_hits) if hits[seg]))
+                         for seg in range(len(self.sites))]
+        self._no_site = table(tuple(ix for ix, (site, _h, _r) in enumerate(active) if not site[1]))
+        log.info('Recoder: %d rules, %d site segments, %d tables', len(active), len(self.sites), len(tables))
+
+    def _histology_table(self, candidates: List[Tuple[Tuple[bool, List[Range]], Tuple[bool, List[Range]], str]]
+                         ) -> 'Recoder.Table':
+        hist = Segments(b for _s, (_, h), _r in candidates for lo, hi in h for b in [lo, hi] if b)
+        hits = [(hist.covers(h), recode) for _s, h, recode in candidates]
+        recodes = [next((recode for covered, recode in hits if covered[seg]), self.invalid)
+                   for seg in range(len(hist))]
+        no_hist = next((recode for _s, (_, h), recode in candidates if not h), self.invalid)
+        return hist, recodes, no_hist
+
+    def __call__(self, site: Opt[str], histology: Opt[str]) -> str:
+        hist, recodes, no_hist = self._no_site if site is None else self._by_site[self.sites.find(site)]
+        return no_hist if histology is None else recodes[hist.find(histology)]
+
+
 Term = namedtuple('Term', 'hlevel path name basecode visualattributes')
 
 
@@ -63,16 +63,24 @@ Project / select columns:
     DataFrame({'section': 'string'})
 """
 
-from typing import Callable, Dict, List, Optional as Opt, Text, Tuple, Union
-from typing import Iterator, Iterable, TextIO
+from typing import Callable, Dict, List, Optional as Opt, Set, Text, Tuple, Union
+from typing import Iterator, Iterable, Mapping, Sequence, TextIO
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from importlib import resources as res
 from pathlib import Path as Path_T
-from sqlite3 import Connection, Cursor, PARSE_COLNAMES
+from sqlite3 import Connection, Cursor, DatabaseError, PARSE_COLNAMES
+from typing_extensions import TypedDict
 import datetime as dt
+import hashlib
 import json
 import logging
+import queue
 import re
+import sys
+import threading
+import time
+import uuid
 
 import tabular as tab
 
@@ -86,6 +94,8 @@ Params = Dict[str, BindValue]
 Line = int
 Comment = Text
 StatementInContext = Tuple[Line, Comment, SQL]
+# name, narg, function (or aggregate class), deterministic (None for aggregates)
+UDF = Tuple[Name, int, Callable[..., object], Opt[bool]]
 
 
 def main(argv: List[str], cwd: Path_T, connect: Callable[..., Connection]) -> None:
@@ -116,14 +126,71 @@ class SqlScript(object):
             (name, self.find_ddl(name, code), inputs)
             for name, inputs in object_info
         ]
+        created = set(name for name, _, _ in self.objects)
+        self.dag = {
+            name: ddl_dependencies(ddl) & created - {name}
+            for name, ddl, _ in self.objects
+        }  # type: Dict[Name, Set[Name]]
+
+    def waves(self) -> List[List[Name]]:
+        """Group objects so that each depends only on those in earlier groups.
+
+        >>> for wave in _TestData.ont_script.waves():
+        ...     print(wave)
+        ['i2b2_path_concept']
+        ['naaccr_top_concept', 'primary_site_concepts', 'site_schema_concepts']
+        ['section_concepts', 'seer_recode_concepts']
+        ['item_concepts']
+        ['code_concepts']
+        ['naaccr_ontology']
+        """
+        done = set()  # type: Set[Name]
+        out = []
+        todo = [name for name, _, _ in self.objects]
+        while todo:
+            ready = [name for name in todo if self.dag[name] <= done]
+            if not ready:
+                raise ValueError(('cycle', todo))
+            out.append(ready)
+            done |= set(ready)
+            todo = [name for name in todo if name not in done]
+        return out
 
     @classmethod
     def find_ddl(cls, name: str, script: str) -> str:
-        for _l, _c, stmt in cls.each_statement(script):
-            if stmt.startswith('create '):
-                if name in stmt.split('\n')[0].split():
-                    return stmt
-        raise KeyError(name)
+        return cls.statement_index(script)[name][2]
+
+    # parsed scripts, by sha1 digest of the code
+    _parsed = {}  # type: Dict[str, Tuple[List[StatementInContext], Dict[Name, StatementInContext]]]
+
+    @classmethod
+    def _parse(cls, script: str) -> Tuple[List[StatementInContext], Dict[Name, StatementInContext]]:
+        key = hashlib.sha1(script.encode('utf-8')).hexdigest()
+        if key not in cls._parsed:
+            statements = list(iter_statement(script))
+            index = {}  # type: Dict[Name, StatementInContext]
+            for info in statements:
+                stmt = info[2]
+                if stmt.startswith('create '):
+                    for word in stmt.split('\n')[0].split():
+                        index.setdefault(word, info)
+            cls._parsed[key] = (statements, index)
+        return cls._parsed[key]
+
+    @classmethod
+    def statement_index(cls, script: str) -> Dict[Name, StatementInContext]:
+        """Index create ... statements by the words of their first line.
+
+        Parsing is done once per distinct script:
+
+        >>> ix = SqlScript.statement_index(_TestData.ont_script.code)
+        >>> line, _comment, ddl = ix['section_concepts']
+        >>> line, ddl.splitlines()[0]
+        (60, 'create table section_concepts as')
+        >>> SqlScript.statement_index(_TestData.ont_script.code) is ix
+        True
+        """
+        return cls._parse(script)[1]
 
     def replace_ddl(self, name: str, query: SQL,
                     is_table: bool = False) -> 'SqlScript':
@@ -148,7 +215,7 @@ class SqlScript(object):
                        variables: Opt[Environment] = None,
                        skip_unbound: bool = False) -> Iterable[StatementInContext]:
         # idea: use statement namese lik https://github.com/honza/anosql
-        for line, comment, statement in iter_statement(sql):
+        for line, comment, statement in cls._parse(sql)[0]:
             try:
                 ss = substitute(statement, variables)
             except KeyError:
@@ -168,6 +235,122 @@ class SqlScript(object):
         return None
 
 
+_SQL_WORDS = re.compile(r"'[^']*'|\"[^\"]*\"|([\w.]+|[(),])")
+_NOT_ALIAS = set('''where join left right full inner outer cross natural on using group order
+    having union intersect except limit window'''.split())
+
+
+def ddl_dependencies(ddl: SQL) -> Set[Name]:
+    """Tables / views a statement reads, i.e. names after FROM or JOIN,
+    excluding names of common table expressions.
+
+    >>> sorted(ddl_dependencies('''
+    ...   create view v as
+    ...   with ea as (select * from t1 where x = 'from t0')
+    ...      , eb as (select * from ea join t2 on t2.k = ea.k)
+    ...   select * from eb, t3 x, main.t4
+    ...   left join (select * from t5) q on 1=1
+    ...   '''))
+    ['main.t4', 't1', 't2', 't3', 't5']
+    """
+    items, ctes = _from_items(ddl)
+    return set(table for table, _alias in items) - ctes
+
+
+def ddl_aliases(ddl: SQL) -> Dict[Name, Name]:
+    """Map names used in a statement (alias or table name) to tables / views read.
+
+    >>> ddl_aliases('select * from t1 a, t3 as c join t2 on a.x = t2.x')
+    {'a': 't1', 't1': 't1', 'c': 't3', 't3': 't3', 't2': 't2'}
+    """
+    items, ctes = _from_items(ddl)
+    out = {}  # type: Dict[Name, Name]
+    for table, alias in items:
+        if table not in ctes:
+            out[alias or table] = table
+            out[table] = table
+    return out
+
+
+def _from_items(ddl: SQL) -> Tuple[List[Tuple[Name, Opt[Name]]], Set[Name]]:
+    words = [w.lower() for w in _SQL_WORDS.findall(ddl) if w]
+    ctes = set(w for (prev, w, kw, paren) in zip(words, words[1:], words[2:], words[3:])
+               if prev in ('with', ',') and kw == 'as' and paren == '(')
+    items = []  # type: List[Tuple[Name, Opt[Name]]]
+    ix = 0
+    while ix < len(words):
+        if words[ix] not in ('from', 'join'):
+            ix += 1
+            continue
+        ix += 1
+        # table [[as] alias] [, table [[as] alias]]*
+        while ix < len(words) and words[ix] not in ('(', ')', ','):
+            table, alias = words[ix], None
+            ix += 1
+            if ix < len(words) and words[ix] == 'as':
+                ix += 1
+            if ix < len(words) and words[ix] not in _NOT_ALIAS and words[ix] not in ('(', ')', ','):
+                alias = words[ix]
+                ix += 1
+            items.append((table, alias))
+            if not (ix < len(words) and words[ix] == ','):
+                break
+            ix += 1
+    return items, ctes
+
+
+IndexAdvice = Tuple[Name, Tuple[str, ...]]
+_AUTO_INDEX = re.compile(r'SEARCH (?P<name>\S+)(?: AS (?P<alias>\S+))? USING AUTOMATIC '
+                         r'(?:PARTIAL )?(?:COVERING )?INDEX \((?P<cols>[^)]*)\)')
+
+
+def advise_indexes(spark: 'DBSession', script: 'SqlScript',
+                   create: bool = False) -> List[IndexAdvice]:
+    """Suggest indexes where sqlite builds automatic indexes for the script's objects.
+
+    Each object's EXPLAIN QUERY PLAN is checked for automatic indexes
+    on tables (not views, CTEs, or subqueries); with `create`, the
+    suggested indexes are created.
+
+    >>> ctx = DBSession.in_memory()
+    >>> script = SqlScript('s.sql', '''
+    ...     create view v1 as select * from t1 a join t2 b on a.x = b.y;
+    ...     ''', [('v1', ['t1', 't2'])])
+    >>> t1 = tab.DataFrame.from_records([dict(x=n) for n in range(5)])
+    >>> t2 = tab.DataFrame.from_records([dict(y=n) for n in range(5)])
+    >>> _ = create_objects(ctx, script, t1=t1, t2=t2)
+    >>> advice = advise_indexes(ctx, script, create=True)
+    >>> advice in ([('t1', ('x',))], [('t2', ('y',))])
+    True
+    >>> advise_indexes(ctx, script)
+    []
+    """
+    with spark._query("select lower(name) from sqlite_master where type = 'table'") as q:
+        tables = set(name for (name,) in q.fetchall())
+    aliases = {}  # type: Dict[Name, Name]
+    for _name, ddl, _inputs in script.objects:
+        aliases.update(ddl_aliases(ddl))
+    out = []  # type: List[IndexAdvice]
+    for name, _ddl, _inputs in script.objects:
+        for step in spark.explain(f'select * from {name}'):
+            m = _AUTO_INDEX.search(step)
+            if not m:
+                continue
+            used = (m.group('name')).lower()
+            table = used if used in tables else aliases.get(used)
+            if table is None or table not in tables:
+                continue
+            cols = tuple(re.findall(r'(\w+)[=<>]', m.group('cols')))
+            advice = (table, cols)
+            if cols and advice not in out:
+                log.info('%s: %s could use index on %s%s', script.name, name, table, cols)
+                out.append(advice)
+    if create:
+        for table, cols in out:
+            spark.create_index(table, cols)
+    return out
+
+
 class SqlScriptError(IOError):
     '''Include script file, line number in diagnostics
     '''
@@ -199,43 +382,51 @@ def iter_statement(txt: SQL) -> Iterable[StatementInContext]:
     [(1, '', 'select "x--y" from z')]
     >>> list(iter_statement("select 'x--y' from z;"))
     [(1, '', "select 'x--y' from z")]
+
+    We scan by position rather than re-slicing the remaining text,
+    so time is linear in the size of the script.
     '''
 
-    statement = comment = ''
+    parts = []  # type: List[SQL]
+    comment = ''
     line = 1
     sline = None  # type: Opt[int]
+    pos = 0
 
-    def save(txt: SQL) -> Tuple[SQL, Opt[int]]:
-        return (statement + txt, sline or (line if txt else None))
+    def save(chunk: SQL) -> None:
+        nonlocal sline
+        parts.append(chunk)
+        sline = sline or (line if chunk else None)
 
     while 1:
-        m = SQL_SEPARATORS.search(txt)
+        # space only counts as such right where the previous match left off
+        m = SQL_SPACE.match(txt, pos) or SQL_TOKENS.search(txt, pos)
         if not m:
-            statement, sline = save(txt)
+            save(txt[pos:])
             break
 
-        pfx, match, txt = (txt[:m.start()],
-                           txt[m.start():m.end()],
-                           txt[m.end():])
-        if pfx:
-            statement, sline = save(pfx)
+        start, end = m.span()
+        if start > pos:
+            save(txt[pos:start])
 
-        if m.group('sep'):
+        if m.lastgroup == 'sep':
             if sline:
-                yield sline, comment, statement
-            statement = comment = ''
+                yield sline, comment, ''.join(parts)
+            parts = []
+            comment = ''
             sline = None
-        elif [n for n in ('lit', 'hint', 'sym')
-              if m.group(n)]:
-            statement, sline = save(match)
-        elif (m.group('space') and statement):
-            statement, sline = save(match)
-        elif ((m.group('comment') and not statement) or
-              (m.group('space') and comment)):
-            comment += match
-
-        line += (pfx + match).count("\n")
-
+        elif m.lastgroup in ('lit', 'hint', 'sym'):
+            save(m.group())
+        elif m.lastgroup == 'space' and parts:
+            save(m.group())
+        elif ((m.lastgroup == 'comment' and not parts) or
+              (m.lastgroup == 'space' and comment)):
+            comment += m.group()
+
+        line += txt.count('\n', pos, end)
+        pos = end
+
+    statement = ''.join(parts)
     if sline and (comment or statement):
         yield sline, comment, statement
 
@@ -248,6 +439,8 @@ SQL_SEPARATORS = re.compile(
     r'|(?P<sym>"[^\"]*")'
     r"|(?P<lit>'[^\']*')"
     r'|(?P<sep>;)')
+SQL_SPACE = re.compile(r'(?P<space>\s+)')
+SQL_TOKENS = re.compile(SQL_SEPARATORS.pattern.split('|', 1)[1])
 
 
 def substitute(sql: SQL, variables: Opt[Environment]) -> SQL:
@@ -318,50 +511,477 @@ def to_qmark(sql: SQL, params: Params) -> Tuple[SQL, List[BindValue]]:
     return out, values
 
 
+StatementStats = TypedDict('StatementStats', {
+    'script': Opt[str],
+    'line': Opt[Line],
+    'name': Opt[Name],
+    'kind': str,
+    'sql': SQL,
+    'seconds': float,
+    'rows': Opt[int],
+    'plan': List[str],
+})
+
+
+class Profile:
+    """Wall time, rows, and query plan of each statement run by a DBSession.
+
+    >>> ctx = DBSession.in_memory()
+    >>> ctx.profile = Profile()
+    >>> script = SqlScript('s.sql', '''
+    ...     create table t2 as select x, x * x as y from t1;
+    ...     create view v1 as select * from t2 a join t2 b on a.x = b.y;
+    ...     ''', [('t2', ['t1']), ('v1', [])])
+    >>> t1 = tab.DataFrame.from_records([dict(x=n) for n in range(5)])
+    >>> v1 = create_objects(ctx, script, t1=t1)['v1']
+    >>> _ = list(v1.iterrows())
+    >>> for stats in ctx.profile.records:
+    ...     print(stats['kind'], stats['script'], stats['line'], stats['name'], stats['rows'])
+    load s.sql None t1 5
+    sql s.sql 2 t2 None
+    create s.sql 2 t2 None
+    sql s.sql 3 v1 None
+    create s.sql 3 v1 None
+    query None None None 3
+    >>> [step.split()[0] for step in ctx.profile.records[4]['plan']]
+    ['SCAN', 'SEARCH']
+    >>> print(ctx.profile.summary())  # doctest: +ELLIPSIS
+        seconds     rows  where
+    ...
+    """
+    def __init__(self, on_record: Opt[Callable[[StatementStats], None]] = None) -> None:
+        """
+        @param on_record: called with each record as it is made,
+               e.g. to log it with eliot.Message.log
+        """
+        self.records = []  # type: List[StatementStats]
+        self._on_record = on_record
+        self._tags = threading.local()
+
+    @contextmanager
+    def tagged(self, script: str, line: Opt[Line], name: Name) -> Iterator[None]:
+        """Attribute statements in this block (and thread) to a script object.
+        """
+        self._tags.where = (script, line, name)
+        try:
+            yield
+        finally:
+            self._tags.where = None
+
+    @contextmanager
+    def timed(self, kind: str, sql: SQL) -> Iterator[StatementStats]:
+        script, line, name = getattr(self._tags, 'where', None) or (None, None, None)
+        stats = {'script': script, 'line': line, 'name': name, 'kind': kind, 'sql': sql,
+                 'seconds': 0.0, 'rows': None, 'plan': []}  # type: StatementStats
+        t0 = time.perf_counter()
+        yield stats
+        stats['seconds'] = time.perf_counter() - t0
+        self.records.append(stats)
+        if self._on_record:
+            self._on_record(stats)
+
+    def report(self) -> Dict[str, object]:
+        return {'seconds': sum(stats['seconds'] for stats in self.records),
+                'statements': self.records}
+
+    def to_json(self, out: TextIO) -> None:
+        json.dump(self.report(), out, indent=2)
+
+    def summary(self, top: int = 20) -> str:
+        """Slowest statements first, with their query plans.
+        """
+        lines = ['    seconds     rows  where']
+        for stats in sorted(self.records, key=lambda s: -s['seconds'])[:top]:
+            where = (f"{stats['script']}:{stats['line']} {stats['name']}" if stats['script']
+                     else stats['sql'].strip().split('\n')[0][:60])
+            rows = '' if stats['rows'] is None else stats['rows']
+            lines.append(f"{stats['seconds']:11.3f} {rows:>8}  {stats['kind']} {where}")
+            lines += [f'{"":22}{step}' for step in stats['plan']]
+        return '\n'.join(lines)
+
+
 class DBSession:
     """a la SparkSession, but using python stdlib only
     """
+    profile = None  # type: Opt[Profile]
 
-    def __init__(self, conn: Connection) -> None:
+    def __init__(self, conn: Connection,
+                 reconnect: Opt[Callable[[], Connection]] = None) -> None:
+        """
+        @param reconnect: access to (another connection to) the same database,
+               for work done concurrently; see sibling()
+        """
         self.__conn = conn
+        self.__reconnect = reconnect
+        self._udfs = []  # type: List[UDF]
+        self._udfs_seen = {}  # type: Dict[int, int]
 
     @classmethod
     def in_memory(cls) -> 'DBSession':
         from sqlite3 import connect as connect_mem
         return cls(connect_mem(':memory:'))
 
+    @classmethod
+    def on_file(cls, db: Path_T, connect: Callable[..., Connection],
+                busy_timeout: float = 30.0) -> 'DBSession':
+        """Session on a file-backed database, with siblings for concurrent work.
+
+        As in PooledSession, WAL mode lets siblings read while another
+        writes, and writers wait up to busy_timeout seconds for each other
+        rather than failing with "database is locked".
+        """
+        def reconnect() -> Connection:
+            conn = connect(str(db), detect_types=PARSE_COLNAMES, timeout=busy_timeout,
+                           check_same_thread=False)
+            conn.execute('pragma journal_mode=wal')
+            return conn
+        return cls(reconnect(), reconnect)
+
+    def sibling(self) -> Opt['DBSession']:
+        """Session on a separate connection to the same database, if available.
+        """
+        if self.__reconnect is None:
+            return None
+        sib = DBSession(self.__reconnect(), self.__reconnect)
+        sib._udfs = self._udfs
+        sib._sync_udfs(sib._conn())
+        return sib
+
+    def sibling_available(self) -> bool:
+        return self.__reconnect is not None
+
+    def close(self) -> None:
+        self.__conn.close()
+
+    def _conn(self) -> Connection:
+        """Connection for statements in the current thread.
+        """
+        return self.__conn
+
     def table(self, k: str) -> 'DataFrame':
         return DataFrame.select_from(self, k)
 
     def sql(self, code: str) -> 'DataFrame':
+        """Run a statement; a query gives a DataFrame.
+
+        Spark SQL's `create or replace [temporary] view` replaces a view
+        in the main schema, where other connections can see it:
+
+        >>> ctx = DBSession.in_memory()
+        >>> for n in [1, 2]:
+        ...     _ = ctx.sql(f'create or replace temporary view v as select {n} as x')
+        >>> [row for _, row in ctx.table('v').iterrows()]
+        [(2,)]
+        """
         if code.lower().strip().startswith('select '):
             return DataFrame.select_from(self, f'({code})')
 
-        with txn(self.__conn) as work:  # type: Cursor
+        replace = self._replace_view.match(code)
+        if replace:
+            self.sql(f'drop view if exists {replace.group(1)}')
+            code = f'create view {replace.group(1)}' + code[replace.end():]
+
+        with self._timed('create' if code.lower().strip().startswith('create ') else 'sql',
+                         code) as stats, \
+                txn(self._conn()) as work:  # type: Cursor
             log.debug('DBSession.sql: %s', code)
             work.execute(code)
+            stats['rows'] = work.rowcount if work.rowcount >= 0 else None
         return DataFrame.select_from(self, '(select 1 as _dummy)')
 
+    _view_ddl = re.compile(r'\s*create\s+(?:or\s+replace\s+)?(?:temp\w*\s+)?view\s+([\w.]+)', re.I)
+    _replace_view = re.compile(r'\s*create\s+or\s+replace\s+(?:temp\w*\s+)?view\s+([\w.]+)', re.I)
+
+    @contextmanager
+    def _timed(self, kind: str, sql: SQL) -> Iterator[StatementStats]:
+        """Record statement stats if profiling, including the query plan.
+        """
+        if self.profile is None:
+            yield {'script': None, 'line': None, 'name': None, 'kind': kind, 'sql': sql,
+                   'seconds': 0.0, 'rows': None, 'plan': []}
+            return
+        view = self._view_ddl.match(sql)
+        # explain create table ... fails once the table exists; create view ... has no plan.
+        plan = None if view else self.explain(sql)
+        with self.profile.timed(kind, sql) as stats:
+            yield stats
+        if plan is None:
+            plan = self.explain(f'select * from {view.group(1)}') if view else []
+        stats['plan'] = plan
+
+    def explain(self, sql: SQL) -> List[str]:
+        """EXPLAIN QUERY PLAN details, or [] if sql can't be explained.
+        """
+        try:
+            with txn(self._conn()) as q:
+                q.execute(f'explain query plan {sql}')
+                return [detail for (_id, _parent, _, detail) in q.fetchall()]
+        except DatabaseError:
+            return []
+
     @contextmanager
     def _query(self, sql: str) -> Iterator[Cursor]:
-        with txn(self.__conn) as q:
+        with txn(self._conn()) as q:
             log.debug('DBSession._query: %s', sql)
             q.execute(sql)
             yield q
 
-    def load_data_frame(self, name: str, df: tab.Relation) -> 'DataFrame':
-        with txn(self.__conn) as work:  # type: Cursor
+    def load_data_frame(self, name: str, df: tab.Relation,
+                        digest: Opt[str] = None) -> 'DataFrame':
+        """Load df into a new table `name`, recording its fingerprint
+        (or the given digest of it) for DataFrame.fingerprint().
+        """
+        if digest is None:
+            digest = df.fingerprint()
+        with txn(self._conn()) as work:  # type: Cursor
             work.execute(f'drop table if exists {name}')
             work.execute(table_ddl(name, df.schema))
-        load_table(self.__conn, name,
-                   header=[col['name'] for col in df.schema['columns']],
-                   rows=(row for (_, row) in df.iterrows()))
+        with self._timed('load', name) as stats:
+            stats['rows'] = load_batches(self._conn(), name,
+                                         header=[col['name'] for col in df.schema['columns']],
+                                         batches=df.iter_batches(500))
+        self.set_fingerprint(name, digest)
         return DataFrame.select_from(self, name)
 
+    def create_function(self, name: str, narg: int, func: Callable[..., object],
+                        deterministic: bool = True) -> None:
+        """Register a function; deterministic ones can be used in indexes.
+
+        Functions are per-connection, so registrations are kept in order
+        and replayed on other connections (siblings, PooledSession
+        writers and readers); see _sync_udfs(). Repeating the current
+        registration of name/narg is a no-op:
+
+        >>> ctx = DBSession.in_memory()
+        >>> for _ in range(3):
+        ...     ctx.create_function('g', 1, abs)
+        >>> len(ctx._udfs)
+        1
+        """
+        self._add_udf((name, narg, func, deterministic))
+
+    def create_aggregate(self, name: str, narg: int, aggregate_class: Callable[[], object]) -> None:
+        self._add_udf((name, narg, aggregate_class, None))
+
+    def _add_udf(self, udf: UDF) -> None:
+        name, narg = udf[:2]
+        current = [u for u in self._udfs if u[:2] == (name, narg)][-1:]
+        if current != [udf]:
+            self._udfs.append(udf)
+        self._sync_udfs(self._conn())
+
+    def _sync_udfs(self, conn: Connection) -> None:
+        """Replay on conn the registrations it hasn't seen."""
+        seen = self._udfs_seen.get(id(conn), 0)
+        if seen < len(self._udfs):
+            self._udfs_seen[id(conn)] = self._register_in(conn, seen)
+
+    def _register_in(self, conn: Connection, seen: int = 0) -> int:
+        """Replay registrations after the first `seen`; return how many conn has seen."""
+        udfs = self._udfs[:]  # others may register meanwhile
+        for name, narg, func, deterministic in udfs[seen:]:
+            if deterministic is None:
+                conn.create_aggregate(name, narg, func)  # type: ignore
+            else:
+                _create_function(conn, name, narg, func, deterministic)
+        return len(udfs)
+
+    def create_index(self, table: Name, cols: Sequence[str]) -> None:
+        name = '_'.join([table] + [re.sub(r'\W', '_', col) for col in cols] + ['ix'])
+        col_list = ', '.join(f'"{col}"' for col in cols)
+        self.sql(f'create index if not exists "{name}" on "{table}" ({col_list})')
+
     def read_csv(self, access: Path_T) -> 'DataFrame':
         df = tab.read_csv(access)
         return self.load_data_frame(access.stem, df)
 
+    fingerprint_table = '_object_fingerprint'
+
+    @classmethod
+    def _fingerprint_ddl(cls) -> str:
+        return f'''create table if not exists {cls.fingerprint_table} (
+                     name text primary key, digest text not null)'''
+
+    def fingerprint(self, name: str) -> Opt[str]:
+        """Digest recorded when `name` was last (re)built, provided it still exists.
+        """
+        with txn(self._conn()) as work:
+            work.execute(self._fingerprint_ddl())
+            work.execute(f"""select fp.digest from {self.fingerprint_table} fp
+                             join sqlite_master obj on obj.name = fp.name
+                             where fp.name = ?""", (name,))
+            row = work.fetchone()
+        return row[0] if row else None
+
+    def set_fingerprint(self, name: str, digest: str) -> None:
+        with txn(self._conn()) as work:
+            work.execute(self._fingerprint_ddl())
+            work.execute(f'insert or replace into {self.fingerprint_table} (name, digest) values (?, ?)',
+                         (name, digest))
+
+    def object_fingerprint(self, table: str) -> str:
+        """Digest of a table, view, or (subquery) without reading its rows.
+
+        A recorded digest is used if there is one; else a view or subquery
+        digests its SQL text along with what it reads. A table with
+        neither has unknown content, so it gets a fresh digest each time.
+        """
+        if table.startswith('('):
+            kind, sql = 'view', table
+        else:
+            name = table.split('.')[-1]
+            recorded = self.fingerprint(name)
+            if recorded is not None:
+                return recorded
+            with self._query(f'''select type, sql from sqlite_master where name = '{name}'
+                                 union all
+                                 select type, sql from sqlite_temp_master where name = '{name}' ''') as q:
+                found = q.fetchone()
+            if found is None or found[0] != 'view':
+                return uuid.uuid4().hex
+            kind, sql = found
+        h = hashlib.sha1(f'{kind} {sql}'.encode('utf-8'))
+        for dep in sorted(ddl_dependencies(sql)):
+            h.update(f' {dep}={self.object_fingerprint(dep)}'.encode('utf-8'))
+        return h.hexdigest()
+
+
+class PooledSession(DBSession):
+    """DBSession for concurrent use: WAL mode on a file-backed database,
+    one writer connection per thread, and a pool of read-only connections
+    for queries.
+
+    A query iterated lazily reads a consistent snapshot and doesn't
+    block (nor is blocked by) concurrent writes:
+
+    >>> from sqlite3 import connect
+    >>> from tempfile import TemporaryDirectory
+    >>> with TemporaryDirectory() as tmp:
+    ...     ctx = PooledSession(Path_T(tmp) / 'db', connect)
+    ...     t = ctx.load_data_frame('t', tab.DataFrame.from_records([dict(x=1), dict(x=2)]))
+    ...     rows = t.iterrows()
+    ...     print(next(rows))
+    ...     ctx.sql('insert into t values (3)') and None
+    ...     print(list(rows))
+    ...     print(len(list(t.iterrows())))
+    ...     ctx.close()
+    (0, (1,))
+    [(1, (2,))]
+    3
+
+    Since connections are per-thread, the session is its own sibling.
+    A query holds a reader until it is exhausted or closed; when all
+    `readers` are in use, the next query gets an overflow connection,
+    closed when that query is done, rather than waiting (perhaps on
+    queries held open by the same thread):
+
+    >>> with TemporaryDirectory() as tmp:
+    ...     ctx = PooledSession(Path_T(tmp) / 'db', connect, readers=1)
+    ...     t = ctx.load_data_frame('t', tab.DataFrame.from_records([dict(x=1), dict(x=2)]))
+    ...     outer = t.iterrows()
+    ...     print(next(outer), [row for _, row in t.iterrows()])
+    ...     outer.close()
+    ...     ctx.close()
+    (0, (1,)) [(1,), (2,)]
+
+    Functions registered (or re-registered) along the way are replayed
+    on each connection before it is next used:
+
+    >>> with TemporaryDirectory() as tmp:
+    ...     ctx = PooledSession(Path_T(tmp) / 'db', connect, readers=1)
+    ...     ctx.create_function('f', 1, lambda x: x + 1)
+    ...     print([row for _, row in ctx.sql('select f(1) as y').iterrows()])
+    ...     ctx.create_function('f', 1, lambda x: x * 10)
+    ...     print([row for _, row in ctx.sql('select f(1) as y').iterrows()])
+    ...     ctx.close()
+    [(2,)]
+    [(10,)]
+    """
+    def __init__(self, db: Path_T, connect: Callable[..., Connection],
+                 readers: int = 4,
+                 busy_timeout: float = 30.0) -> None:
+        def writer() -> Connection:
+            conn = connect(str(db), detect_types=PARSE_COLNAMES, timeout=busy_timeout,
+                           check_same_thread=False)  # so that close() works
+            conn.execute('pragma journal_mode=wal')
+            return conn
+
+        def reader() -> Connection:
+            return connect(f'file:{db}?mode=ro', uri=True, detect_types=PARSE_COLNAMES,
+                           timeout=busy_timeout, check_same_thread=False)
+
+        first = writer()
+        DBSession.__init__(self, first, None)
+        self.__writer = writer
+        self.__reader = reader
+        self.__local = threading.local()
+        self.__local.conn = first
+        self.__opened = [first]  # type: List[Connection]
+        self.__lock = threading.Lock()
+        self.__readers = queue.Queue()  # type: queue.Queue[Connection]
+        for _ in range(readers):
+            conn = reader()
+            self.__opened.append(conn)
+            self.__readers.put(conn)
+
+    def _conn(self) -> Connection:
+        conn = getattr(self.__local, 'conn', None)  # type: Opt[Connection]
+        if conn is None:
+            conn = self.__local.conn = self.__writer()
+            with self.__lock:
+                self.__opened.append(conn)
+        self._sync_udfs(conn)
+        return conn
+
+    @contextmanager
+    def _query(self, sql: str) -> Iterator[Cursor]:
+        try:
+            conn = self.__readers.get_nowait()
+            overflow = False
+        except queue.Empty:
+            log.info('PooledSession: all readers busy; opening another')
+            conn = self.__reader()
+            overflow = True
+        if overflow:
+            self._register_in(conn)
+        else:
+            self._sync_udfs(conn)
+        q = conn.cursor()
+        try:
+            log.debug('PooledSession._query: %s', sql)
+            q.execute(sql)
+            yield q
+        finally:
+            q.close()  # end the read transaction
+            if overflow:
+                conn.close()
+            else:
+                self.__readers.put(conn)
+
+    def sibling(self) -> Opt[DBSession]:
+        return self
+
+    def sibling_available(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        with self.__lock:
+            for conn in self.__opened:
+                conn.close()
+            del self.__opened[:]
+
+
+def _create_function(conn: Connection, name: str, narg: int, func: Callable[..., object],
+                     deterministic: bool) -> None:
+    """create_function, marking deterministic functions as such where
+    supported (python 3.8+, sqlite 3.8.3+); without that, sqlite won't
+    use them in indexes, but they work otherwise.
+    """
+    if sys.version_info >= (3, 8) and deterministic:
+        conn.create_function(name, narg, func, deterministic=True)  # type: ignore
+    else:
+        conn.create_function(name, narg, func)  # type: ignore
+
 
 @contextmanager
 def txn(conn: Connection) -> Iterator[Cursor]:
@@ -411,18 +1031,23 @@ def insert_stmt(table: str, header: List[str]) -> str:
 
 def load_table(dest: Connection, table: str,
                header: List[str], rows: Iterable[tab.Row],
-               batch_size: int = 500) -> None:
+               batch_size: int = 500) -> int:
     '''Load rows of a table in batches.
+
+    @return: number of rows loaded
     '''
     log.info('loading %s', table)
     work = dest.cursor()
     stmt = insert_stmt(table, header)
     log.debug('%s', stmt)
     batch = []  # type: List[tab.Row]
+    total = 0
 
     def do_batch() -> None:
+        nonlocal total
         work.executemany(stmt, batch)
         log.info('inserted %s rows into %s', len(batch), table)
+        total += len(batch)
         del batch[:]
 
     for row in rows:
@@ -433,6 +1058,36 @@ def load_table(dest: Connection, table: str,
     if batch:
         do_batch()
     dest.commit()
+    return total
+
+
+def load_batches(dest: Connection, table: str,
+                 header: List[str], batches: Iterable[tab.Batch]) -> int:
+    '''Load column-major batches of rows into a table.
+
+    As in load_table, blank rows are skipped:
+
+    >>> ctx = DBSession.in_memory()
+    >>> ctx.sql('create table t (x int, y text)') and None
+    >>> load_batches(ctx._conn(), 't', ['x', 'y'], [[[1, 2], ['a', 'b']], [], [[], []]])
+    2
+
+    @return: number of rows loaded
+    '''
+    log.info('loading %s', table)
+    work = dest.cursor()
+    stmt = insert_stmt(table, header)
+    log.debug('%s', stmt)
+    total = 0
+    for batch in batches:
+        if not batch or not batch[0]:  # skip blank batch, e.g. at end
+            continue
+        work.executemany(stmt, zip(*batch))
+        qty = len(batch[0])
+        log.info('inserted %s rows into %s', qty, table)
+        total += qty
+    dest.commit()
+    return total
 
 
 class DataFrame(tab.Relation):
@@ -475,9 +1130,27 @@ class DataFrame(tab.Relation):
     def withColumn(self, name: str, col_expr: str) -> 'DataFrame':
         return self._ctx.sql(f'''select self.*, {col_expr} as {name} from {self.table} self''')
 
+    def fingerprint(self) -> str:
+        """Digest of what this table or view holds, without reading its rows.
+
+        See DBSession.object_fingerprint:
+
+        >>> ctx = DBSession.in_memory()
+        >>> t1 = ctx.load_data_frame('t1', tab.DataFrame.from_records([dict(x=1)]))
+        >>> v = ctx.sql('select x + 1 as y from t1')
+        >>> before = v.fingerprint()
+        >>> before == ctx.sql('select x + 1 as y from t1').fingerprint()
+        True
+        >>> t1 = ctx.load_data_frame('t1', tab.DataFrame.from_records([dict(x=2)]))
+        >>> before == v.fingerprint()
+        False
+        """
+        return self._ctx.object_fingerprint(self.table)
+
     def iterrows(self) -> Iterator[Tuple[int, tab.Row]]:
         ix = 0
-        with self._ctx._query(f'select * from {self.table}') as q:
+        sql = f'select * from {self.table}'
+        with self._ctx._timed('query', sql) as stats, self._ctx._query(sql) as q:
             while True:
                 chunk = q.fetchmany(self.chunk_size)
                 if not chunk:
@@ -485,13 +1158,31 @@ class DataFrame(tab.Relation):
                 for row in chunk:
                     yield ix, row
                     ix += 1
+            stats['rows'] = ix
+
+    def iter_batches(self, n: int = chunk_size) -> Iterator[tab.Batch]:
+        """
+        >>> ctx = DBSession.in_memory()
+        >>> df = ctx.sql("select 1 as x, 'a' as y union all select 2, 'b'")
+        >>> list(df.iter_batches(5))
+        [[[1, 2], ['a', 'b']]]
+        """
+        sql = f'select * from {self.table}'
+        rows = 0
+        with self._ctx._timed('query', sql) as stats, self._ctx._query(sql) as q:
+            while True:
+                chunk = q.fetchmany(n)
+                if not chunk:
+                    break
+                rows += len(chunk)
+                yield [list(col) for col in zip(*chunk)]
+            stats['rows'] = rows
 
     def dump(self, out: TextIO) -> None:
         json.dump({'sql': insert_stmt(self.table, self.columns)}, out)
         out.write('\n')
-        for _, row in self.iterrows():
-            json.dump(row, out)
-            out.write('\n')
+        for batch in self.iter_batches():
+            out.write(''.join(json.dumps(row) + '\n' for row in zip(*batch)))
 
 
 class _TestData:
@@ -516,31 +1207,156 @@ class _TestData:
 
 
 def create_objects(spark: DBSession, script: SqlScript,
-                   **kwargs: tab.DataFrame) -> Dict[str, DataFrame]:
+                   parallel: int = 1,
+                   indexes: Opt[Mapping[Name, Sequence[Sequence[str]]]] = None,
+                   **kwargs: tab.Relation) -> Dict[str, DataFrame]:
+    """Load inputs and create the objects in script, skipping unchanged work.
+
+    Each input and object gets a content digest, recorded in the
+    session's database. An input whose digest matches is not reloaded;
+    an object is re-created only if its DDL, its inputs, or the
+    objects it depends on (see SqlScript.dag) changed.
+
+    >>> script = SqlScript('s.sql', 'create view v1 as select x + 1 as y from t1;',
+    ...                    [('v1', ['t1'])])
+    >>> t1 = tab.DataFrame.from_records([dict(x=1)])
+    >>> ctx = DBSession.in_memory()
+    >>> create_objects(ctx, script, t1=t1)
+    {'v1': DataFrame({'y': 'number'})}
+
+    Running again with the same data doesn't reload `t1`, so a row
+    added behind our back survives:
+
+    >>> ctx.sql('insert into t1 values (2)') and None
+    >>> views = create_objects(ctx, script, t1=t1)
+    >>> [row for _, row in views['v1'].iterrows()]
+    [(2,), (3,)]
+
+    Inputs can be given `indexes`: a list of column lists for each input:
+
+    >>> _ = create_objects(ctx, script, indexes={'t1': [['x']]}, t1=t1)
+    >>> [row for _, row in ctx.sql("select name from sqlite_master where type = 'index'").iterrows()]
+    [('sqlite_autoindex__object_fingerprint_1',), ('t1_x_ix',)]
+
+    Different data does get loaded:
+
+    >>> views = create_objects(ctx, script, t1=tab.DataFrame.from_records([dict(x=10)]))
+    >>> [row for _, row in views['v1'].iterrows()]
+    [(11,)]
+
+    Inputs that live in the database (tables, views, queries) are
+    fingerprinted by their SQL and what they read, not by reading their rows:
+
+    >>> s3 = SqlScript('s3.sql', 'create view v3 as select x from t3;', [('v3', ['t3'])])
+    >>> _ = create_objects(ctx, s3, t3=ctx.sql('select x * 100 as x from t1'))
+    >>> ctx.sql('insert into t3 values (0)') and None
+    >>> views = create_objects(ctx, s3, t3=ctx.sql('select x * 100 as x from t1'))
+    >>> [row for _, row in views['v3'].iterrows()]
+    [(1000,), (0,)]
+
+    With `parallel` > 1 and a session that has siblings (e.g. `DBSession.on_file`),
+    independent objects in each of `script.waves()` are created concurrently,
+    each on its own connection:
+
+    >>> from sqlite3 import connect
+    >>> from tempfile import TemporaryDirectory
+    >>> script = SqlScript('s2.sql', '''
+    ...     create table a as select x * 2 as y from t1;
+    ...     create table b as select x * 3 as z from t1;
+    ...     create view ab as select y, z from a cross join b;
+    ...     ''', [('a', ['t1']), ('b', ['t1']), ('ab', [])])
+    >>> with TemporaryDirectory() as tmp:
+    ...     ctx = DBSession.on_file(Path_T(tmp) / 'db', connect)
+    ...     views = create_objects(ctx, script, parallel=2, t1=t1)
+    ...     print([row for _, row in views['ab'].iterrows()])
+    ...     ctx.close()
+    [(2, 3)]
+    """
     # IDEA: use a contextmanager for temp views
+    inputs_digest = hashlib.sha1()
     for key, df in kwargs.items():
+        digest = df.fingerprint()
+        inputs_digest.update(f'{key}={digest};'.encode('utf-8'))
+        if spark.fingerprint(key) == digest:
+            log.info('%s: %s unchanged', script.name, key)
+            continue
         log.info('%s: %s = %s', script.name, key, df)
-        spark.load_data_frame(key, df)
+        if spark.profile is None:
+            spark.load_data_frame(key, df, digest)
+        else:
+            with spark.profile.tagged(script.name, None, key):
+                spark.load_data_frame(key, df, digest)
+    for key, col_lists in (indexes or {}).items():
+        for cols in col_lists:
+            spark.create_index(key, cols)
     provided = set(kwargs.keys())
-    out = {}
+    ddls = {}
+    digests = {}  # type: Dict[Name, str]
     for name, ddl, inputs in script.objects:
         missing = set(inputs) - provided
         if missing:
             raise TypeError(missing)
-        log.info('%s: create %s', script.name, name)
-        spark.sql(f'drop view if exists {name}')
+        ddls[name] = ddl
+    for wave in script.waves():
+        for name in wave:
+            h = inputs_digest.copy()
+            h.update(ddls[name].encode('utf-8'))
+            for dep in sorted(script.dag[name]):
+                h.update(digests[dep].encode('utf-8'))
+            digests[name] = h.hexdigest()
+        todo = [name for name in wave if spark.fingerprint(name) != digests[name]]
+        for name in set(wave) - set(todo):
+            log.info('%s: %s unchanged', script.name, name)
+        if parallel > 1 and len(todo) > 1 and spark.sibling_available():
+            with ThreadPoolExecutor(max_workers=parallel) as pool:
+                for _ in pool.map(lambda name: _create_on_sibling(spark, script, name, ddls[name],
+                                                                  digests[name]), todo):
+                    pass
+        else:
+            for name in todo:
+                _create(spark, script, name, ddls[name], digests[name])
+    return {name: spark.table(name) for name, _, _ in script.objects}
+
+
+def _create(spark: DBSession, script: SqlScript, name: str, ddl: SQL, digest: str) -> None:
+    log.info('%s: create %s', script.name, name)
+    kind = 'table' if 'table' in ddl.split('\n')[0].split() else 'view'
+    if spark.profile is None:
+        spark.sql(f'drop {kind} if exists {name}')
         spark.sql(ddl)
-        dft = spark.table(name)
-        out[name] = dft
-    return out
+    else:
+        line = SqlScript.statement_index(script.code)[name][0]
+        with spark.profile.tagged(script.name, line, name):
+            spark.sql(f'drop {kind} if exists {name}')
+            spark.sql(ddl)
+    spark.set_fingerprint(name, digest)
+
+
+def _create_on_sibling(spark: DBSession, script: SqlScript, name: str, ddl: SQL, digest: str) -> None:
+    sib = spark.sibling()
+    assert sib
+    sib.profile = spark.profile
+    try:
+        _create(sib, script, name, ddl, digest)
+    finally:
+        if sib is not spark:
+            sib.close()
 
 
 class MockCTX(DBSession):
     def __init__(self) -> None:
         self._tables = {}  # type: Dict[str, DataFrame]
+        self._fingerprints = {}  # type: Dict[str, str]
+
+    def fingerprint(self, name: str) -> Opt[str]:
+        return self._fingerprints.get(name)
 
-    def load_data_frame(self, k: str, v: tab.Relation) -> 'DataFrame':
+    def set_fingerprint(self, name: str, digest: str) -> None:
+        self._fingerprints[name] = digest
+
+    def load_data_frame(self, k: str, v: tab.Relation, digest: Opt[str] = None) -> 'DataFrame':
         df = self._tables[k] = MockDF(self, k)
+        self.set_fingerprint(k, digest or v.fingerprint())
         return df
 
     def table(self, k: str) -> DataFrame:
@@ -561,6 +1377,9 @@ class MockDF(DataFrame):
     def __repr__(self) -> str:
         return f'{self.__class__.__name__}({self.label})'
 
+    def fingerprint(self) -> str:
+        return self.label
+
 
 if __name__ == '__main__':
     def _script_io() -> None:
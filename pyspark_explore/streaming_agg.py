@@ -0,0 +1,381 @@
+"""streaming_agg -- constant-memory, mergeable aggregates for sqlite
+
+Each aggregate keeps a small state that can be saved as JSON text
+and merged with others, so that summaries of partitions (e.g. of a
+parallel load) combine exactly (Welford, MinMax) or within known error
+bounds (KLL quantiles, HyperLogLog distinct counts).
+
+    >>> from sql_script import DBSession
+    >>> spark = DBSession.in_memory()
+    >>> create_in(spark)
+    >>> import tabular as tab
+    >>> _ = spark.load_data_frame('t', tab.DataFrame.from_records(
+    ...     [dict(x=x, part=x % 2) for x in range(1, 1001)]))
+    >>> [row for _, row in spark.sql('''
+    ...     select round(stdev(x), 3), approx_distinct(x), approx_quantile(x, 0.5)
+    ...     from t''').iterrows()]
+    [(288.819, 995, 497.0)]
+
+The distinct count and median are estimates (of 1000 and 500).
+
+Per-partition states merge to the same results:
+
+    >>> [row for _, row in spark.sql('''
+    ...     select round(state_stdev(welford_merge(w)), 3), state_distinct(hll_merge(h))
+    ...     from (select welford_state(x) w, hll_state(x) h from t group by part)
+    ...     ''').iterrows()]
+    [(288.819, 995)]
+"""
+
+from typing import Callable, Dict, Generic, List, Optional as Opt, Type, TypeVar
+import hashlib
+import json
+import math
+
+Num = float
+S = TypeVar('S', bound='Sketch')
+
+
+class Sketch:
+    """Mergeable summary of a stream of values, with JSON state.
+    """
+    kind = 'sketch'
+
+    def step(self, x: object) -> None:
+        raise NotImplementedError
+
+    def merge(self: S, other: S) -> S:
+        raise NotImplementedError
+
+    def to_json(self) -> Dict[str, object]:
+        raise NotImplementedError
+
+    @classmethod
+    def from_json(cls: Type[S], obj: Dict[str, object]) -> S:
+        raise NotImplementedError
+
+    def state(self) -> str:
+        return json.dumps(dict(self.to_json(), kind=self.kind))
+
+    @classmethod
+    def from_state(cls: Type[S], state: str) -> S:
+        obj = json.loads(state)
+        if obj.pop('kind') != cls.kind:
+            raise ValueError(state[:40])
+        return cls.from_json(obj)
+
+
+class Welford(Sketch):
+    """Count, mean, and variance in one pass (Welford's algorithm).
+
+    >>> a, b = Welford(), Welford()
+    >>> for x in [2, 4, 4, 4]:
+    ...     a.step(x)
+    >>> for x in [5, 5, 7, 9]:
+    ...     b.step(x)
+    >>> m = Welford.from_state(a.state()).merge(b)
+    >>> m.n, m.mean, m.variance(sample=False), m.stdev(sample=False)
+    (8, 5.0, 4.0, 2.0)
+    """
+    kind = 'welford'
+
+    def __init__(self, n: int = 0, mean: Num = 0.0, m2: Num = 0.0) -> None:
+        self.n = n
+        self.mean = mean
+        self.m2 = m2
+
+    def step(self, x: object) -> None:
+        if x is None:
+            return
+        val = float(x)  # type: ignore
+        self.n += 1
+        delta = val - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (val - self.mean)
+
+    def merge(self, other: 'Welford') -> 'Welford':
+        n = self.n + other.n
+        if n == 0:
+            return Welford()
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.n / n
+        m2 = self.m2 + other.m2 + delta * delta * self.n * other.n / n
+        return Welford(n, mean, m2)
+
+    def variance(self, sample: bool = True) -> Opt[Num]:
+        dof = self.n - 1 if sample else self.n
+        return self.m2 / dof if dof > 0 else None
+
+    def stdev(self, sample: bool = True) -> Opt[Num]:
+        var = self.variance(sample)
+        return None if var is None else math.sqrt(var)
+
+    def to_json(self) -> Dict[str, object]:
+        return dict(n=self.n, mean=self.mean, m2=self.m2)
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, object]) -> 'Welford':
+        return cls(obj['n'], obj['mean'], obj['m2'])  # type: ignore
+
+
+class MinMax(Sketch):
+    """
+    >>> a = MinMax()
+    >>> for x in [3, 1, 2]:
+    ...     a.step(x)
+    >>> b = MinMax()
+    >>> b.step(7)
+    >>> m = a.merge(MinMax.from_state(b.state()))
+    >>> m.lo, m.hi
+    (1, 7)
+    """
+    kind = 'minmax'
+
+    def __init__(self, lo: object = None, hi: object = None) -> None:
+        self.lo = lo
+        self.hi = hi
+
+    def step(self, x: object) -> None:
+        if x is None:
+            return
+        if self.lo is None or x < self.lo:  # type: ignore
+            self.lo = x
+        if self.hi is None or x > self.hi:  # type: ignore
+            self.hi = x
+
+    def merge(self, other: 'MinMax') -> 'MinMax':
+        out = MinMax(self.lo, self.hi)
+        out.step(other.lo)
+        out.step(other.hi)
+        return out
+
+    def to_json(self) -> Dict[str, object]:
+        return dict(lo=self.lo, hi=self.hi)
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, object]) -> 'MinMax':
+        return cls(obj['lo'], obj['hi'])
+
+
+class KLL(Sketch):
+    """KLL quantile sketch (Karnin, Lang, Liberty 2016).
+
+    Space is O(k); rank error is roughly 1.7 / k, i.e. under 1% for the
+    default k=200. Compaction alternates which half it keeps rather
+    than flipping a coin, so results are reproducible. Values are
+    compared as numbers (Num), as in Welford.
+
+    >>> s = KLL(k=50)
+    >>> for x in range(10000):
+    ...     s.step(x)
+    >>> s.retained() < 500
+    True
+    >>> abs(s.quantile(0.5) - 5000) < 10000 * 3.4 / 50
+    True
+
+    Merging two halves is about as good as one pass over the whole:
+
+    >>> lo, hi = KLL(k=50), KLL(k=50)
+    >>> for x in range(5000):
+    ...     lo.step(x)
+    ...     hi.step(x + 5000)
+    >>> m = KLL.from_state(lo.state()).merge(hi)
+    >>> abs(m.quantile(0.9) - 9000) < 10000 * 3.4 / 50
+    True
+    """
+    kind = 'kll'
+
+    def __init__(self, k: int = 200, c: float = 2.0 / 3,
+                 compactors: Opt[List[List[Num]]] = None,
+                 flips: int = 0) -> None:
+        self.k = k
+        self.c = c
+        self.compactors = compactors or [[]]  # type: List[List[Num]]
+        self.flips = flips
+
+    def capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.c ** depth * self.k)) + 1
+
+    def retained(self) -> int:
+        return sum(len(items) for items in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self.capacity(level) for level in range(len(self.compactors)))
+
+    def step(self, x: object) -> None:
+        if x is None:
+            return
+        self.compactors[0].append(float(x))  # type: ignore
+        if self.retained() >= self._max_size():
+            self._compress()
+
+    def _compress(self) -> None:
+        for level, items in enumerate(self.compactors):
+            if len(items) >= self.capacity(level):
+                if level + 1 >= len(self.compactors):
+                    self.compactors.append([])
+                items.sort()
+                keep = items.pop() if len(items) % 2 else None
+                self.flips += 1
+                self.compactors[level + 1].extend(items[self.flips % 2::2])
+                items[:] = [] if keep is None else [keep]
+                break
+
+    def merge(self, other: 'KLL') -> 'KLL':
+        depth = max(len(self.compactors), len(other.compactors))
+        compactors = [
+            (self.compactors[level] if level < len(self.compactors) else []) +
+            (other.compactors[level] if level < len(other.compactors) else [])
+            for level in range(depth)]
+        out = KLL(self.k, self.c, compactors, self.flips + other.flips)
+        while out.retained() >= out._max_size():
+            out._compress()
+        return out
+
+    def quantile(self, q: float) -> Opt[Num]:
+        weighted = sorted((x, 2 ** level)
+                          for level, items in enumerate(self.compactors)
+                          for x in items)
+        if not weighted:
+            return None
+        total = sum(w for _, w in weighted)
+        target = q * total
+        seen = 0
+        for x, w in weighted:
+            seen += w
+            if seen >= target:
+                return x
+        return weighted[-1][0]
+
+    def to_json(self) -> Dict[str, object]:
+        return dict(k=self.k, c=self.c, compactors=self.compactors, flips=self.flips)
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, object]) -> 'KLL':
+        return cls(obj['k'], obj['c'], obj['compactors'], obj['flips'])  # type: ignore
+
+
+class HyperLogLog(Sketch):
+    """Approximate distinct count; standard error is about 1.04 / sqrt(2 ** p),
+    i.e. 1.6% for the default p=12 (4KB of registers).
+
+    >>> a, b = HyperLogLog(), HyperLogLog()
+    >>> for x in range(20000):
+    ...     (a if x % 2 else b).step(x % 15000)
+    >>> abs(a.merge(HyperLogLog.from_state(b.state())).count() - 15000) < 15000 * 3 * 0.0163
+    True
+    """
+    kind = 'hll'
+
+    def __init__(self, p: int = 12, registers: Opt[bytearray] = None) -> None:
+        self.p = p
+        self.registers = registers or bytearray(2 ** p)
+
+    def step(self, x: object) -> None:
+        if x is None:
+            return
+        h = int.from_bytes(hashlib.blake2b(repr(x).encode('utf-8'), digest_size=8).digest(), 'big')
+        ix = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[ix]:
+            self.registers[ix] = rank
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        if other.p != self.p:
+            raise ValueError((self.p, other.p))
+        return HyperLogLog(self.p, bytearray(max(r1, r2)
+                                             for r1, r2 in zip(self.registers, other.registers)))
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(estimate))
+
+    def to_json(self) -> Dict[str, object]:
+        return dict(p=self.p, registers=self.registers.hex())
+
+    @classmethod
+    def from_json(cls, obj: Dict[str, object]) -> 'HyperLogLog':
+        return cls(obj['p'], bytearray.fromhex(obj['registers']))  # type: ignore
+
+
+class _Agg(Generic[S]):
+    """Adapt a Sketch to the sqlite3 aggregate protocol."""
+    sketch_class = Sketch  # type: Type[Sketch]
+
+    def __init__(self) -> None:
+        self.sketch = self.sketch_class()
+
+    def step(self, x: object) -> None:
+        self.sketch.step(x)
+
+
+def _finisher(sketch_class: Type[Sketch],
+              finish: Callable[[Sketch], object]) -> Callable[[], object]:
+    class Agg(_Agg[Sketch]):
+        def finalize(self) -> object:
+            return finish(self.sketch)
+    Agg.sketch_class = sketch_class
+    return Agg
+
+
+def _merger(sketch_class: Type[Sketch]) -> Callable[[], object]:
+    class Merge:
+        def __init__(self) -> None:
+            self.sketch = sketch_class()
+
+        def step(self, state: Opt[str]) -> None:
+            if state is not None:
+                self.sketch = self.sketch.merge(sketch_class.from_state(state))
+
+        def finalize(self) -> str:
+            return self.sketch.state()
+    return Merge
+
+
+class _Quantile:
+    def __init__(self) -> None:
+        self.sketch = KLL()
+        self.q = 0.5
+
+    def step(self, x: object, q: float) -> None:
+        self.q = q
+        self.sketch.step(x)
+
+    def finalize(self) -> Opt[Num]:
+        return self.sketch.quantile(self.q)
+
+
+def create_in(spark: 'DBSession') -> None:  # type: ignore # noqa: F821
+    """Register aggregates and state accessors in a DBSession.
+
+    Aggregates: stdev, stddev_pop (as in data_char_sim.sql), variance, approx_quantile(x, q), approx_distinct;
+    {welford,minmax,kll,hll}_state(x) and {...}_merge(state).
+    Scalars: state_mean, state_stdev, state_min, state_max,
+    state_quantile(state, q), state_distinct.
+    """
+    spark.create_aggregate('stdev', 1, _finisher(Welford, lambda s: s.stdev()))  # type: ignore
+    spark.create_aggregate('stddev_pop', 1, _finisher(Welford, lambda s: s.stdev(sample=False)))  # type: ignore
+    spark.create_aggregate('variance', 1, _finisher(Welford, lambda s: s.variance()))  # type: ignore
+    spark.create_aggregate('approx_distinct', 1, _finisher(HyperLogLog, lambda s: s.count()))  # type: ignore
+    spark.create_aggregate('approx_quantile', 2, _Quantile)
+    for name, cls in [('welford', Welford), ('minmax', MinMax), ('kll', KLL), ('hll', HyperLogLog)]:
+        spark.create_aggregate(f'{name}_state', 1, _finisher(cls, lambda s: s.state()))
+        spark.create_aggregate(f'{name}_merge', 1, _merger(cls))
+
+    def accessor(cls: Type[S], get: Callable[[S], object]) -> Callable[[Opt[str]], object]:
+        return lambda state: None if state is None else get(cls.from_state(state))
+
+    spark.create_function('state_mean', 1, accessor(Welford, lambda s: s.mean if s.n else None))
+    spark.create_function('state_stdev', 1, accessor(Welford, lambda s: s.stdev()))
+    spark.create_function('state_min', 1, accessor(MinMax, lambda s: s.lo))
+    spark.create_function('state_max', 1, accessor(MinMax, lambda s: s.hi))
+    spark.create_function('state_distinct', 1, accessor(HyperLogLog, lambda s: s.count()))
+    spark.create_function('state_quantile', 2,
+                          lambda state, q: None if state is None else KLL.from_state(state).quantile(q))
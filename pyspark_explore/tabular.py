@@ -58,12 +58,14 @@ from abc import abstractmethod
 from pathlib import Path as Path_T
 import csv
 import datetime as dt
+import hashlib
 import itertools
 import json
 import logging
 
 Value = Union[str, int, dt.date]
 Row = Sequence[Opt[Value]]
+Batch = List[List[Opt[Value]]]  # column-major: one list per column
 DataType = Union[Literal['string'], Literal['number'], Literal['boolean'], Literal['date']]
 Column = TypedDict('Column', {
     'name': str,
@@ -99,6 +101,44 @@ class Relation:
     @abstractmethod
     def iterrows(self) -> Iterator[Tuple[int, Row]]: ...
 
+    def fingerprint(self) -> str:
+        '''Digest of schema and data; stable across processes (unlike hash()).
+
+        This reads every row, so it suits small in-memory relations;
+        relations backed by files or a database override it with
+        something cheaper (see file_fingerprint).
+
+        >>> df = DataFrame.from_records([dict(x=1, d=dt.date(2001, 1, 1))])
+        >>> df.fingerprint() == DataFrame.from_records([dict(x=1, d=dt.date(2001, 1, 1))]).fingerprint()
+        True
+        >>> df.fingerprint() == DataFrame.from_records([dict(x=2, d=dt.date(2001, 1, 1))]).fingerprint()
+        False
+        '''
+        h = hashlib.sha1(json.dumps(self.schema['columns'], sort_keys=True).encode('utf-8'))
+        for _, row in self.iterrows():
+            h.update(json.dumps(list(row), default=str).encode('utf-8'))
+        return h.hexdigest()
+
+    def iter_batches(self, n: int = 1000) -> Iterator[Batch]:
+        """Iterate over rows in batches of (up to) n rows, column-major.
+
+        >>> df = DataFrame.from_records([dict(x=i, y=str(i)) for i in range(5)])
+        >>> for batch in Relation.iter_batches(df, 2):
+        ...     print(batch)
+        [[0, 1], ['0', '1']]
+        [[2, 3], ['2', '3']]
+        [[4], ['4']]
+
+        Blank rows (e.g. at the end of a file) are skipped; in column-major
+        form, one would truncate the whole batch.
+        """
+        rows = (row for _, row in self.iterrows() if row)
+        while True:
+            chunk = list(itertools.islice(rows, n))
+            if not chunk:
+                break
+            yield [list(col) for col in zip(*chunk)]
+
     def save_meta(self, dest: Path_T) -> Path_T:
         mp = meta_path(dest)
         with mp.open('w') as mout:
@@ -108,8 +148,8 @@ class Relation:
     def to_csv(self, wr: TextIO) -> None:
         dest = csv.writer(wr)
         dest.writerow(self.columns)
-        for _, row in self.iterrows():
-            dest.writerow(row)
+        for batch in self.iter_batches():
+            dest.writerows(zip(*batch))
 
 
 class DataFrame(Relation):
@@ -127,6 +167,17 @@ class DataFrame(Relation):
         return ((cx, [row[ix] for ix in col_ixs])
                 for (cx, row) in enumerate(self._data))
 
+    def iter_batches(self, n: int = 1000) -> Iterator[Batch]:
+        """
+        >>> df = DataFrame.from_records([dict(x=i, y=str(i)) for i in range(5)])
+        >>> list(df.select('y').iter_batches(3))
+        [[['0', '1', '2']], [['3', '4']]]
+        """
+        data = self._data
+        for lo in range(0, len(data), n):
+            chunk = data[lo:lo + n]
+            yield [[row[ix] for row in chunk] for ix in self._col_ixs]
+
     @classmethod
     def from_columns(cls, seqs: Dict[str, 'Seq']) -> 'DataFrame':
         schema: Schema = {'columns': [
@@ -280,10 +331,16 @@ class DataFrame(Relation):
 
 
 def concat(dfs: Iterable[DataFrame]) -> DataFrame:
-    from functools import reduce
+    """
+    >>> df = DataFrame.from_records([dict(x=1), dict(x=2)])
+    >>> list(concat([df, df, df]).x.values)
+    [1, 2, 1, 2, 1, 2]
+    """
     dfs = iter(dfs)
     df0 = next(dfs)
-    data = reduce(lambda acc, next: acc + next, (df._data for df in dfs), df0._data)
+    data = list(df0._data)
+    for df in dfs:
+        data.extend(df._data)
     return DataFrame(data, schema=df0.schema)
 
 
@@ -291,6 +348,25 @@ def meta_path(path: Path_T) -> Path_T:
     return path.parent / (path.stem + '-metadata.json')
 
 
+def file_fingerprint(access: Path_T, *parts: str) -> str:
+    '''Digest of a file's path, size, and modification time (and any other parts),
+    without reading it.
+
+    >>> from tempfile import TemporaryDirectory
+    >>> with TemporaryDirectory() as tmp:
+    ...     f = Path_T(tmp) / 'a.txt'
+    ...     _ = f.write_text('abc')
+    ...     before = file_fingerprint(f)
+    ...     same, other = before == file_fingerprint(f), before == file_fingerprint(f, 'v2')
+    ...     _ = f.write_text('abcd')
+    ...     same, other, before == file_fingerprint(f)
+    (True, False, False)
+    '''
+    info = access.stat()
+    key = [str(access), str(info.st_size), str(info.st_mtime_ns)] + list(parts)
+    return hashlib.sha1(json.dumps(key).encode('utf-8')).hexdigest()
+
+
 def read_csv(path: Path_T,
              skiprows: int = 0,
              schema: Opt[Schema] = None) -> DataFrame:
@@ -67,18 +67,19 @@ from functools import reduce
 from gzip import GzipFile
 from importlib import resources as res
 from pathlib import Path as Path_T
-from sqlite3 import connect as connect_mem, PARSE_COLNAMES
-from statistics import stdev
+from sqlite3 import connect as connect_mem, Connection, PARSE_COLNAMES
 from subprocess import Popen as Popen_T, PIPE
 from sys import stderr
-from typing import Dict, List, Optional as Opt, Tuple
-from typing import ContextManager, Callable, Iterable, cast
+from typing import Any, Dict, List, Optional as Opt, Set, Tuple
+from typing import ContextManager, Callable, IO, Iterable, Iterator, cast
 from xml.etree import ElementTree as XML
 import datetime as dt
+import hashlib
 import itertools
 import json
 import logging
 import re
+import uuid
 
 # %% [markdown]
 # The tabular module provides a pandas-like DataFrame API using
@@ -92,6 +93,7 @@ import tabular as tab
 
 # %%
 from sql_script import SqlScript, DBSession as SparkSession_T, DataFrame, insert_stmt, create_objects
+import streaming_agg
 
 
 # %% [markdown] {"slideshow": {"slide_type": "slide"}}
@@ -106,6 +108,9 @@ import bc_qa
 # %% {"slideshow": {"slide_type": "fragment"}}
 import tumor_reg_ont as ont
 import heron_load
+from heron_staging import tumor_reg as seer_res
+from heron_staging.tumor_reg import seer_recode
+from heron_staging.tumor_reg import csschema_index
 
 
 # %% [markdown] {"slideshow": {"slide_type": "slide"}}
@@ -335,9 +340,10 @@ class TumorTableSpec:
                        [('pcornet_tumor_fields', ['tumor_item_type', 'ch10', 'item_codes'])])
 
     @classmethod
-    def fields(cls, spark: SparkSession_T) -> DataFrame:
+    def fields(cls, spark: SparkSession_T,
+               meta_cache: Opt[ont.MetaCache] = None) -> DataFrame:
         ch10 = tab.DataFrame(
-            ont.NAACCR_Layout.iter_description(),
+            ont.NAACCR_Layout.iter_description(meta_cache),
             schema={'columns': [
                 {'number': 1, 'name': 'naaccrNum', 'datatype': 'number', 'null': []},
                 {'number': 3, 'name': 'description', 'datatype': 'string', 'null': ['']}]}
@@ -345,7 +351,7 @@ class TumorTableSpec:
         views = create_objects(spark, cls.script,
                                tumor_item_type=ont.NAACCR_I2B2.tumor_item_type,
                                ch10=ch10,
-                               item_codes=ont.NAACCR_Layout.item_codes())
+                               item_codes=ont.NAACCR_Layout.item_codes(meta_cache))
         return list(views.values())[-1]
 
 
@@ -450,8 +456,10 @@ select * from seer_recode_concepts
 class NAACCR2:
     ns = {'n': 'http://naaccr.org/naaccrxml'}
 
-    s100x = XML.parse(GzipFile(fileobj=res.open_binary(  # type: ignore # typeshed/issues/2580  # noqa
-        naaccr_xml_samples, 'naaccr-xml-sample-v180-incidence-100.xml.gz')))
+    @ont._lazy
+    def s100x(cls) -> XML.ElementTree:
+        return XML.parse(GzipFile(fileobj=res.open_binary(  # type: ignore # typeshed/issues/2580  # noqa
+            naaccr_xml_samples, 'naaccr-xml-sample-v180-incidence-100.xml.gz')))
 
     @classmethod
     def s100t(cls) -> ContextManager[Path_T]:
@@ -475,7 +483,9 @@ def simple_schema(records: Iterable[Dict[str, str]], order: Dict[str, object],
 
 
 def tumorDF(doc: XML.ElementTree,
-            items: tab.DataFrame = ont.NAACCR_I2B2.tumor_item_type) -> tab.DataFrame:
+            items: Opt[tab.DataFrame] = None) -> tab.DataFrame:
+    if items is None:
+        items = ont.NAACCR_I2B2.tumor_item_type
     rownum = 0
     ns = NAACCR2.ns
 
@@ -592,6 +602,17 @@ class TextFile(tab.Relation):
         return zip(itertools.count(),
                    ([line] for line in self.__access.open().readlines()))
 
+    def fingerprint(self) -> str:
+        return tab.file_fingerprint(self.__access, *self.columns)
+
+    def iter_batches(self, n: int = 1000) -> Iterator[tab.Batch]:
+        with self.__access.open() as lines:
+            while True:
+                chunk = list(itertools.islice(lines, n))
+                if not chunk:
+                    break
+                yield [chunk]
+
 
 if IO_TESTING:
     with NAACCR2.s100t() as _tr_file:
@@ -603,20 +624,114 @@ else:
 _SQL('select * from s100t')
 
 
+class NAACCR_UDF:
+    """Deterministic SQL functions for decoding NAACCR flat file fields.
+
+    Blank fields are NULL:
+
+    >>> NAACCR_UDF.naaccr_code(' 01 '), NAACCR_UDF.naaccr_code('   '), NAACCR_UDF.naaccr_code(None)
+    ('01', None, None)
+
+    Numbers convert like `0 + x` in sqlite:
+
+    >>> NAACCR_UDF.naaccr_num('0012'), NAACCR_UDF.naaccr_num(' 1.5'), NAACCR_UDF.naaccr_num('12ab')
+    (12, 1.5, 12)
+
+    Dates are as from `date(...)`; partial or invalid dates are NULL:
+
+    >>> NAACCR_UDF.naaccr_date('20170301'), NAACCR_UDF.naaccr_date('201703  ')
+    ('2017-03-01', None)
+
+    The SEER site recode is compiled from seer_site_recode.txt (see seer_recode.Recoder):
+
+    >>> NAACCR_UDF.seer_site_recode('C500', '8500')
+    '26000'
+
+    Tumor keys are a 64-bit hash of the recordId parts, signed to fit
+    a sqlite (or Oracle number(19)) integer:
+
+    >>> NAACCR_UDF.tumor_key('0012345', '0001', '2017-03-01', '2017-05-02')
+    -1439379375626404082
+    """
+    @ont._lazy
+    def seer_rules(cls) -> List[seer_recode.Rule]:
+        return seer_recode.Rule.from_lines(
+            res.read_text(seer_res, 'seer_site_recode.txt').split('\n'))
+
+    @ont._lazy
+    def seer_recoder(cls) -> seer_recode.Recoder:
+        return seer_recode.Recoder(cls.seer_rules)
+
+    @staticmethod
+    def naaccr_code(value: Opt[str]) -> Opt[str]:
+        """code or text, trimmed"""
+        if value is None:
+            return None
+        return value.strip(' ') or None
+
+    _number = re.compile(r'\s*([+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)')
+
+    @classmethod
+    def naaccr_num(cls, value: Opt[str]) -> Opt[float]:
+        if value is None or not value.strip(' '):
+            return None
+        m = cls._number.match(value)
+        if not m:
+            return 0
+        txt = m.group(1)
+        num = float(txt)
+        return int(txt) if txt.lstrip('+-').isdigit() else num
+
+    @staticmethod
+    def naaccr_date(value: Opt[str]) -> Opt[str]:
+        if value is None or not value[:8].isdigit():
+            return None
+        try:
+            return dt.date(int(value[:4]), int(value[4:6]), int(value[6:8])).isoformat()
+        except ValueError:
+            return None
+
+    @classmethod
+    def seer_site_recode(cls, site: Opt[str], histology: Opt[str]) -> str:
+        return cls.seer_recoder(site, histology)
+
+    @staticmethod
+    def tumor_key(*parts: Opt[str]) -> int:
+        data = '\x1f'.join('' if part is None else str(part) for part in parts)
+        digest = hashlib.blake2b(data.encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    @classmethod
+    def create_in(cls, spark: SparkSession_T) -> None:
+        spark.create_function('naaccr_code', 1, cls.naaccr_code)
+        spark.create_function('naaccr_num', 1, cls.naaccr_num)
+        spark.create_function('naaccr_date', 1, cls.naaccr_date)
+        spark.create_function('seer_site_recode', 2, cls.seer_site_recode)
+        spark.create_function('tumor_key', -1, cls.tumor_key)
+
+
+if IO_TESTING:
+    NAACCR_UDF.create_in(_spark)
+
+
 def decode_valtypes(wrap: bool = True) -> Dict[str, Callable[[str], str]]:
-    def _to_date(col):
-        return f"""date(substr({col}, 1, 4) || '-' || coalesce(substr({col}, 5, 2), '01') || '-'
-                 || coalesce(substr({col}, 7, 2), '01'))"""
+    """SQL to decode fields by valtype_cd, using NAACCR_UDF functions.
+
+    >>> decode_valtypes()['D']('dateOfBirth')
+    'naaccr_date(dateOfBirth) as dateOfBirth'
+    """
+    def _to_date(col: str) -> str:
+        return f"naaccr_date({col})"
 
     def _to_text(col: str) -> str:
-        return f"trim({col})"  # ISSUE: left / right
+        return f"naaccr_code({col})"
 
     def _to_num(col: str) -> str:
-        return f"(0 + {col})"
+        return f"naaccr_num({col})"
 
-    def w(f):
-        def convert(col):
-            return f"case when trim({col}) > '' then {f(col)} end as {col}"
+    def w(f: Callable[[str], str]) -> Callable[[str], str]:
+        def convert(col: str) -> str:
+            return f"{f(col)} as {col}"
         return convert
 
     if wrap:
@@ -715,12 +830,14 @@ class TumorTable:
             out.write(repl.code)
 
     @classmethod
-    def load_flat_file(cls, spark: SparkSession_T, tr_file: Path_T):
+    def load_flat_file(cls, spark: SparkSession_T, tr_file: Path_T,
+                       keys: Opt['KeyCheck'] = None):
+        NAACCR_UDF.create_in(spark)
         lines = TextFile.simple(tr_file)
         sql_objects = ont.create_objects(spark, cls.script,
                                          naaccr_lines=lines)
         eav = spark.load_data_frame('tumor_item_value',
-                                    TumorEAV(lambda: tr_file.open().readlines()))
+                                    TumorEAV(lambda: tr_file.open().readlines(), keys=keys, source=tr_file))
         return dict(sql_objects, tumor_item_value=eav)
 
 
@@ -761,6 +878,37 @@ if IO_TESTING:
 _SQL('select * from naaccr_fields limit 10')
 
 
+# %%
+def naaccr_trim(data: DataFrame) -> DataFrame:
+    """Trim fields; blank fields are NULL, as when decoding with LayoutRegistry.
+
+    >>> from sql_script import DBSession
+    >>> ctx = DBSession.in_memory()
+    >>> raw = ctx.sql("select '01 ' as tumorRecordNumber, '    ' as primarySite")
+    >>> list(naaccr_trim(raw).iterrows())
+    [(0, ('01', None))]
+    """
+    NAACCR_UDF.create_in(data._ctx)
+    cols = [f'naaccr_code({col}) as {col}' for col in data.columns]
+    return data._ctx.sql(f'select {", ".join(cols)} from {data.table}')
+
+
+def naaccr_dates(data: DataFrame, date_cols: List[str]) -> DataFrame:
+    """Decode date fields (yyyymmdd) to ISO dates; partial dates
+    (yyyy, yyyymm) are the first of the year or month.
+
+    >>> from sql_script import DBSession
+    >>> ctx = DBSession.in_memory()
+    >>> raw = ctx.sql("select '01' as x, '2019' as dateOfDiagnosis, '20170332' as dateOfBirth")
+    >>> list(naaccr_dates(raw, ['dateOfDiagnosis', 'dateOfBirth']).iterrows())
+    [(0, ('01', '2019-01-01', None))]
+    """
+    NAACCR_UDF.create_in(data._ctx)
+    cols = [f"naaccr_date(substr({col} || '0101', 1, 8)) as {col}" if col in date_cols else col
+            for col in data.columns]
+    return data._ctx.sql(f'select {", ".join(cols)} from {data.table}')
+
+
 # %% [markdown] {"slideshow": {"slide_type": "slide"}}
 # ## Patients, Tumors, Unique key columns
 #
@@ -802,6 +950,181 @@ IO_TESTING and _to_pd(
          _key1)
 ).set_index(_key1).head(10)
 
+# %% [markdown]
+# Rather than find duplicates after the fact, we can check keys as records stream by:
+
+
+# %%
+class DuplicateKeyError(ValueError):
+    pass
+
+
+class _Bloom:
+    """Fixed-size set membership with false positives but no false negatives."""
+    def __init__(self, bits: int, hashes: int = 4) -> None:
+        self.bits = bits
+        self.hashes = hashes
+        self.__array = bytearray((bits + 7) // 8)
+
+    def _ixs(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8 * self.hashes).digest()
+        for i in range(self.hashes):
+            yield int.from_bytes(digest[i * 8:(i + 1) * 8], 'big') % self.bits
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.__array[ix >> 3] & (1 << (ix & 7)) for ix in self._ixs(key))
+
+    def add(self, key: str) -> None:
+        for ix in self._ixs(key):
+            self.__array[ix >> 3] |= 1 << (ix & 7)
+
+
+class KeyCheck:
+    r"""Check uniqueness of record keys as flat file lines are extracted.
+
+    Keys are fixed-width spans of each line; offsets are in bytes from
+    the start of the file (given `encoding` and that lines include
+    their line endings, as from readlines()).
+
+    >>> lines = ['P1T1 20190101\n', 'P2T1 20190101\n', 'P1T1 20190301\n', 'P1T1 20190201\n']
+    >>> check = KeyCheck([slice(0, 2), slice(2, 4)], slice(5, 13))
+    >>> list(check.records(lambda: lines))
+    Traceback (most recent call last):
+      ...
+    tumor_reg_data.DuplicateKeyError: duplicate key 'P1|T1' at byte offsets [0, 28]
+
+    The `latest` policy keeps the record last changed (per `order_span`;
+    on ties, the one later in the file), using a key-only pass first:
+
+    >>> check = KeyCheck([slice(0, 2), slice(2, 4)], slice(5, 13), policy='latest')
+    >>> [(offset, line[:13]) for offset, _ix, line in check.records(lambda: lines)]
+    [(14, 'P2T1 20190101'), (28, 'P1T1 20190301')]
+    >>> check.dups
+    {'P1|T1': [0, 28, 42]}
+
+    `disambiguate` keeps all records, numbering repeats of a key:
+
+    >>> check = KeyCheck([slice(0, 2), slice(2, 4)], policy='disambiguate')
+    >>> [(offset, ix) for offset, ix, _line in check.records(lambda: lines)]
+    [(0, 0), (14, 0), (28, 1), (42, 2)]
+
+    For huge files, a Bloom filter pass finds candidate keys so that
+    only those are tracked exactly:
+
+    >>> check = KeyCheck([slice(0, 2), slice(2, 4)], policy='disambiguate', bloom_bits=1 << 16)
+    >>> [(offset, ix) for offset, ix, _line in check.records(lambda: lines)]
+    [(0, 0), (14, 0), (28, 1), (42, 2)]
+
+    Each pass starts over; `dups` is from the latest pass:
+
+    >>> [(offset, ix) for offset, ix, _line in check.records(lambda: lines)]
+    [(0, 0), (14, 0), (28, 1), (42, 2)]
+    >>> check.dups
+    {'P1|T1': [0, 28, 42]}
+
+    With or without a check, `lines` gives (repeat number, line) pairs:
+
+    >>> [(ix, line[:4]) for ix, line in KeyCheck.lines(check, lambda: lines)]
+    [(0, 'P1T1'), (0, 'P2T1'), (1, 'P1T1'), (2, 'P1T1')]
+    >>> [(ix, line[:4]) for ix, line in KeyCheck.lines(None, lambda: lines[:2])]
+    [(0, 'P1T1'), (0, 'P2T1')]
+    """
+    policies = ('fail', 'latest', 'disambiguate')
+
+    def __init__(self, key_spans: List[slice], order_span: Opt[slice] = None,
+                 policy: str = 'fail', bloom_bits: int = 0, encoding: str = 'utf-8') -> None:
+        if policy not in self.policies:
+            raise ValueError(f'policy must be one of {self.policies}: {policy}')
+        if policy == 'latest' and order_span is None:
+            raise ValueError('latest policy needs order_span')
+        self.key_spans = key_spans
+        self.order_span = order_span
+        self.policy = policy
+        self.bloom_bits = bloom_bits
+        self.encoding = encoding
+        self.dups: Dict[str, List[int]] = {}
+
+    @classmethod
+    def for_items(cls, index: ont.ItemIndex,
+                  key_items: List[str] = ['patientSystemIdHosp', 'tumorRecordNumber'],
+                  order_item: str = 'dateCaseLastChanged',
+                  **kwargs: Any) -> 'KeyCheck':
+        def span(naaccrId: str) -> slice:
+            item = index.by_id[naaccrId]
+            return slice(item['startColumn'] - 1, item['startColumn'] - 1 + item['length'])
+        return cls([span(i) for i in key_items], span(order_item), **kwargs)
+
+    def key(self, line: str) -> str:
+        return '|'.join(line[span].strip() for span in self.key_spans)
+
+    def _offsets(self, lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        offset = 0
+        for line in lines:
+            yield offset, line
+            offset += len(line.encode(self.encoding))
+
+    def _candidates(self, get_lines: Callable[[], Iterable[str]]) -> Opt[Set[str]]:
+        if not self.bloom_bits:
+            return None
+        bloom, found = _Bloom(self.bloom_bits), set()
+        for line in get_lines():
+            key = self.key(line)
+            if key in bloom:
+                found.add(key)  # repeated, or a false positive
+            else:
+                bloom.add(key)
+        log.info('KeyCheck: %d candidate duplicate keys', len(found))
+        return found
+
+    def _latest(self, get_lines: Callable[[], Iterable[str]],
+                tracked: Callable[[str], bool]) -> Dict[str, int]:
+        order_span = cast(slice, self.order_span)
+        best: Dict[str, Tuple[str, int]] = {}
+        qty: Dict[str, int] = {}
+        for offset, line in self._offsets(get_lines()):
+            key = self.key(line)
+            if tracked(key):
+                qty[key] = qty.get(key, 0) + 1
+                best[key] = max(best.get(key, ('', -1)), (line[order_span].strip(), offset))
+        return {key: offset for key, (_, offset) in best.items() if qty[key] > 1}
+
+    def records(self, get_lines: Callable[[], Iterable[str]]) -> Iterator[Tuple[int, int, str]]:
+        """Generate (byte offset, repeat number, line) for records to keep, per policy.
+
+        Repeated keys are recorded in `dups`, with the offsets of all their records.
+        get_lines is called again for each extra pass (Bloom filter, latest).
+        """
+        self.dups = {}
+        candidates = self._candidates(get_lines)
+        tracked = (lambda key: True) if candidates is None else candidates.__contains__
+        keep = self._latest(get_lines, tracked) if self.policy == 'latest' else {}
+        first: Dict[str, int] = {}
+        for offset, line in self._offsets(get_lines()):
+            key = self.key(line)
+            repeat = 0
+            if tracked(key):
+                if key in first:
+                    offsets = self.dups.setdefault(key, [first[key]])
+                    offsets.append(offset)
+                    repeat = len(offsets) - 1
+                    if self.policy == 'fail':
+                        raise DuplicateKeyError(f'duplicate key {key!r} at byte offsets {offsets}')
+                else:
+                    first[key] = offset
+            if key in keep and keep[key] != offset:
+                continue
+            yield offset, repeat, line
+        if self.dups:
+            log.warning('KeyCheck: %d duplicate keys (policy: %s)', len(self.dups), self.policy)
+
+    @staticmethod
+    def lines(keys: Opt['KeyCheck'], get_lines: Callable[[], Iterable[str]]) -> Iterator[Tuple[int, str]]:
+        """Generate (repeat number, line) for lines to keep, per keys if any."""
+        if keys is None:
+            return ((0, line) for line in get_lines())
+        return ((repeat, line) for _offset, repeat, line in keys.records(get_lines))
+
+
 # %%
 # logging.getLogger('sql_script').setLevel(logging.DEBUG)
 
@@ -837,21 +1160,55 @@ class TumorKeys:
                       extra: List[str] = ['dateOfDiagnosis',
                                           'dateCaseCompleted'],
                       # keep recordId length consistent
-                      extra_default: Opt[str] = None) -> DataFrame:
+                      extra_default: Opt[str] = None,
+                      key_name: str = 'tumor_key') -> DataFrame:
+        """Add recordId (readable) and tumor_key (integer; for joins, sorting, and indexes).
+
+        tumor_key is NAACCR_UDF.tumor_key of the same parts as recordId;
+        see check_tumor_key for collisions. Dates are ISO text, as from
+        naaccr_dates. The function is registered in the data's session,
+        so a fresh one will do:
+
+        >>> from sql_script import DBSession
+        >>> ctx = DBSession.in_memory()
+        >>> tumors = ctx.sql('''select '0012345' as patientSystemIdHosp, '0001' as tumorRecordNumber,
+        ...                            '2017-03-01' as dateOfDiagnosis, '2017-05-02' as dateCaseCompleted''')
+        >>> tumors = TumorKeys.with_tumor_id(tumors)
+        >>> list(tumors.select('recordId', 'tumor_key').iterrows())
+        [(0, ('001234500012017-03-012017-05-02', -1439379375626404082))]
+        """
+        NAACCR_UDF.create_in(data._ctx)
         # ISSUE: performance: add encounter_num column here?
         if extra_default is None:
             extra_default = '0000-00-00'
-        typed = lambda n: f'"{n} [date]"' if n.startswith('date') else n
-        extra_col = ' || '.join(f"coalesce({typed(col)}, '{extra_default}')" for col in extra)
-        id_col = 'patientSystemIdHosp || tumorRecordNumber || ' + extra_col
-        log.info('@@@id_col: %s', id_col)
-        return data.withColumn(name, id_col)
+        extra_parts = [f"coalesce({col}, '{extra_default}')" for col in extra]
+        id_col = 'patientSystemIdHosp || tumorRecordNumber || ' + ' || '.join(extra_parts)
+        key_col = f"tumor_key(patientSystemIdHosp, tumorRecordNumber, {', '.join(extra_parts)})"
+        return data.withColumn(name, id_col).withColumn(key_name, key_col)
+
+    @classmethod
+    def check_tumor_key(cls, tumors: DataFrame,
+                        key_col: str = 'tumor_key',
+                        id_col: str = 'recordId') -> DataFrame:
+        """Fail if two distinct recordIds hash to the same tumor_key.
+
+        At 64 bits, the chance of any collision among a million tumors is
+        about 3e-8, but a collision would silently merge two encounters.
+        """
+        collisions = tumors._ctx.sql(f'''
+            select {key_col}, count(distinct {id_col}) qty from {tumors.table}
+            group by {key_col}
+            having count(distinct {id_col}) > 1
+        ''')
+        for _, [key, qty] in collisions.iterrows():
+            raise ValueError(f'{key_col} collision: {key} for {qty} distinct {id_col}')
+        return tumors
 
     @classmethod
     def with_rownum(cls, tumors: DataFrame,
                     start: int = 1,
                     new_col: str = 'encounter_num',
-                    key_col: str = 'recordId') -> DataFrame:
+                    key_col: str = 'tumor_key') -> DataFrame:
         # ISSUE: deid encounter_num further?
         tumors = tumors.withColumn(
             new_col,
@@ -889,6 +1246,110 @@ class TumorKeys:
         return out
 
 
+class EncounterNums:
+    """Persistent tumor_key -> encounter_num mapping, kept in a sqlite file.
+
+    Numbers are allocated only for tumors not seen before, so they stay
+    stable from one extract to the next (unlike TumorKeys.with_rownum).
+
+    >>> import sqlite3, tempfile
+    >>> from pathlib import Path
+    >>> tmp = tempfile.TemporaryDirectory()
+    >>> enc = EncounterNums(Path(tmp.name) / 'enc.db', sqlite3.connect, start=1000)
+    >>> enc.allocate([(30, 'r30'), (10, 'r10')])
+    {10: 1000, 30: 1001}
+
+    Next month, one tumor is new:
+
+    >>> enc.allocate([(10, 'r10'), (20, 'r20'), (30, 'r30')])
+    {10: 1000, 20: 1002, 30: 1001}
+    >>> enc.lookup([20, 40])
+    {20: 1002}
+
+    An empty extract gets an empty mapping:
+
+    >>> from sql_script import DBSession
+    >>> ctx = DBSession.in_memory()
+    >>> none = ctx.sql("select 1 as tumor_key, 'r1' as recordId where 1 = 0")
+    >>> list(enc.with_encounter_num(none).iterrows())
+    []
+    >>> tmp.cleanup()
+    """
+    table_name = 'tumor_encounter'
+
+    def __init__(self, db: Path_T, connect: Callable[..., Connection],
+                 start: int = 1) -> None:
+        self.__db = db
+        self.__connect = connect
+        self.start = start
+
+    def _conn(self) -> Connection:
+        conn = self.__connect(str(self.__db), timeout=30.0)
+        conn.execute(f'''create table if not exists {self.table_name} (
+                           tumor_key integer primary key,
+                           recordId text,
+                           encounter_num integer not null unique)''')
+        conn.execute('create temporary table if not exists incoming (tumor_key integer primary key, recordId text)')
+        return conn
+
+    def _stage(self, conn: Connection, tumors: Iterable[Tuple[int, Opt[str]]]) -> None:
+        conn.execute('delete from incoming')
+        conn.executemany('insert or ignore into incoming (tumor_key, recordId) values (?, ?)', tumors)
+
+    def _found(self, conn: Connection) -> Dict[int, int]:
+        return dict(conn.execute(f'''
+            select i.tumor_key, te.encounter_num
+            from incoming i join {self.table_name} te on te.tumor_key = i.tumor_key
+            order by i.tumor_key'''))
+
+    def allocate(self, tumors: Iterable[Tuple[int, Opt[str]]]) -> Dict[int, int]:
+        """Number unseen tumors (after the highest number so far) and map all of them.
+
+        tumors are (tumor_key, recordId) pairs.
+        """
+        conn = self._conn()
+        try:
+            with conn:
+                self._stage(conn, tumors)
+                [[next_num]] = conn.execute(f'select coalesce(max(encounter_num) + 1, ?) from {self.table_name}',
+                                            (self.start,))
+                added = conn.execute(f'''
+                    insert into {self.table_name} (tumor_key, recordId, encounter_num)
+                    select tumor_key, recordId, ? + row_number() over (order by tumor_key) - 1
+                    from incoming i
+                    where not exists (select 1 from {self.table_name} te where te.tumor_key = i.tumor_key)
+                    order by tumor_key''', (next_num,)).rowcount
+                log.info('%s: %d new encounter_num from %d', self.table_name, added, next_num)
+                return self._found(conn)
+        finally:
+            conn.close()
+
+    def lookup(self, tumor_keys: Iterable[int]) -> Dict[int, int]:
+        """Bulk lookup; unknown keys are left out."""
+        conn = self._conn()
+        try:
+            with conn:
+                self._stage(conn, ((key, None) for key in tumor_keys))
+                return self._found(conn)
+        finally:
+            conn.close()
+
+    def with_encounter_num(self, tumors: DataFrame,
+                           new_col: str = 'encounter_num',
+                           key_col: str = 'tumor_key',
+                           id_col: str = 'recordId') -> DataFrame:
+        """Allocate for tumors and join encounter_num; cf. TumorKeys.with_rownum."""
+        pairs = tumors.select(key_col, id_col).iterrows()
+        nums = self.allocate((cast(int, key), cast(Opt[str], record_id)) for _, [key, record_id] in pairs)
+        schema: tab.Schema = {'columns': [
+            {'number': 1, 'name': key_col, 'datatype': 'number', 'null': []},
+            {'number': 2, 'name': new_col, 'datatype': 'number', 'null': []}]}
+        enc = tumors._ctx.load_data_frame(self.table_name, tab.DataFrame(nums.items(), schema))
+        return tumors._ctx.sql(f'''
+            select t.*, enc.{new_col} from {tumors.table} t
+            join {enc.table} enc on enc.{key_col} = t.{key_col}''')
+
+
 # pat_tmr.cache()
 if IO_TESTING:
     _pat_tmr = TumorKeys.with_rownum(TumorKeys.with_tumor_id(
@@ -931,34 +1392,105 @@ class TumorEAV(tab.Relation):
     0,00000010,1951-04-05,2017-10-19,,,2017-10-19,censusTrCertainty2010,367,False,@,9,,,
     0,00000010,1951-04-05,2017-10-19,,,2017-10-19,maritalStatusAtDx,150,False,@,5,,,
     ...
+
+    Given a layout registry, each record is decoded by the layout for
+    its own naaccrRecordVersion and record type:
+
+    >>> r = TumorEAV(lambda: ont._with_path(NAACCR2.s100t(), lambda p: p.open().readlines()),
+    ...              registry=ont.NAACCR1.registry)
+    >>> r.to_csv(stdout)  # doctest: +NORMALIZE_WHITESPACE +ELLIPSIS
+    tumor_id,patientIdNumber,dateOfBirth,dateOfDiagnosis,...,naaccrNum,identified_only,valtype_cd,code_value,numeric_value,date_value,text_value
+    0,00000010,1951-04-05,2017-10-19,,,2017-10-19,recordType,10,False,@,I,,,
+    0,00000010,1951-04-05,2017-10-19,,,2017-10-19,naaccrRecordVersion,50,False,@,180,,,
+    ...
     """
-    def __init__(self, get_lines: Callable[[], Iterable[str]]):
+    def __init__(self, get_lines: Callable[[], Iterable[str]],
+                 registry: Opt[ont.LayoutRegistry] = None,
+                 keys: Opt[KeyCheck] = None,
+                 source: Opt[Path_T] = None):
+        """
+        @param source: file that get_lines reads, if any, for a cheap fingerprint
+        """
         schema = tab.DataFrame.from_records([TumorTable.eav_value_example]).schema
         tab.Relation.__init__(self, schema)
         self.__get = get_lines
+        self.__registry = registry
+        self.__keys = keys
+        self.__source = source
 
-    itemDefs = (tab.DataFrame.from_records(ont.NAACCR_Layout.fields)
+    def fingerprint(self) -> str:
+        """Fingerprint of the source file and how it's decoded; without a
+        source, content is unknown, so the fingerprint is fresh each time.
+        """
+        if self.__source is None:
+            return uuid.uuid4().hex
+        keys = self.__keys
+        return tab.file_fingerprint(
+            self.__source, 'registry' if self.__registry else 'layout',
+            '' if keys is None else repr((keys.key_spans, keys.order_span, keys.policy)))
+
+    def _lines(self) -> Iterable[str]:
+        # tumor_id numbers kept records, so repeats of a key are already distinct tumors
+        return (line for _repeat, line in KeyCheck.lines(self.__keys, self.__get))
+
+    @ont._lazy
+    def itemDefs(cls) -> tab.DataFrame:
+        return (tab.DataFrame.from_records(ont.NAACCR_Layout.fields)
                 .select('naaccr-item-num', 'start', 'length')
                 .withColumnRenamed('naaccr-item-num', 'naaccrNum')
                 .merge(ont.NAACCR_I2B2.tumor_item_type
                        .select('naaccrNum', 'naaccrId', 'valtype_cd')))
 
-    def iterrows(self):
-        itemDefs = self.itemDefs
-        entityItemIds = list(TumorTable.eav_entity_example.keys())
-        entityDefs = itemDefs[itemDefs.naaccrId.isin(entityItemIds)]
-        entity_schema = tab.DataFrame.from_records([TumorTable.eav_entity_example]).drop('tumor_id').schema
-        obs_ix = 0
+    @classmethod
+    def _value(cls, v: str, valtype_cd: str) -> List[Opt[tab.Value]]:
         to_date = tab.Seq.decoders['date']
         to_num = tab.Seq.decoders['number']
 
-        def eat_ex(thunk):
+        def eat_ex(thunk: Callable[[], tab.Value]) -> Opt[tab.Value]:
             try:
                 return thunk()
             except ValueError:
                 return None
 
-        for tumor_id, line in enumerate(self.__get()):
+        code_value = v if valtype_cd == '@' else None
+        numeric_value = eat_ex(lambda: to_num(v)) if valtype_cd.startswith('N') else None
+        date_value = eat_ex(lambda: to_date(v)) if valtype_cd == 'D' else None
+        text_value = v if valtype_cd.startswith('T') else None
+        return [code_value, numeric_value, date_value, text_value]
+
+    def iterrows(self) -> Iterator[Tuple[int, tab.Row]]:
+        if self.__registry:
+            return self._iter_registry(self.__registry)
+        return self._iter_layout()
+
+    def _iter_registry(self, registry: ont.LayoutRegistry) -> Iterator[Tuple[int, tab.Row]]:
+        entity_schema = tab.DataFrame.from_records([TumorTable.eav_entity_example]).drop(['tumor_id']).schema
+        valtypes = {cast(int, num): cast(str, ty) for _, [num, ty] in
+                    ont.NAACCR_I2B2.tumor_item_type.select('naaccrNum', 'valtype_cd').iterrows()}
+        obs_ix = 0
+        for tumor_id, (_version, _recordType, values) in enumerate(registry.decode_lines(self._lines())):
+            byId = {item['naaccrId']: v for item, v in values}
+            entity: List[Opt[tab.Value]] = [tumor_id]
+            entity += [
+                tab.Seq.decoders[col['datatype']](byId[col['name']]) if col['name'] in byId else None
+                for col in entity_schema['columns']]
+            for item, v in values:
+                valtype_cd = valtypes.get(item['naaccrNum'])
+                if valtype_cd is None:
+                    continue
+                attribute: List[Opt[tab.Value]] = [
+                    item['naaccrId'], item['naaccrNum'], valtype_cd.endswith('i'), valtype_cd]
+                yield obs_ix, entity + attribute + self._value(v, valtype_cd)
+                obs_ix += 1
+
+    def _iter_layout(self) -> Iterator[Tuple[int, tab.Row]]:
+        itemDefs = self.itemDefs
+        entityItemIds = list(TumorTable.eav_entity_example.keys())
+        entityDefs = itemDefs[itemDefs.naaccrId.isin(entityItemIds)]
+        entity_schema = tab.DataFrame.from_records([TumorTable.eav_entity_example]).drop('tumor_id').schema
+        obs_ix = 0
+
+        for tumor_id, line in enumerate(self._lines()):
             entity_raw = [
                 line[start - 1:start - 1 + length].strip()
                 for _, [_num, start, length, naaccrId, valtype_cd] in entityDefs.iterrows()]
@@ -974,12 +1506,7 @@ class TumorEAV(tab.Relation):
                 if v > '':
                     identifier_only = valtype_cd.endswith('i')
                     attribute = [naaccrId, naaccrNum, identifier_only, valtype_cd]
-                    code_value = v if valtype_cd == '@' else None
-                    numeric_value = eat_ex(lambda: to_num(v)) if valtype_cd.startswith('N') else None
-                    date_value = eat_ex(lambda: to_date(v)) if valtype_cd == 'D' else None
-                    text_value = v if valtype_cd.startswith('T') else None
-                    value = [code_value, numeric_value, date_value, text_value]
-                    yield obs_ix, entity + attribute + value
+                    yield obs_ix, entity + attribute + self._value(v, valtype_cd)
                     obs_ix += 1
                     if (obs_ix % 5000 == 0):
                         log.info('EAV tumor_id: %d obs_ix: %d', tumor_id, obs_ix)
@@ -990,30 +1517,57 @@ _SQL('select * from section_all where date_value is not null order by tumor_id,
 
 
 # %% {"slideshow": {"slide_type": "skip"}}
+def stack_obs(data: DataFrame, item_ty: tab.Relation,
+              key_cols: Opt[List[str]] = None,
+              value_col: str = 'value') -> DataFrame:
+    """Un-pivot data to key_cols, naaccrId, value_col: one row per
+    non-NULL field among item_ty's naaccrIds.
+
+    >>> from sql_script import DBSession
+    >>> ctx = DBSession.in_memory()
+    >>> data = ctx.sql("select 'p1' as k, 'C500' as primarySite, null as vitalStatus")
+    >>> ty = tab.DataFrame.from_records([dict(naaccrId='primarySite'), dict(naaccrId='vitalStatus')])
+    >>> list(stack_obs(data, ty, ['k']).iterrows())
+    [(0, ('p1', 'primarySite', 'C500'))]
+    """
+    if key_cols is None:
+        key_cols = TumorKeys.key4 + TumorKeys.dtcols
+    ids = [naaccrId for _, [naaccrId] in item_ty.select('naaccrId').iterrows()
+           if naaccrId in data.columns]
+    cases = ' '.join(f"when '{naaccrId}' then d.{naaccrId}" for naaccrId in ids)
+    ty = ', '.join(f"('{naaccrId}')" for naaccrId in ids)
+    keys = ', '.join(f'd.{col}' for col in key_cols)
+    return data._ctx.sql(f'''
+      select * from (
+        select {keys}, ty.column1 as naaccrId, case ty.column1 {cases} end as {value_col}
+        from {data.table} d cross join (values {ty}) ty
+      ) obs
+      where {value_col} is not null
+    ''')
+
+
 class ItemObs:
     script = SqlScript('naaccr_txform.sql',
                        res.read_text(heron_load, 'naaccr_txform.sql'),
                        [
-                           ('tumor_item_value', ['naaccr_obs_raw']),
-                           ('tumor_reg_facts', ['record_layout', 'section']),
+                           ('tumor_item_value', ['naaccr_obs_raw', 'tumor_item_type']),
+                           ('tumor_reg_facts', []),
                        ])
 
-    extract_id_view = 'naaccr_extract_id'
-
     @classmethod
     def make(cls, spark: SparkSession_T, extract: DataFrame) -> DataFrame:
-        item_ty = spark.createDataFrame(ont.NAACCR_I2B2.tumor_item_type)
+        item_ty = ont.NAACCR_I2B2.tumor_item_type
 
-        raw_obs = TumorKeys.with_tumor_id(naaccr_dates(  # noqa @@@
-            stack_obs(extract, item_ty), # noqa @@@
+        raw_obs = TumorKeys.with_tumor_id(naaccr_dates(
+            stack_obs(naaccr_trim(extract), item_ty),
             TumorKeys.dtcols))
 
         views = ont.create_objects(
             spark, cls.script,
+            indexes={'naaccr_obs_raw': [['naaccrId']],
+                     'tumor_item_type': [['naaccrId']]},
             naaccr_obs_raw=raw_obs,
-            # ISSUE: refactor item_views_in
-            record_layout=spark.createDataFrame(ont.NAACCR_Layout.fields),
-            section=spark.createDataFrame(ont.NAACCR_I2B2.per_section))
+            tumor_item_type=item_ty)
 
         return list(views.values())[-1]
 
@@ -1021,10 +1575,8 @@ class ItemObs:
     def make_extract_id(cls,
                         spark: SparkSession_T,
                         extract: DataFrame) -> DataFrame:
-        extract_id = TumorKeys.with_tumor_id(
-            naaccr_dates(extract, TumorKeys.dtcols))  # noqa @@@
-        extract_id.createOrReplaceTempView(cls.extract_id_view)
-        return spark.table(cls.extract_id_view)
+        return TumorKeys.with_tumor_id(
+            naaccr_dates(naaccr_trim(extract), TumorKeys.dtcols))
 
 
 # %% {"slideshow": {"slide_type": "-"}}
@@ -1060,23 +1612,6 @@ IO_TESTING and ItemObs.make_extract_id(_spark, _extract).limit(5).toPandas()
 # ### Coded Concepts from Data Summary
 
 # %%
-class StDevAgg:
-    def __init__(self):
-        self.x = []
-
-    def step(self, val):
-        self.x.append(0 + val)
-
-    def finalize(self):
-        if len(self.x) < 2:
-            return None
-        return stdev(self.x)
-
-    @classmethod
-    def create_in(cls, conn):
-        conn.create_aggregate('stdev', 1, cls)
-
-
 class DataSummary:
     script = SqlScript('data_char_sim.sql',
                        res.read_text(heron_load, 'data_char_sim.sql'),
@@ -1123,6 +1658,7 @@ class SEER_Recode:
 
     @classmethod
     def make(cls, spark: SparkSession_T, extract: DataFrame) -> DataFrame:
+        NAACCR_UDF.create_in(spark)  # seer_site_recode
         extract_id = ItemObs.make_extract_id(spark, extract)
         views = ont.create_objects(spark, cls.script,
                                    naaccr_extract_id=extract_id)
@@ -1141,8 +1677,10 @@ class SiteSpecificFactors:
     script2 = SqlScript('csschema.sql', sql,
                         [('cs_site_factor_facts', ['cs_obs_raw'])])
 
-    items = [it for it in ont.NAACCR1.items_180()
-             if it['naaccrName'].startswith('CS Site-Specific Factor')]
+    @ont._lazy
+    def items(cls) -> List[ont.ItemDef_T]:
+        return [it for it in ont.NAACCR1.items_180()
+                if it['naaccrName'].startswith('CS Site-Specific Factor')]
 
     @classmethod
     def valtypes(cls) -> tab.DataFrame:
@@ -1152,12 +1690,13 @@ class SiteSpecificFactors:
         return item_ty
 
     @classmethod
-    def make(cls, spark: SparkSession_T, extract: DataFrame) -> DataFrame:
-        with_schema = cls.make_tumor_schema(spark, extract)
-        ty_df = spark.createDataFrame(cls.valtypes())
+    def make(cls, spark: SparkSession_T, extract: DataFrame,
+             index: Opt[csschema_index.SchemaIndex] = None) -> DataFrame:
+        with_schema = cls.make_tumor_schema(spark, extract, index)
 
-        raw_obs = stack_obs(with_schema, ty_df,  # noqa @@@@
-                            key_cols=TumorKeys.key4 + TumorKeys.dtcols + ['recordId', 'cs_schema_name'])
+        raw_obs = stack_obs(with_schema, cls.valtypes(),
+                            key_cols=TumorKeys.key4 + TumorKeys.dtcols + ['recordId', 'tumor_key', 'cs_schema_name'],
+                            value_col='raw_value')
 
         views = ont.create_objects(spark, cls.script2,
                                    cs_obs_raw=raw_obs)
@@ -1166,9 +1705,25 @@ class SiteSpecificFactors:
     @classmethod
     def make_tumor_schema(cls,
                           spark: SparkSession_T,
-                          extract: DataFrame) -> DataFrame:
+                          extract: DataFrame,
+                          index: Opt[csschema_index.SchemaIndex] = None) -> DataFrame:
+        """Add cs_schema_name to the extract.
+
+        Given an index (see `csterms.py index`), look up each tumor's
+        schema with a cs_schema_name() function rather than the CASE
+        in csschema.sql.
+        """
+        extract_id = ItemObs.make_extract_id(spark, extract)
+        if index is not None:
+            spark.create_function('cs_schema_name', 2, index.schema)
+            return spark.sql(f'''
+              select cs_schema_name(primarySite, histologicTypeIcdO3) as cs_schema_name
+                   , primarySite as primary_site, histologicTypeIcdO3 as histology
+                   , ne.*
+              from {extract_id.table} ne
+            ''')
         views = ont.create_objects(spark, cls.script1,
-                                   naaccr_extract_id=ItemObs.make_extract_id(spark, extract))
+                                   naaccr_extract_id=extract_id)
         return list(views.values())[-1]
 
 
@@ -1193,6 +1748,215 @@ if IO_TESTING:
     _spark.table('naaccr_observations').toPandas().to_csv(_cwd / 'naaccr_observations.csv', index=False)
 
 
+# %% [markdown]
+# The three fact streams above each scan the extract. `FusedObs`
+# decodes each tumor record once and emits all of them:
+
+# %%
+ItemInfo = Tuple[int, int, int, str]  # naaccrNum, sectionId, length, valtype_cd
+
+
+class FusedObs(tab.Relation):
+    """Item, SEER site recode, and CS site-specific factor facts in one pass.
+
+    Rows follow tumor_reg_facts (naaccr_txform.sql); SEER and CS facts
+    have no naaccrNum. For one decoded record:
+
+    >>> items = {'dateOfDiagnosis': (390, 1, 8, 'D'), 'primarySite': (400, 1, 4, '@'),
+    ...          'dateOfLastContact': (1750, 4, 8, 'D'), 'vitalStatus': (1760, 4, 1, '@'),
+    ...          'csSiteSpecificFactor1': (2880, 11, 3, '@')}
+    >>> record = {'patientSystemIdHosp': '0012345', 'tumorRecordNumber': '01', 'patientIdNumber': '00000010',
+    ...           'dateOfDiagnosis': '20170301', 'primarySite': 'C500', 'histologicTypeIcdO3': '8500',
+    ...           'dateOfLastContact': '201905', 'vitalStatus': '1', 'csSiteSpecificFactor1': '010'}
+    >>> for row in FusedObs.facts(record, items, NAACCR_UDF.seer_recoder, lambda site, hist: 'Breast'):
+    ...     print(row[3:5], row[6], row[8], row[12])
+    ['dateOfDiagnosis', 390] NAACCR|390: 2017-03-01 2017-03-01
+    ['primarySite', 400] NAACCR|400:C500 2017-03-01 None
+    ['dateOfLastContact', 1750] NAACCR|1750: 2019-05-01 2019-05-01
+    ['vitalStatus', 1760] NAACCR|1760:1 2019-05-01 None
+    ['csSiteSpecificFactor1', 2880] NAACCR|2880:010 2017-03-01 None
+    ['@', None] SEER_SITE:26000 2017-03-01 @
+    ['@', None] CS|Breast|1:010 2017-03-01 None
+
+    Keys are as in TumorKeys.with_tumor_id:
+
+    >>> row[1:3]
+    ['0012345012017-03-010000-00-00', '00000010']
+    >>> row[0] == NAACCR_UDF.tumor_key('0012345', '01', '2017-03-01', '0000-00-00')
+    True
+
+    Repeats of a key kept by KeyCheck's disambiguate policy get their own:
+
+    >>> row = next(FusedObs.facts(record, items, NAACCR_UDF.seer_recoder, lambda site, hist: None, 2))
+    >>> row[1], row[0] == NAACCR_UDF.tumor_key('0012345', '01', '2017-03-01', '0000-00-00', '#2')
+    ('0012345012017-03-010000-00-00#2', True)
+
+    One pass over a flat file gives the same facts as the three
+    (ItemObs, SEER_Recode, SiteSpecificFactors), including for a tumor
+    with no date of diagnosis:
+
+    >>> from sql_script import DBSession
+    >>> layout = [('recordType', 10, 1, 1), ('naaccrRecordVersion', 50, 17, 3),
+    ...           ('patientIdNumber', 20, 20, 8), ('patientSystemIdHosp', 21, 28, 8),
+    ...           ('tumorRecordNumber', 60, 36, 2), ('abstractedBy', 570, 38, 3),
+    ...           ('dateOfBirth', 240, 41, 8), ('dateOfDiagnosis', 390, 49, 8),
+    ...           ('primarySite', 400, 57, 4), ('histologicTypeIcdO3', 522, 61, 4),
+    ...           ('multiplicityCounter', 446, 65, 2), ('vendorName', 2170, 67, 10),
+    ...           ('dateOfLastContact', 1750, 77, 8), ('vitalStatus', 1760, 85, 1),
+    ...           ('dateCaseCompleted', 2090, 86, 8), ('dateCaseLastChanged', 2100, 94, 8),
+    ...           ('csSiteSpecificFactor1', 2880, 102, 3)]
+    >>> defs = [dict(naaccrId=naaccrId, naaccrNum=num, naaccrName=naaccrId, startColumn=start,
+    ...              length=length, parentXmlElement='Tumor') for naaccrId, num, start, length in layout]
+    >>> registry = ont.LayoutRegistry({'180': lambda: [(d, ['I']) for d in defs]})
+    >>> def record(**values):
+    ...     line = ' ' * 104
+    ...     for naaccrId, _num, start, length in layout:
+    ...         value = dict(values, recordType='I', naaccrRecordVersion='180').get(naaccrId, '')
+    ...         line = line[:start - 1] + value.ljust(length) + line[start - 1 + length:]
+    ...     return line
+    >>> lines = [
+    ...     record(patientIdNumber='00000010', patientSystemIdHosp='00012345', tumorRecordNumber='01',
+    ...            abstractedBy='AB', dateOfBirth='19500102', dateOfDiagnosis='201703',
+    ...            primarySite='C500', histologicTypeIcdO3='8500', multiplicityCounter='2',
+    ...            vendorName='Vendor X', dateOfLastContact='201905', vitalStatus='1',
+    ...            dateCaseCompleted='20170502', dateCaseLastChanged='20190601', csSiteSpecificFactor1='01'),
+    ...     record(patientIdNumber='00000011', patientSystemIdHosp='00012346', tumorRecordNumber='01',
+    ...            dateOfBirth='19600101', primarySite='C341', multiplicityCounter='12',
+    ...            dateOfLastContact='20180101', vitalStatus='0')]
+    >>> index = csschema_index.SchemaIndex([csschema_index.Rule('Breast', ['C500'], [], [], [])])
+
+    >>> ctx = DBSession.in_memory()
+    >>> fused = ctx.load_data_frame('fused_obs', FusedObs(lambda: lines, registry, index.schema))
+    >>> extract = naaccr_read_fwf(ctx.load_data_frame('naaccr_lines', tab.DataFrame.from_records(
+    ...     [dict(value=line) for line in lines])), tab.DataFrame.from_records(defs))
+    >>> three = [ItemObs.make(ctx, extract), SEER_Recode.make(ctx, extract),
+    ...          SiteSpecificFactors.make(ctx, extract, index)]
+    >>> cols = 'tumor_key, concept_cd, start_date, valtype_cd, tval_char, nval_num'
+    >>> _ = ctx.sql(f'''create view three_obs as {
+    ...     ' union all '.join(f'select {cols} from {obs.table}' for obs in three)}''')
+    >>> [row for _, row in ctx.sql(f'''
+    ...     select * from (select {cols} from fused_obs except select * from three_obs)
+    ...     union all
+    ...     select * from (select * from three_obs except select {cols} from fused_obs)''').iterrows()]
+    []
+    >>> [row for _, row in ctx.sql('''
+    ...     select (select count(*) from fused_obs), (select count(*) from three_obs)''').iterrows()]
+    [(21, 21)]
+    >>> for _, row in ctx.sql('''
+    ...         select concept_cd, start_date, valtype_cd, tval_char, nval_num from three_obs
+    ...         where concept_cd not like 'NAACCR|%' or valtype_cd in ('N', 'T') order by 1''').iterrows():
+    ...     print(row)
+    ('CS|Breast|1:01', '2017-03-01', '@', None, None)
+    ('NAACCR|2170:', '2017-03-01', 'T', 'Vendor X', None)
+    ('NAACCR|446:', '2017-03-01', 'N', 'E', 2)
+    ('SEER_SITE:26000', '2017-03-01', '@', '@', None)
+    """
+    cs_prefix = 'csSiteSpecificFactor'
+    fact_example = dict(
+        tumor_key=1, recordId='...', patientIdNumber='...', naaccrId='...', naaccrNum=1,
+        dateOfDiagnosis=TumorTable.aDate, concept_cd='...', provider_id='@',
+        start_date=TumorTable.aDate, modifier_cd='@', instance_num=1, valtype_cd='@',
+        tval_char='...', nval_num=1, valueflag_cd='...', units_cd='...',
+        end_date=TumorTable.aDate, location_cd='@', update_date=TumorTable.aDate)
+
+    def __init__(self, get_lines: Callable[[], Iterable[str]],
+                 registry: ont.LayoutRegistry,
+                 cs_schema: Callable[[Opt[str], Opt[str]], Opt[str]],
+                 keys: Opt[KeyCheck] = None) -> None:
+        tab.Relation.__init__(self, tab.DataFrame.from_records([self.fact_example]).schema)
+        self.__get = get_lines
+        self.__registry = registry
+        self.__cs_schema = cs_schema
+        self.__keys = keys
+
+    @ont._lazy
+    def item_info(cls) -> Dict[str, ItemInfo]:
+        info = ont.NAACCR_I2B2.tumor_item_type.select('naaccrId', 'naaccrNum', 'sectionId', 'length', 'valtype_cd')
+        return {naaccrId: (int(num), int(sectionId), int(length), valtype_cd)
+                for _, [naaccrId, num, sectionId, length, valtype_cd] in info.iterrows()}
+
+    @staticmethod
+    def _date(value: Opt[str]) -> Opt[dt.date]:
+        iso = NAACCR_UDF.naaccr_date(None if value is None else (value + '0101')[:8])
+        return None if iso is None else dt.date.fromisoformat(iso)
+
+    @classmethod
+    def facts(cls, byId: Dict[str, str], items: Dict[str, ItemInfo],
+              seer_recode: Callable[[Opt[str], Opt[str]], str],
+              cs_schema: Callable[[Opt[str], Opt[str]], Opt[str]],
+              repeat: int = 0) -> Iterator[List[Opt[tab.Value]]]:
+        """Facts for one record, given its non-blank values by naaccrId.
+
+        A repeat number from KeyCheck (disambiguate policy) is appended to
+        the tumor key parts, so that repeats of a key are distinct tumors.
+        """
+        date = {name: cls._date(byId.get(name))
+                for name in ['dateOfDiagnosis', 'dateOfLastContact', 'dateCaseCompleted', 'dateCaseLastChanged']}
+        dx, last_contact = date['dateOfDiagnosis'], date['dateOfLastContact']
+        update_date = (date['dateCaseLastChanged'] or last_contact or date['dateCaseCompleted'] or dx)
+        no_date = '0000-00-00'
+        key_parts = [byId.get('patientSystemIdHosp'), byId.get('tumorRecordNumber'),
+                     dx.isoformat() if dx else no_date,
+                     date['dateCaseCompleted'].isoformat() if date['dateCaseCompleted'] else no_date]
+        if repeat:
+            key_parts.append(f'#{repeat}')
+        recordId = None if None in key_parts else ''.join(cast(List[str], key_parts))
+        tumor = [NAACCR_UDF.tumor_key(*key_parts), recordId, byId.get('patientIdNumber')]
+
+        def fact(naaccrId: str, naaccrNum: Opt[int], concept_cd: str, start_date: Opt[dt.date],
+                 valtype_cd: str, tval_char: Opt[str], nval_num: Opt[float]) -> List[Opt[tab.Value]]:
+            return tumor + [naaccrId, naaccrNum, dx, concept_cd, '@', start_date, '@', 1,
+                            valtype_cd, tval_char, nval_num, None, None, start_date, '@', update_date]
+
+        for naaccrId, value in byId.items():
+            info = items.get(naaccrId)
+            if info is None:
+                continue
+            naaccrNum, sectionId, length, valtype_cd = info
+            start_date = last_contact if sectionId == 4 else dx
+            if start_date is None:
+                continue
+            concept_cd = f'NAACCR|{naaccrNum}:' + (value if valtype_cd == '@' else '')
+            tval_char: Opt[str] = None
+            nval_num: Opt[float] = None
+            if valtype_cd == 'T':
+                tval_char = value
+            elif valtype_cd == 'D':
+                date_value = cls._date(value)
+                tval_char = None if date_value is None else (
+                    date_value.isoformat() + (' 00:00:00' if length == 14 else ''))
+            elif valtype_cd == 'N':
+                tval_char = 'E'  # Equal for lab-style comparisons
+                nval_num = NAACCR_UDF.naaccr_num(value) if value[:1].isdigit() else None
+            yield fact(naaccrId, naaccrNum, concept_cd, start_date, valtype_cd, tval_char, nval_num)
+
+        if dx is None:
+            return
+        recode = seer_recode(byId.get('primarySite'), byId.get('histologicTypeIcdO3'))
+        if recode != '99999':
+            yield fact('@', None, f'SEER_SITE:{recode}', dx, '@', '@', None)
+
+        schema = cs_schema(byId.get('primarySite'), byId.get('histologicTypeIcdO3'))
+        if schema is None:
+            return
+        for naaccrId, value in byId.items():
+            if naaccrId.startswith(cls.cs_prefix) and naaccrId in items:
+                factor = naaccrId[len(cls.cs_prefix):]
+                yield fact('@', None, f'CS|{schema}|{factor}:{value}', dx, '@', None, None)
+
+    def iterrows(self) -> Iterator[Tuple[int, tab.Row]]:
+        items, recode = self.item_info, NAACCR_UDF.seer_recoder
+        obs_ix = 0
+        for tumor_ix, (repeat, line) in enumerate(KeyCheck.lines(self.__keys, self.__get)):
+            (_version, _recordType, values), = self.__registry.decode_lines([line])
+            byId = {item['naaccrId']: v for item, v in values}
+            for row in self.facts(byId, items, recode, self.__cs_schema, repeat):
+                yield obs_ix, row
+                obs_ix += 1
+            if tumor_ix % 500 == 0:
+                log.info('FusedObs tumor: %d obs: %d', tumor_ix, obs_ix)
+
+
 # %% [markdown] {"slideshow": {"slide_type": "slide"}}
 # ## Concept stats
 
@@ -1200,17 +1964,95 @@ if IO_TESTING:
 class ConceptStats:
     script = SqlScript('concept_stats.sql',
                        res.read_text(heron_load, 'concept_stats.sql'),
-                       [('concept_stats', ['ontology', 'observations'])])
+                       [('concept_stats', ['concept_terms', 'concept_closure', 'observations'])])
 
     @classmethod
     def make(cls, spark: SparkSession_T,
              ontology: DataFrame, observations: DataFrame) -> DataFrame:
+        closure = ont.ConceptClosure.of(ontology)
         views = ont.create_objects(spark, cls.script,
-                                   ontology=ontology.cache(),
+                                   indexes=ont.ConceptClosure.indexes,
+                                   concept_terms=closure.terms,
+                                   concept_closure=closure.closure,
                                    observations=observations.cache())
         return list(views.values())[-1]
 
 
+class PatientCounts:
+    """Exact rolled-up patient counts (i2b2 c_totalnum) from patient bitsets.
+
+    Each patient gets a dense number; each concept_cd gets a Python
+    int with one bit per patient. Bits are OR-ed up the ontology from
+    the leaves, so a term's count is the number of distinct patients
+    with a fact at the term or anywhere below it, in one pass over the
+    observations rather than a distinct count over a closure join.
+
+    >>> terms = tab.DataFrame.from_records([
+    ...     dict(c_fullname='/n/', c_hlevel=1, c_basecode=None, c_name='top'),
+    ...     dict(c_fullname='/n/400/', c_hlevel=2, c_basecode='400:', c_name='site'),
+    ...     dict(c_fullname='/n/400/C50/', c_hlevel=3, c_basecode='400:C50', c_name='breast'),
+    ...     dict(c_fullname='/n/400/C61/', c_hlevel=3, c_basecode='400:C61', c_name='prostate'),
+    ...     dict(c_fullname='/n/380/', c_hlevel=2, c_basecode='380:', c_name='seq')])
+    >>> obs = tab.DataFrame.from_records([
+    ...     dict(PATIENTIDNUMBER='p1', CONCEPT_CD='400:C50'),
+    ...     dict(PATIENTIDNUMBER='p1', CONCEPT_CD='400:C50'),
+    ...     dict(PATIENTIDNUMBER='p2', CONCEPT_CD='400:C50'),
+    ...     dict(PATIENTIDNUMBER='p2', CONCEPT_CD='400:C61'),
+    ...     dict(PATIENTIDNUMBER='p3', CONCEPT_CD='400:C61')])
+    >>> counts = PatientCounts(ont.ConceptClosure.of(terms)).add_all(obs)
+    >>> for _, row in counts.totalnum().iterrows():
+    ...     print(row)
+    ['/n/', 3]
+    ['/n/380/', 0]
+    ['/n/400/', 3]
+    ['/n/400/C50/', 2]
+    ['/n/400/C61/', 2]
+    """
+    schema: tab.Schema = {'columns': [
+        {'number': 1, 'name': 'c_fullname', 'datatype': 'string', 'null': []},
+        {'number': 2, 'name': 'c_totalnum', 'datatype': 'number', 'null': []}]}
+
+    def __init__(self, closure: ont.ConceptClosure) -> None:
+        self.closure = closure
+        self.patient_ix: Dict[str, int] = {}
+        self.bits: Dict[str, int] = {}
+
+    def add(self, patient: str, concept_cd: str) -> None:
+        ix = self.patient_ix.setdefault(patient, len(self.patient_ix))
+        self.bits[concept_cd] = self.bits.get(concept_cd, 0) | (1 << ix)
+
+    def add_all(self, observations: tab.Relation,
+                patient_col: str = 'patientIdNumber',
+                concept_col: str = 'concept_cd') -> 'PatientCounts':
+        """Stream observations; column names are matched without regard to case (Oracle)."""
+        cols = [c.lower() for c in observations.columns]
+        pat_ix, cd_ix = cols.index(patient_col.lower()), cols.index(concept_col.lower())
+        for _, row in observations.iterrows():
+            if row[pat_ix] is not None and row[cd_ix] is not None:
+                self.add(str(row[pat_ix]), str(row[cd_ix]))
+        return self
+
+    def rollup(self) -> Dict[int, int]:
+        """Patient bitset for each term_id, including all descendants."""
+        parent = {d: a for _, [a, d, depth] in self.closure.closure.iterrows() if depth == 1}
+        terms = sorted((cast(int, t), cast(Opt[str], cd)) for _, [t, _n, cd, *_] in self.closure.terms.iterrows())
+        acc: Dict[int, int] = {}
+        # children have higher term_ids (preorder), so one backward pass sees them first
+        for term_id, basecode in reversed(terms):
+            mine = acc.get(term_id, 0) | (self.bits.get(basecode, 0) if basecode is not None else 0)
+            acc[term_id] = mine
+            up = parent.get(term_id)
+            if up is not None:
+                acc[cast(int, up)] = acc.get(cast(int, up), 0) | mine
+        return acc
+
+    def totalnum(self) -> tab.DataFrame:
+        acc = self.rollup()
+        return tab.DataFrame([[fullname, bin(acc[cast(int, term_id)]).count('1')]
+                              for _, [term_id, fullname, *_] in self.closure.terms.iterrows()],
+                             self.schema)
+
+
 # if IO_TESTING:
 #    ConceptStats.make(_spark,
 #                      _spark.table('naaccr_ontology').sample(False, 0.01),
@@ -1236,6 +2078,85 @@ if IO_TESTING:
 
 
 # %%
+class TermDelta:
+    """Changes from published ontology terms to a new build, keyed by c_fullname.
+
+    Rows are compared by a hash of the values in columns they have in
+    common, ignoring column name case and columns set at load time
+    rather than by the build (update_date, c_totalnum, ...).
+
+    >>> published = tab.DataFrame.from_records([
+    ...     dict(C_FULLNAME='/x/a/', C_NAME='A', C_HLEVEL=1.0, UPDATE_DATE='2019-01-01'),
+    ...     dict(C_FULLNAME='/x/b/', C_NAME='B', C_HLEVEL=1.0, UPDATE_DATE='2019-01-01'),
+    ...     dict(C_FULLNAME='/x/c/', C_NAME='C', C_HLEVEL=1.0, UPDATE_DATE='2019-01-01')])
+    >>> current = tab.DataFrame.from_records([
+    ...     dict(c_fullname='/x/a/', c_name='A', c_hlevel=1, update_date='2020-01-01'),
+    ...     dict(c_fullname='/x/b/', c_name='B2', c_hlevel=1, update_date='2020-01-01'),
+    ...     dict(c_fullname='/x/d/', c_name='D', c_hlevel=1, update_date='2020-01-01')])
+    >>> delta = TermDelta.of(published, current)
+    >>> delta
+    TermDelta(insert=1, update=1, delete=1, unchanged=1)
+    >>> sorted(delta.deletes)
+    ['/x/b/', '/x/c/']
+    >>> [row[:2] for _, row in delta.inserts.iterrows()]
+    [['/x/b/', 'B2'], ['/x/d/', 'D']]
+
+    Published counts (see PatientCounts) don't make a term differ from its
+    new build, where c_totalnum is null:
+
+    >>> counted = tab.DataFrame.from_records([
+    ...     dict(C_FULLNAME='/x/a/', C_NAME='A', C_HLEVEL=1.0, C_TOTALNUM=12, IMPORT_DATE='2019-01-01')])
+    >>> TermDelta.of(counted, current.select('c_fullname', 'c_name', 'c_hlevel'))
+    TermDelta(insert=2, update=0, delete=0, unchanged=1)
+    """
+    load_time_cols = ('update_date', 'download_date', 'import_date', 'c_totalnum')
+
+    def __init__(self, key: str, inserts: tab.DataFrame, deletes: List[str],
+                 counts: Dict[str, int]) -> None:
+        self.key = key
+        self.inserts = inserts
+        self.deletes = deletes
+        self.counts = counts
+
+    def __repr__(self) -> str:
+        return 'TermDelta(%s)' % ', '.join(f'{k}={v}' for k, v in self.counts.items())
+
+    @classmethod
+    def row_hash(cls, record: Dict[str, object], compare: Set[str]) -> str:
+        def norm(v: object) -> Opt[str]:
+            if isinstance(v, float) and v.is_integer():
+                v = int(v)
+            return None if v is None else str(v)
+        items = sorted((k.lower(), norm(v)) for k, v in record.items() if k.lower() in compare)
+        return hashlib.sha1(json.dumps(items).encode('utf-8')).hexdigest()
+
+    @classmethod
+    def of(cls, published: tab.Relation, current: tab.Relation,
+           key: str = 'c_fullname', ignore: Opt[Iterable[str]] = None) -> 'TermDelta':
+        skip = set(cls.load_time_cols if ignore is None else ignore)
+        compare = (set(n.lower() for n in published.columns) &
+                   set(n.lower() for n in current.columns)) - skip
+
+        def keyed(rel: tab.Relation) -> Dict[str, Tuple[str, tab.Row]]:
+            names = [n.lower() for n in rel.columns]
+            if not names:  # e.g. nothing published yet
+                return {}
+            ix = names.index(key)
+            return {str(row[ix]): (cls.row_hash(dict(zip(names, row)), compare), row)
+                    for _, row in rel.iterrows()}
+
+        old, new = keyed(published), keyed(current)
+        added = [k for k in new if k not in old]
+        changed = [k for k in new if k in old and new[k][0] != old[k][0]]
+        removed = [k for k in old if k not in new]
+        inserts = tab.DataFrame([new[k][1] for k in new if k not in old or k in changed],
+                                {'columns': [cast(tab.Column, dict(col, number=ix + 1))
+                                             for ix, col in enumerate(current.schema['columns'])]})
+        return cls(key, inserts, changed + removed, {
+            'insert': len(added), 'update': len(changed), 'delete': len(removed),
+            'unchanged': len(new) - len(added) - len(changed)})
+
+
 class Account:
     def __init__(self, name: str, user: str, password: str,
                  popen: Callable[..., Popen_T],
@@ -1260,8 +2181,11 @@ class Account:
         return self.label
 
     def rd(self, table: str) -> tab.DataFrame:
+        return self.query(f'select * from {table}')
+
+    def query(self, sql: str) -> tab.DataFrame:
         args = ['java', '-cp', self.classpath, 'Loader',
-                '--account', self.name, '--query', f'select * from {table}']
+                '--account', self.name, '--query', sql]
         log.info("Account subprocess: %s", args)
         # ISSUE: stream results?
         with self.__popen(args, env=self.__env, stdout=PIPE, encoding='utf-8') as proc:
@@ -1269,25 +2193,61 @@ class Account:
             status = proc.wait()
             if status != 0:
                 raise IOError()
+            if not records:
+                return tab.DataFrame([], {'columns': []})
             return tab.DataFrame.from_records(records)
 
-    def send(self, dest, table: str, data: tab.Relation):
+    def send(self, dest: IO[str], table: str, data: tab.Relation) -> None:
         stmt = insert_stmt(table, data.columns)
         log.info('Account insert SQL: %s', stmt)
+        self._send_batches(dest, stmt, data.iter_batches())
+
+    @classmethod
+    def _send_batches(cls, dest: IO[str], stmt: str, batches: Iterable[tab.Batch]) -> None:
         header = {'sql': stmt}
         json.dump(header, dest)
         dest.write('\n')
-        for _, record in data.iterrows():
-            json.dump(record, dest)
-            dest.write('\n')
+        for batch in batches:
+            dest.write(''.join(json.dumps(record) + '\n' for record in zip(*batch)))
 
     def wr(self, table: str, data: tab.Relation,
            mode: Opt[str] = None) -> None:
+        self._load(lambda dest: self.send(dest, table, data))
+
+    def execute_many(self, stmt: str, batches: Iterable[tab.Batch]) -> None:
+        """Run stmt once per record, with parameters from column-major batches."""
+        log.info('Account batch SQL: %s', stmt)
+        self._load(lambda dest: self._send_batches(dest, stmt, batches))
+
+    def apply(self, table: str, delta: 'TermDelta') -> None:
+        """Publish a delta: delete removed and changed rows, then insert new versions.
+
+        Both go to one Loader session, in one transaction, so a failed
+        insert leaves the published rows as they were.
+        """
+        deletes: List[Opt[tab.Value]] = list(delta.deletes)
+
+        def send(dest: IO[str]) -> None:
+            if deletes:
+                self._send_batches(dest, f'delete from {table} where {delta.key} = ?', [[deletes]])
+            if delta.counts['insert'] + delta.counts['update']:
+                self.send(dest, table, delta.inserts)
+        if delta.deletes or delta.counts['insert'] + delta.counts['update']:
+            self._load(send)
+
+    def set_totalnum(self, table: str, counts: tab.Relation) -> None:
+        """Publish c_totalnum for terms already in table; see PatientCounts."""
+        cols = [c.lower() for c in counts.columns]
+        fullname_ix, total_ix = cols.index('c_fullname'), cols.index('c_totalnum')
+        self.execute_many(f'update {table} set c_totalnum = ? where c_fullname = ?',
+                          ([batch[total_ix], batch[fullname_ix]] for batch in counts.iter_batches()))
+
+    def _load(self, send: Callable[[IO[str]], None]) -> None:
         args = ['java', '-cp', self.classpath, 'Loader',
                 '--account', self.name, '--load']
         log.info("Account subprocess: %s", args)
         with self.__popen(args, env=self.__env, stdin=PIPE, encoding='utf-8') as proc:
-            self.send(proc.stdin, table, data)
+            send(proc.stdin)
             proc.stdin.close()
             status = proc.wait()
             if status != 0:
@@ -1407,7 +2367,9 @@ IO_TESTING and _cancer_id.toPandas().describe()
 
 # %%
 class CancerStudy:
-    bc_variable = ont._with_path(res.path(bc_qa, 'bc-variable.csv'), tab.read_csv)
+    @ont._lazy
+    def bc_variable(cls) -> tab.DataFrame:
+        return ont._with_path(res.path(bc_qa, 'bc-variable.csv'), tab.read_csv)
 
 
 IO_TESTING and _spark.createDataFrame(
@@ -1436,7 +2398,7 @@ def _selectedItems(ddict: DataFrame, items: DataFrame) -> DataFrame:
 
 if IO_TESTING:
     _bc_ddict = _selectedItems(
-        ont.ddictDF(_spark),
+        ont.ddictDF(),
         itemNumOfPath(_spark.createDataFrame(CancerStudy.bc_variable)),
     ).select('naaccrId', 'naaccrNum', 'parentXmlElement', 'length')
 
@@ -1532,15 +2494,17 @@ if __name__ == '__main__':
         elif '--test-eav' in argv:
             [flat_file, db] = argv[-2:]
             spark = SparkSession_T(connect(db))
-            TumorTable.load_flat_file(spark, Path('.') / flat_file)
+            policy = [arg.split('=', 1)[1] for arg in argv if arg.startswith('--dups=')]
+            keys = KeyCheck.for_items(ont.NAACCR1.index, policy=policy[0]) if policy else None
+            TumorTable.load_flat_file(spark, Path('.') / flat_file, keys=keys)
             result = spark.sql(
                 "select valtype_cd, count(*) from tumor_item_value group by valtype_cd")
             result.to_csv(stdout)
         elif '--summarize' in argv:
             [db, dest] = argv[-2:]
-            conn = connect(db)
-            StDevAgg.create_in(conn)
-            spark = SparkSession_T(conn)
+            spark = SparkSession_T(connect(db))
+            streaming_agg.create_in(spark)
+            NAACCR_UDF.create_in(spark)
             stats = DataSummary.stats(spark.table(TumorTable.typed_view),
                                       spark.table('tumor_item_value'), spark)
             with (Path('.') / dest).open('w') as out:
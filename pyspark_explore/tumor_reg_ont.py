@@ -12,16 +12,25 @@ r"""
     # TODO: test ont.iterrows()
 """
 
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from importlib import resources as res
 from pathlib import Path as Path_T  # for type only
 from typing import (
-    Callable, ContextManager, Dict, Iterator, List, Optional as Opt,
-    Sequence, Tuple, Union,
+    Any, Callable, ContextManager, Dict, Generic, Iterable, Iterator, List, Mapping, Optional as Opt,
+    Sequence, Tuple, TypeVar, Union,
     cast,
 )
+from sqlite3 import Connection
+from types import MappingProxyType
 from xml.etree import ElementTree as XML
+import csv
 import datetime as dt
+import hashlib
+import itertools
+import json
 import logging
+import threading
 import zipfile
 
 from typing_extensions import TypedDict
@@ -37,6 +46,45 @@ import naaccr_xml_xsd
 
 log = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+
+class _lazy(Generic[T]):
+    """Class attribute computed on first use, then cached on the class.
+
+    Reference data (layouts, dictionaries, CSVs) is parsed only by
+    the processes that use it, rather than by every `import`.
+
+    >>> class Demo:
+    ...     @_lazy
+    ...     def table(cls):
+    ...         print('parsing...')
+    ...         return [1, 2, 3]
+    >>> Demo.table
+    parsing...
+    [1, 2, 3]
+    >>> Demo.table
+    [1, 2, 3]
+    """
+    _lock = threading.RLock()
+
+    def __init__(self, compute: Callable[[Any], T]) -> None:
+        self.compute = compute
+        self.name = compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: object, owner: type) -> T:
+        with self._lock:
+            cached = owner.__dict__.get(self.name, self)
+            if not isinstance(cached, _lazy):  # computed by another thread meanwhile
+                return cast(T, cached)
+            value = self.compute(owner)
+            setattr(owner, self.name, value)
+            return value
+
 
 class XPath:
     @classmethod
@@ -158,21 +206,27 @@ class NAACCR_Layout:
      {'long-label': 'State/Requestor Items', ..., 'naaccr-item-num': 2220, ..., 'grouped': False}]
 
     """
-    layout_180 = XML.parse(res.open_text(
-        naaccr_layout, 'naaccr-18-layout.xml'))
-
-    # All but reserved fields (both groups and parts)
-    fields_raw = [to_field0(f)
-                  for f in layout_180.findall('.//field')
-                  if f.attrib.get('naaccr-item-num') and
-                  not f.attrib['name'].startswith('reserved')]
-
-    # include length
-    fields: List[Field] = [to_field(f) for f in fields_raw]
+    @_lazy
+    def layout_180(cls) -> 'XML.ElementTree[XML.Element]':
+        return XML.parse(res.open_text(
+            naaccr_layout, 'naaccr-18-layout.xml'))
+
+    @_lazy
+    def fields_raw(cls) -> List[Field0]:
+        """All but reserved fields (both groups and parts)"""
+        return [to_field0(f)
+                for f in cls.layout_180.findall('.//field')
+                if f.attrib.get('naaccr-item-num') and
+                not f.attrib['name'].startswith('reserved')]
+
+    @_lazy
+    def fields(cls) -> List[Field]:
+        """include length"""
+        return [to_field(f) for f in cls.fields_raw]
 
     @classmethod
-    def item_codes(cls) -> tab.DataFrame:
-        ea = cls.iter_codes()
+    def item_codes(cls, cache: Opt['MetaCache'] = None) -> tab.DataFrame:
+        ea = cls.iter_codes(cache)
         schema: tab.Schema = {'columns': [
             {'number': 1, 'name': 'naaccrNum', 'datatype': 'number', 'null': []},
             {'number': 2, 'name': 'naaccrId', 'datatype': 'string', 'null': []},
@@ -181,16 +235,10 @@ class NAACCR_Layout:
         return tab.DataFrame(ea, schema=schema)
 
     @classmethod
-    def iter_codes(cls) -> Iterator[List[Opt[tab.Value]]]:
-        for path, doc in cls._field_docs():
-            qname = cls._xmlId(doc)
-            if not qname:
-                continue
-            _parent, xmlId = qname
-            info = cls._field_info(doc)
-            naaccrNum = int(info['Item #'])
-            for code, desc in cls._item_codes(doc):
-                yield [naaccrNum, xmlId, code, desc]
+    def iter_codes(cls, cache: Opt['MetaCache'] = None) -> Iterator[List[Opt[tab.Value]]]:
+        for item in cls.item_docs(cache):
+            for code, desc in item['codes']:
+                yield [item['naaccrNum'], item['xmlId'], code, desc]
 
     @classmethod
     def _item_codes(cls, doc: XML.Element) -> List[Tuple[str, str]]:
@@ -204,48 +252,76 @@ class NAACCR_Layout:
         return [(code, desc) for (code, desc) in rows if code]
 
     @classmethod
-    def iter_description(cls) -> Iterator[Tuple[int, str, str]]:
-        for _p, doc in cls._field_docs():
-            qname = cls._xmlId(doc)
-            if not qname:
-                continue
-            _parent, xmlId = qname
-            if xmlId.startswith('reserved'):
+    def iter_description(cls, cache: Opt['MetaCache'] = None) -> Iterator[Tuple[int, str, str]]:
+        for item in cls.item_docs(cache):
+            if item['xmlId'].startswith('reserved') or item['description'] is None:
                 continue
-            num = int(cls._field_info(doc)['Item #'])
-            hd = None
-            for div in doc.findall('./div'):
-                text = ''.join(div.itertext())
-                if hd == 'Description':
-                    yield num, xmlId, text
-                    break
-                if text == 'Description':
-                    hd = text
-
-    @classmethod
-    def fields_source(cls) -> Iterator[Tuple[int, str, Opt[str]]]:
-        for _p, doc in cls._field_docs():
-            qname = cls._xmlId(doc)
-            if not qname:
-                continue
-            _parent, xmlId = qname
-            if xmlId.startswith('reserved'):
+            yield item['naaccrNum'], item['xmlId'], item['description']
+
+    @classmethod
+    def _description(cls, doc: XML.Element) -> Opt[str]:
+        hd = None
+        for div in doc.findall('./div'):
+            text = ''.join(div.itertext())
+            if hd == 'Description':
+                return text
+            if text == 'Description':
+                hd = text
+        return None
+
+    @classmethod
+    def fields_source(cls, cache: Opt['MetaCache'] = None) -> Iterator[Tuple[int, str, Opt[str]]]:
+        for item in cls.item_docs(cache):
+            if item['xmlId'].startswith('reserved'):
                 continue
-            info = cls._field_info(doc)
-            yield (int(info['Item #']), xmlId,
-                   info.get('Source of Standard'))
+            yield item['naaccrNum'], item['xmlId'], item['source']
+
+    _docs: Dict[bool, List['ItemDoc']] = {}
+    _docs_lock = threading.Lock()
 
     @classmethod
-    def _fields_doc(cls) -> ContextManager[Path_T]:
-        return res.path(naaccr_layout, 'doc')
+    def item_docs(cls, cache: Opt['MetaCache'] = None,
+                  workers: Opt[int] = None) -> List['ItemDoc']:
+        """Item documentation, parsed in one pass over the HTML files.
+
+        Files are parsed in a pool of `workers` processes (default: one
+        per CPU; 1 for none). The result is kept for the life of the
+        process (separately for calls with and without a cache, so that
+        a cached call still saves it):
+
+        >>> [(d['naaccrNum'], d['xmlId'], d['source'])
+        ...  for d in NAACCR_Layout.item_docs(workers=1)[:2]]
+        [(570, 'abstractedBy', 'CoC'), (550, 'accessionNumberHosp', 'CoC')]
+        >>> NAACCR_Layout.item_docs() is NAACCR_Layout.item_docs()
+        True
+        """
+        with cls._docs_lock:
+            found = cls._docs.get(cache is not None)
+            if found is None:
+                found = cls._docs[cache is not None] = (
+                    cls._cached_docs(cache, workers) if cache else cls._parse_docs(workers))
+        return found
+
+    @classmethod
+    def _cached_docs(cls, cache: 'MetaCache', workers: Opt[int]) -> List['ItemDoc']:
+        digest = _with_path(cls._fields_doc(), cache.digest)
+        return cast(List[ItemDoc], cache.get('NAACCR_Layout.item_docs', digest,
+                                             lambda: cls._parse_docs(workers)))
 
     @classmethod
-    def _field_docs(cls,
-                    subdir: str = 'naaccr18') -> Iterator[Tuple[Path_T, XML.Element]]:
+    def _parse_docs(cls, workers: Opt[int]) -> List['ItemDoc']:
         with cls._fields_doc() as doc_dir:
-            for field_path in sorted((doc_dir / subdir).glob('*.html')):
-                doc = _parse_html_fragment(field_path)
-                yield field_path, doc
+            paths = sorted((doc_dir / 'naaccr18').glob('*.html'))
+            if workers == 1:
+                docs = [_item_doc(p) for p in paths]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    docs = list(pool.map(_item_doc, paths, chunksize=32))
+        return [d for d in docs if d is not None]
+
+    @classmethod
+    def _fields_doc(cls) -> ContextManager[Path_T]:
+        return res.path(naaccr_layout, 'doc')
 
     @classmethod
     def _xmlId(cls, doc: XML.Element) -> Opt[Tuple[str, str]]:
@@ -265,6 +341,37 @@ class NAACCR_Layout:
                         [cast(str, td.text) for td in detail.findall('td')]))
 
 
+ItemDoc = TypedDict('ItemDoc', {
+    'naaccrNum': int,
+    'parentXmlElement': str,
+    'xmlId': str,
+    'source': Opt[str],
+    'description': Opt[str],
+    'codes': List[Tuple[str, str]],
+})
+
+
+def _item_doc(path: Path_T) -> Opt[ItemDoc]:
+    """Parse one item doc for everything we use from it.
+
+    Module-level (i.e. picklable) for use in a process pool.
+    """
+    doc = _parse_html_fragment(path)
+    qname = NAACCR_Layout._xmlId(doc)
+    if not qname:
+        return None
+    parent, xmlId = qname
+    info = NAACCR_Layout._field_info(doc)
+    return {
+        'naaccrNum': int(info['Item #']),
+        'parentXmlElement': parent,
+        'xmlId': xmlId,
+        'source': info.get('Source of Standard'),
+        'description': NAACCR_Layout._description(doc),
+        'codes': NAACCR_Layout._item_codes(doc),
+    }
+
+
 def _parse_html_fragment(path: Path_T) -> XML.Element:
     markup = path.open().read()
     markup = '''
@@ -335,20 +442,30 @@ class NAACCR1:
      {'naaccrId': 'registryType', 'naaccrNum': 30, ...},
      {'naaccrId': 'naaccrRecordVersion', 'naaccrNum': 50, ...}]
     """
-    dd13_xsd = XML.parse(res.open_text(
-        naaccr_xml_xsd, 'naaccr_dictionary_1.3.xsd'))
-
-    ndd180 = XML.parse(res.open_text(
-        naaccr_xml_res, 'naaccr-dictionary-180.xml'))
-
-    data_xsd = XML.parse(res.open_text(
-        naaccr_xml_xsd, 'naaccr_data_1.3.xsd'))
-
-    item_xsd = XSD.the(
-        data_xsd.getroot(),
-        './/xsd:complexType[@name="itemType"]/xsd:simpleContent/xsd:extension')
-
-    ItemDef = XSD.the(dd13_xsd.getroot(), './/xsd:element[@name="ItemDef"]')
+    @_lazy
+    def dd13_xsd(cls) -> 'XML.ElementTree[XML.Element]':
+        return XML.parse(res.open_text(
+            naaccr_xml_xsd, 'naaccr_dictionary_1.3.xsd'))
+
+    @_lazy
+    def ndd180(cls) -> 'XML.ElementTree[XML.Element]':
+        return XML.parse(res.open_text(
+            naaccr_xml_res, 'naaccr-dictionary-180.xml'))
+
+    @_lazy
+    def data_xsd(cls) -> 'XML.ElementTree[XML.Element]':
+        return XML.parse(res.open_text(
+            naaccr_xml_xsd, 'naaccr_data_1.3.xsd'))
+
+    @_lazy
+    def item_xsd(cls) -> XML.Element:
+        return XSD.the(
+            cls.data_xsd.getroot(),
+            './/xsd:complexType[@name="itemType"]/xsd:simpleContent/xsd:extension')
+
+    @_lazy
+    def ItemDef(cls) -> XML.Element:
+        return XSD.the(cls.dd13_xsd.getroot(), './/xsd:element[@name="ItemDef"]')
 
     uri = 'http://naaccr.org/naaccrxml'
     ns = {'n': uri}
@@ -359,24 +476,202 @@ class NAACCR1:
         >>> NAACCR1.itemDef('npiRegistryId').attrib['startColumn']
         '20'
         """
-        ndd = cls.ndd180.getroot()
-        defPath = f'./n:ItemDefs/n:ItemDef[@naaccrId="{naaccrId}"]'
-        return XSD.the(ndd, defPath, cls.ns)
-
-    @classmethod
-    def items_180(cls) -> Iterator[ItemDef_T]:
-        def decode(f: Dict[str, str]) -> ItemDef_T:
-            return {
-                'naaccrId': f['naaccrId'],
-                'naaccrNum': int(f['naaccrNum']),
-                'naaccrName': f['naaccrName'],
-                'startColumn': int(f['startColumn']),
-                'length': int(f['length']),
-                'parentXmlElement': f['parentXmlElement'],
-            }
+        return cls._itemDefElts[naaccrId]
+
+    @_lazy
+    def _itemDefElts(cls) -> Mapping[str, XML.Element]:
+        return MappingProxyType({elt.attrib['naaccrId']: elt
+                                 for elt in cls.ndd180.iterfind('./n:ItemDefs/n:ItemDef', cls.ns)})
+
+    @_lazy
+    def index(cls) -> 'ItemIndex':
+        """
+        >>> NAACCR1.index.by_num[45]['naaccrId']
+        'npiRegistryId'
+        >>> NAACCR1.index.at_column(25)['naaccrId']
+        'npiRegistryId'
+        """
+        return ItemIndex(cls.items_180())
+
+    @classmethod
+    def _digest(cls, cache: 'MetaCache') -> str:
+        return _with_path(res.path(naaccr_xml_res, 'naaccr-dictionary-180.xml'), cache.digest)
+
+    @classmethod
+    def items_180(cls, cache: Opt['MetaCache'] = None) -> Iterator[ItemDef_T]:
+        if cache:
+            return iter(cast(List[ItemDef_T], cache.get(
+                'NAACCR1.items_180', cls._digest(cache), lambda: list(cls.items_180()))))
 
         defs = cls.ndd180.iterfind('./n:ItemDefs/n:ItemDef', cls.ns)
-        return (decode(elt.attrib) for elt in defs)
+        return (cls._decode(elt.attrib) for elt in defs)
+
+    @classmethod
+    def _decode(cls, f: Dict[str, str]) -> ItemDef_T:
+        return {
+            'naaccrId': f['naaccrId'],
+            'naaccrNum': int(f['naaccrNum']),
+            'naaccrName': f['naaccrName'],
+            'startColumn': int(f['startColumn']),
+            'length': int(f['length']),
+            'parentXmlElement': f['parentXmlElement'],
+        }
+
+    # naaccrRecordVersion values with a data dictionary in naaccr_xml_res
+    versions = ('160', '180')
+
+    @classmethod
+    def dictionary(cls, version: str) -> 'XML.ElementTree[XML.Element]':
+        if version == '180':
+            return cls.ndd180
+        if version not in cls.versions:
+            raise KeyError(version)
+        return XML.parse(res.open_text(
+            naaccr_xml_res, f'naaccr-dictionary-{version}.xml'))
+
+    @classmethod
+    def item_layout(cls, version: str) -> Iterator[Tuple[ItemDef_T, List[str]]]:
+        """Flat-file items of a dictionary, with the record types that include them.
+        """
+        for elt in cls.dictionary(version).iterfind('./n:ItemDefs/n:ItemDef', cls.ns):
+            if 'startColumn' not in elt.attrib:  # XML-only item
+                continue
+            yield cls._decode(elt.attrib), elt.attrib.get('recordTypes', 'A,M,C,I').split(',')
+
+    @_lazy
+    def registry(cls) -> 'LayoutRegistry':
+        """
+        >>> NAACCR1.registry.decoder('180', 'I')('I' + ' ' * 15 + '180')
+        ... # doctest: +ELLIPSIS
+        [({'naaccrId': 'recordType', ...}, 'I'), ({'naaccrId': 'naaccrRecordVersion', ...}, '180')]
+        """
+        return LayoutRegistry({
+            version: (lambda version=version: cls.item_layout(version))  # type: ignore
+            for version in cls.versions})
+
+
+class ItemIndex:
+    """Immutable data dictionary index: by naaccrId, naaccrNum, and column.
+
+    >>> ix = ItemIndex([
+    ...     {'naaccrId': 'recordType', 'naaccrNum': 10, 'naaccrName': 'Record Type',
+    ...      'startColumn': 1, 'length': 1, 'parentXmlElement': 'NaaccrData'},
+    ...     {'naaccrId': 'naaccrRecordVersion', 'naaccrNum': 50, 'naaccrName': 'NAACCR Record Version',
+    ...      'startColumn': 17, 'length': 3, 'parentXmlElement': 'NaaccrData'}])
+    >>> ix.by_id['naaccrRecordVersion']['naaccrNum'], ix.by_num[10]['naaccrId']
+    (50, 'recordType')
+
+    Columns are 1-based, as in `startColumn`; gaps have no item:
+
+    >>> ix.at_column(19)['naaccrId'], ix.at_column(20), ix.at_column(5)
+    ('naaccrRecordVersion', None, None)
+
+    This helps explain a position in a malformed record:
+
+    >>> ix.describe_column(18)
+    'naaccrRecordVersion (#50) [17:19]'
+    """
+    def __init__(self, items: Iterable[ItemDef_T]) -> None:
+        defs = list(items)
+        self.by_id: Mapping[str, ItemDef_T] = MappingProxyType({d['naaccrId']: d for d in defs})
+        self.by_num: Mapping[int, ItemDef_T] = MappingProxyType({d['naaccrNum']: d for d in defs})
+        spans = sorted(defs, key=lambda d: d['startColumn'])
+        self._starts = tuple(d['startColumn'] for d in spans)
+        self._spans = tuple(spans)
+
+    def at_column(self, column: int) -> Opt[ItemDef_T]:
+        ix = bisect_right(self._starts, column) - 1
+        if ix < 0:
+            return None
+        found = self._spans[ix]
+        return found if column < found['startColumn'] + found['length'] else None
+
+    def describe_column(self, column: int) -> str:
+        found = self.at_column(column)
+        if found is None:
+            return f'(no item at column {column})'
+        end = found['startColumn'] + found['length'] - 1
+        return f"{found['naaccrId']} (#{found['naaccrNum']}) [{found['startColumn']}:{end}]"
+
+
+RecordDecoder = Callable[[str], List[Tuple[ItemDef_T, str]]]
+
+
+class LayoutRegistry:
+    """Flat-file record layouts by naaccrRecordVersion and recordType.
+
+    Each version's item layout is read at most once, and only when a
+    record of that version turns up; decoders are built once per
+    (version, recordType). So one pass over a mixed-version submission
+    dispatches each record to the right decoder.
+
+    >>> def item(naaccrId, naaccrNum, startColumn, length, recordTypes='A,M,C,I'):
+    ...     return ({'naaccrId': naaccrId, 'naaccrNum': naaccrNum, 'naaccrName': naaccrId,
+    ...              'startColumn': startColumn, 'length': length, 'parentXmlElement': 'Tumor'},
+    ...             recordTypes.split(','))
+    >>> common = [item('recordType', 10, 1, 1), item('naaccrRecordVersion', 50, 17, 3)]
+    >>> reg = LayoutRegistry({
+    ...     '160': lambda: common + [item('primarySite', 400, 20, 4)],
+    ...     '180': lambda: common + [item('primarySite', 400, 24, 4),
+    ...                              item('textDxProcPe', 2520, 28, 4, 'A,C')]})
+
+    >>> lines = ['I' + ' ' * 15 + '160' + 'C500',
+    ...          'A' + ' ' * 15 + '180' + '    C341TEXT']
+    >>> for version, recordType, values in reg.decode_lines(lines):
+    ...     print(version, recordType, [(d['naaccrId'], v) for d, v in values][2:])
+    160 I [('primarySite', 'C500')]
+    180 A [('primarySite', 'C341'), ('textDxProcPe', 'TEXT')]
+
+    Items outside the record type are skipped; unknown versions are an error:
+
+    >>> [d['naaccrId'] for d, v in reg.decoder('180', 'I')('I' + ' ' * 15 + '180    C341TEXT')]
+    ['recordType', 'naaccrRecordVersion', 'primarySite']
+    >>> reg.detect('I' + ' ' * 15 + '150')
+    Traceback (most recent call last):
+      ...
+    ValueError: unsupported naaccrRecordVersion: '150' (not in ['160', '180'])
+    """
+    version_columns = slice(16, 19)  # startColumn 17, length 3
+    record_type_columns = slice(0, 1)
+
+    def __init__(self, layouts: Mapping[str, Callable[[], Iterable[Tuple[ItemDef_T, Sequence[str]]]]]) -> None:
+        self.__layouts = dict(layouts)
+        self.__items: Dict[str, List[Tuple[ItemDef_T, Sequence[str]]]] = {}
+        self.__decoders: Dict[Tuple[str, str], RecordDecoder] = {}
+        self.__lock = threading.Lock()
+
+    @property
+    def versions(self) -> List[str]:
+        return sorted(self.__layouts.keys())
+
+    def detect(self, record: str) -> Tuple[str, str]:
+        version = record[self.version_columns]
+        if version not in self.__layouts:
+            raise ValueError(f'unsupported naaccrRecordVersion: {version!r} (not in {self.versions})')
+        return version, record[self.record_type_columns]
+
+    def decoder(self, version: str, recordType: str) -> RecordDecoder:
+        key = (version, recordType)
+        found = self.__decoders.get(key)
+        if found:
+            return found
+        with self.__lock:
+            if version not in self.__items:
+                self.__items[version] = list(self.__layouts[version]())
+            spans = tuple((item, slice(item['startColumn'] - 1, item['startColumn'] - 1 + item['length']))
+                          for item, recordTypes in self.__items[version]
+                          if recordType in recordTypes)
+
+            def decode(record: str) -> List[Tuple[ItemDef_T, str]]:
+                values = ((item, record[span].strip()) for item, span in spans)
+                return [(item, value) for item, value in values if value]
+            self.__decoders[key] = decode
+        return decode
+
+    def decode_lines(self, lines: Iterable[str]) -> Iterator[Tuple[str, str, List[Tuple[ItemDef_T, str]]]]:
+        for line in lines:
+            version, recordType = self.detect(line)
+            yield version, recordType, self.decoder(version, recordType)(line)
 
 
 def eltSchema(xsd_complex_type: XML.Element,
@@ -413,7 +708,7 @@ RecordMaker = Callable[[XML.Element, tab.Schema, bool],
 
 
 def xmlDF(schema: tab.Schema,
-          doc: XML.ElementTree, path: str, ns: Dict[str, str],
+          doc: 'XML.ElementTree[XML.Element]', path: str, ns: Dict[str, str],
           eltRecords: Opt[RecordMaker] = None,
           simpleContent: bool = False) -> tab.DataFrame:
     data = xmlRecords(schema, doc, path, ns, eltRecords, simpleContent)
@@ -421,7 +716,7 @@ def xmlDF(schema: tab.Schema,
 
 
 def xmlRecords(schema: tab.Schema,
-               doc: XML.ElementTree, path: str, ns: Dict[str, str],
+               doc: 'XML.ElementTree[XML.Element]', path: str, ns: Dict[str, str],
                eltRecords: Opt[RecordMaker] = None,
                simpleContent: bool = False) -> Iterator[Dict[str, Opt[tab.Value]]]:
     """
@@ -453,72 +748,380 @@ def eltDict(elt: XML.Element, schema: tab.Schema,
     yield out
 
 
-def ddictDF() -> tab.DataFrame:
+def ddictDF(cache: Opt['MetaCache'] = None) -> tab.DataFrame:
+    if cache:
+        return cache.table('ddictDF', NAACCR1._digest(cache), ddictDF)
     return xmlDF(schema=eltSchema(XSD.the(NAACCR1.ItemDef, '*')),
                  doc=NAACCR1.ndd180,
                  path='./n:ItemDefs/n:ItemDef',
                  ns=NAACCR1.ns)
 
 
-def _with_path(gen: ContextManager[Path_T], f: Callable[[Path_T], tab.DataFrame]) -> tab.DataFrame:
+def _with_path(gen: ContextManager[Path_T], f: Callable[[Path_T], T]) -> T:
     with gen as p:
         return f(p)
 
 
-class LOINC_NAACCR:
-    measure = _with_path(res.path(loinc_naaccr, 'loinc_naaccr.csv'),
-                         tab.read_csv)
+class MetaCache:
+    """Decoded NAACCR metadata, persisted in a sqlite file.
+
+    Entries are keyed by name and a digest of the resources they are
+    decoded from, along with `format_version`; change a resource, or
+    bump `format_version` when the decoding changes, and stale entries
+    are recomputed.
+
+    >>> import sqlite3, tempfile
+    >>> from pathlib import Path
+    >>> tmp = tempfile.TemporaryDirectory()
+    >>> cache = MetaCache(Path(tmp.name) / 'meta.db', sqlite3.connect)
+    >>> calls = []
+    >>> def compute():
+    ...     calls.append(1)
+    ...     return [[10, 'recordType'], [30, 'registryType']]
+    >>> cache.get('demo', 'abc', compute)
+    [[10, 'recordType'], [30, 'registryType']]
+    >>> cache.get('demo', 'abc', compute), len(calls)
+    ([[10, 'recordType'], [30, 'registryType']], 1)
+    >>> _ = cache.get('demo', 'def', compute); len(calls)
+    2
+
+    Relations are saved with their schema:
+
+    >>> df = tab.DataFrame.from_records([dict(naaccrNum=10, naaccrId='recordType')])
+    >>> cache.table('demo_df', 'abc', lambda: df)
+    DataFrame({'naaccrNum': 'number', 'naaccrId': 'string'})
+    >>> list(cache.table('demo_df', 'abc', lambda: df).iterrows())
+    [(0, [10, 'recordType'])]
+
+    Digests cover resource file names, sizes, and modification times,
+    rather than contents, and are computed once per process:
+
+    >>> (Path(tmp.name) / 'x.csv').write_text('a,b')
+    3
+    >>> cache.digest(Path(tmp.name) / 'x.csv') == cache.digest(Path(tmp.name) / 'x.csv')
+    True
+    >>> cache.digest(Path(tmp.name) / 'x.csv') == cache.digest(Path(tmp.name))
+    False
+    >>> tmp.cleanup()
+    """
+    format_version = 2
+    table_name = 'meta_cache'
+    _digests = {}  # type: Dict[Tuple[str, ...], str]
+    _digest_lock = threading.Lock()
+
+    def __init__(self, db: Path_T, connect: Callable[..., Connection]) -> None:
+        self.__db = db
+        self.__connect = connect
+
+    def _conn(self) -> Connection:
+        conn = self.__connect(str(self.__db), timeout=30.0)
+        conn.execute(f'''create table if not exists {self.table_name} (
+                           name text primary key, digest text not null, value text not null)''')
+        return conn
+
+    @_lazy
+    def code_version(cls) -> str:
+        """Size and modification time of this module, which does the decoding.
+
+        There's no package version to go by.
+        """
+        from pathlib import Path  # ISSUE: ambient
+        info = Path(__file__).stat()
+        return f'{info.st_size} {info.st_mtime_ns}'
+
+    @classmethod
+    def digest(cls, *paths: Path_T) -> str:
+        key = tuple(str(path) for path in paths)
+        with cls._digest_lock:
+            found = cls._digests.get(key)
+            if found is None:
+                h = hashlib.sha1(f'format {cls.format_version} code {cls.code_version}'.encode('utf-8'))
+                for path in paths:
+                    for f in (sorted(path.rglob('*')) if path.is_dir() else [path]):
+                        if f.is_file():
+                            info = f.stat()
+                            h.update(f'{f} {info.st_size} {info.st_mtime_ns}\n'.encode('utf-8'))
+                found = cls._digests[key] = h.hexdigest()
+        return found
 
-    answer = _with_path(res.path(loinc_naaccr, 'loinc_naaccr_answer.csv'),
-                        tab.read_csv)
-    answer_struct: tab.Schema = {'columns': [
-        {'number': ix + 1,
-         'name': n.lower(),
-         'datatype': 'number' if n.lower() == 'sequence_no' else 'string',
-         'null': []}
-        for (ix, n) in enumerate(answer.columns)
-    ]}
+    def get(self, name: str, digest: str, compute: Callable[[], Any]) -> Any:
+        """Get JSON-style value from the cache, or compute and save it.
+        """
+        conn = self._conn()
+        try:
+            found = conn.execute(f'select value from {self.table_name} where name = ? and digest = ?',
+                                 (name, digest)).fetchone()
+            if found:
+                return json.loads(found[0])
+            log.info('metadata cache miss: %s', name)
+            value = json.loads(json.dumps(compute()))  # e.g. tuples -> lists, as on a hit
+            with conn:
+                conn.execute(f'insert or replace into {self.table_name} (name, digest, value) values (?, ?, ?)',
+                             (name, digest, json.dumps(value)))
+            return value
+        finally:
+            conn.close()
+
+    def table(self, name: str, digest: str, compute: Callable[[], tab.Relation]) -> tab.DataFrame:
+        """Get a relation (of JSON values: numbers, strings, booleans) from the cache.
+        """
+        def save() -> Dict[str, object]:
+            df = compute()
+            columns = [dict(col, number=ix + 1) for ix, col in enumerate(df.schema['columns'])]
+            return dict(columns=columns, rows=[row for _, row in df.iterrows()])
+        saved = self.get(name, digest, save)
+        return tab.DataFrame(saved['rows'], {'columns': saved['columns']})
+
+
+class LOINC_NAACCR:
+    @_lazy
+    def measure(cls) -> tab.DataFrame:
+        return _with_path(res.path(loinc_naaccr, 'loinc_naaccr.csv'),
+                          tab.read_csv)
+
+    @_lazy
+    def answer(cls) -> tab.DataFrame:
+        return _with_path(res.path(loinc_naaccr, 'loinc_naaccr_answer.csv'),
+                          tab.read_csv)
+
+    @_lazy
+    def answer_struct(cls) -> tab.Schema:
+        return {'columns': [
+            {'number': ix + 1,
+             'name': n.lower(),
+             'datatype': 'number' if n.lower() == 'sequence_no' else 'string',
+             'null': []}
+            for (ix, n) in enumerate(cls.answer.columns)
+        ]}
 
 
 class NAACCR_R:
     # Names assumed by naaccr_txform.sql
 
-    field_info = _with_path(res.path(naaccr_r_raw, 'field_info.csv'),
-                            tab.read_csv)
-    field_code_scheme = _with_path(res.path(naaccr_r_raw, 'field_code_scheme.csv'),
-                                   tab.read_csv)
+    @_lazy
+    def field_info(cls) -> tab.DataFrame:
+        return _with_path(res.path(naaccr_r_raw, 'field_info.csv'),
+                          tab.read_csv)
+
+    @_lazy
+    def field_code_scheme(cls) -> tab.DataFrame:
+        return _with_path(res.path(naaccr_r_raw, 'field_code_scheme.csv'),
+                          tab.read_csv)
 
     @classmethod
     def _code_labels(cls) -> ContextManager[Path_T]:
         return res.path(naaccr_r_raw, 'code-labels')
 
+    _labels: Dict[Tuple[bool, Tuple[str, ...]], tab.DataFrame] = {}
+    _labels_lock = threading.Lock()
+
+    code_label_schema: tab.Schema = {'columns': [
+        {'number': 1, 'name': "code", 'datatype': 'string', 'null': []},
+        {'number': 2, 'name': "label", 'datatype': 'string', 'null': []},
+        {'number': 3, 'name': "means_missing", 'datatype': 'boolean', 'null': []},
+        {'number': 4, 'name': "description", 'datatype': 'string', 'null': ['']}]}
+
     @classmethod
     def code_labels(cls,
-                    implicit: List[str] = ['iso_country']) -> tab.DataFrame:
-        found = []
-        schema: tab.Schema = {'columns': [
-            {'number': 1, 'name': "code", 'datatype': 'string', 'null': []},
-            {'number': 2, 'name': "label", 'datatype': 'string', 'null': []},
-            {'number': 3, 'name': "means_missing", 'datatype': 'boolean', 'null': []},
-            {'number': 4, 'name': "description", 'datatype': 'string', 'null': ['']}]}
+                    implicit: List[str] = ['iso_country'],
+                    cache: Opt['MetaCache'] = None) -> tab.DataFrame:
+        """Code labels of all schemes, with item and name of fields that use them.
+
+        Computed once per process (per `implicit`, and separately with and
+        without a cache, so that a cached call still saves it), reading
+        the scheme files concurrently.
+        """
+        key = (cache is not None, tuple(implicit))
+        with cls._labels_lock:
+            found = cls._labels.get(key)
+            if found is None:
+                found = cls._labels[key] = (cls._cached_labels(implicit, cache) if cache
+                                            else cls._assemble_labels(implicit))
+        return found
+
+    _label_index: Dict[Tuple[bool, Tuple[str, ...]], Mapping[Tuple[Any, str, str, str], str]] = {}
+
+    @classmethod
+    def code_label_index(cls,
+                         implicit: List[str] = ['iso_country'],
+                         cache: Opt['MetaCache'] = None) -> Mapping[Tuple[Any, str, str, str], str]:
+        """(item, name, scheme, code) -> label, for per-value lookup.
+
+        Built once per process from code_labels (and memoized the same way).
+        """
+        key = (cache is not None, tuple(implicit))
+        found = cls._label_index.get(key)
+        if found is None:
+            labels = cls.code_labels(implicit, cache)
+            item, name, scheme, code, label = [labels.columns.index(c)
+                                               for c in ['item', 'name', 'scheme', 'code', 'label']]
+            index = MappingProxyType({
+                cast(Tuple[Any, str, str, str], (row[item], row[name], row[scheme], row[code])): cast(str, row[label])
+                for _, row in labels.iterrows()})
+            with cls._labels_lock:
+                found = cls._label_index.setdefault(key, index)
+        return found
+
+    @classmethod
+    def _cached_labels(cls, implicit: List[str], cache: 'MetaCache') -> tab.DataFrame:
+        digest = _with_path(res.path(naaccr_r_raw, 'field_code_scheme.csv'), cache.digest)
+        digest += _with_path(res.path(naaccr_r_raw, 'field_info.csv'), cache.digest)
+        digest += _with_path(cls._code_labels(), cache.digest)
+        return cache.table('NAACCR_R.code_labels ' + ','.join(implicit), digest,
+                           lambda: cls._assemble_labels(implicit))
+
+    @classmethod
+    def _assemble_labels(cls, implicit: List[str]) -> tab.DataFrame:
         with cls._code_labels() as cl_dir:
-            for scheme in cls.field_code_scheme.scheme.unique():
-                if scheme in implicit:
-                    continue
-                info = (cl_dir / str(scheme)).with_suffix('.csv')
-                skiprows = 0
-                if info.open().readline().startswith('#'):
-                    skiprows = 1
-                codes = tab.read_csv(info, schema=schema, skiprows=skiprows)
-                codes = codes.withColumn('scheme', codes.code.const(info.stem))
-                if 'code' not in codes.columns or 'label' not in codes.columns:
-                    raise ValueError((info, codes.columns))
-                found.append(codes)
+            paths = [(cl_dir / str(scheme)).with_suffix('.csv')
+                     for scheme in cls.field_code_scheme.scheme.unique()
+                     if scheme not in implicit]
+            with ThreadPoolExecutor() as pool:
+                found = list(pool.map(cls._scheme_codes, paths))
         all_schemes = tab.concat(found)
         with_fields = all_schemes.merge(cls.field_code_scheme)
         with_field_info = with_fields.merge(cls.field_info.select('item', 'name'))
         return with_field_info
 
+    @classmethod
+    def _scheme_codes(cls, info: Path_T) -> tab.DataFrame:
+        """Read a scheme file in one pass, skipping a leading # comment line."""
+        decode = tab.DataFrame.decoder(cls.code_label_schema)
+        with info.open() as fp:
+            first = fp.readline()
+            reader = csv.reader(itertools.chain([] if first.startswith('#') else [first], fp))
+            next(reader)  # header
+            codes = tab.DataFrame([decode(row) for row in reader], cls.code_label_schema)
+        codes = codes.withColumn('scheme', codes.code.const(info.stem))
+        if 'code' not in codes.columns or 'label' not in codes.columns:
+            raise ValueError((info, codes.columns))
+        return codes
+
+
+ICDOConcept = TypedDict('ICDOConcept', {
+    'lvl': int,
+    'concept_cd': str,
+    'c_visualattributes': str,
+    'path': str,
+    'concept_name': str,
+})
+
+
+class _TrieNode:
+    __slots__ = ('children', 'concept')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.concept: Opt[ICDOConcept] = None
+
+
+class ICDOTrie:
+    r"""Prefix trie of ICD-O concepts, keyed by concept_cd.
+
+    >>> topo = tab.DataFrame.from_records([
+    ...     dict(Kode='C50', Lvl='3', Title='BREAST'),
+    ...     dict(Kode='C50.0', Lvl='4', Title='Nipple'),
+    ...     dict(Kode='C50.9', Lvl='4', Title='Breast, NOS'),
+    ...     dict(Kode='C50.9', Lvl='incl', Title='Mammary gland')])
+    >>> trie = ICDOTrie.from_topo(topo)
+    >>> for c in trie.concepts():
+    ...     print(c['lvl'], c['concept_cd'], c['c_visualattributes'], c['path'], c['concept_name'])
+    3 C50 FA C50\ BREAST
+    4 C500 LA C50\C50.0\ Nipple
+    4 C509 LA C50\C50.9\ Breast, NOS
+
+    It doubles as a lookup from site codes to ancestor paths:
+
+    >>> trie.ancestors('C509')
+    ['C50\\', 'C50\\C50.9\\']
+    >>> trie.ancestors('C61')
+    []
+
+    Morphology codes are grouped by their first 3 digits; as in
+    histologicTypeIcdO3, behavior is left out, and each histology is
+    named by its malignant (/3) title, if any:
+
+    >>> morph = tab.DataFrame.from_records([
+    ...     dict(code='8500/2', label='title', notes='Intraductal carcinoma, noninfiltrating, NOS'),
+    ...     dict(code='8500/3', label='title', notes='Infiltrating duct carcinoma, NOS'),
+    ...     dict(code='8500/3', label='synonym', notes='Duct adenocarcinoma, NOS'),
+    ...     dict(code='8501/2', label='title', notes='Comedocarcinoma, noninfiltrating')])
+    >>> for c in ICDOTrie.from_morph(morph).concepts():
+    ...     print(c['lvl'], c['concept_cd'], c['c_visualattributes'], c['path'], c['concept_name'])
+    3 850 FA 850\ 850
+    4 8500 LA 850\8500\ Infiltrating duct carcinoma, NOS
+    4 8501 LA 850\8501\ Comedocarcinoma, noninfiltrating
+    """
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+
+    def insert(self, concept: ICDOConcept) -> None:
+        node = self.root
+        for ch in concept['concept_cd']:
+            node = node.children.setdefault(ch, _TrieNode())
+        node.concept = concept
+
+    def concepts(self) -> Iterator[ICDOConcept]:
+        """Concepts in prefix order: each major before its minors."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.concept:
+                yield node.concept
+            stack.extend(node.children[k] for k in sorted(node.children, reverse=True))
+
+    def find(self, code: str) -> Opt[ICDOConcept]:
+        node: Opt[_TrieNode] = self.root
+        for ch in code:
+            node = node.children.get(ch) if node else None
+        return node.concept if node else None
+
+    def ancestors(self, code: str) -> List[str]:
+        """Paths of concepts along code, from the top down (including code itself)."""
+        found = []
+        node = self.root
+        for ch in code:
+            if ch not in node.children:
+                return []
+            node = node.children[ch]
+            if node.concept:
+                found.append(node.concept['path'])
+        return found if node.concept else []
+
+    def to_df(self) -> tab.DataFrame:
+        return tab.DataFrame.from_records(cast(List[Dict[str, Opt[tab.Value]]], list(self.concepts())))
+
+    @classmethod
+    def from_topo(cls, topo: tab.DataFrame) -> 'ICDOTrie':
+        trie = cls()
+        for _, [kode, lvl, title] in topo.select('Kode', 'Lvl', 'Title').iterrows():
+            code = str(kode)
+            if lvl == '3':
+                trie.insert({'lvl': 3, 'concept_cd': code, 'c_visualattributes': 'FA',
+                             'path': code + '\\', 'concept_name': str(title)})
+            elif lvl == '4':
+                major = code.split('.')[0]
+                trie.insert({'lvl': 4, 'concept_cd': code.replace('.', ''), 'c_visualattributes': 'LA',
+                             'path': major + '\\' + code + '\\', 'concept_name': str(title)})
+        return trie
+
+    @classmethod
+    def from_morph(cls, morph: tab.DataFrame) -> 'ICDOTrie':
+        trie = cls()
+        for _, [code, label, notes] in morph.select('code', 'label', 'notes').iterrows():
+            code = str(code)
+            if label != 'title' or '/' not in code:
+                continue
+            histology, behavior = code.split('/', 1)
+            major = histology[:3]
+            if trie.find(major) is None:
+                trie.insert({'lvl': 3, 'concept_cd': major, 'c_visualattributes': 'FA',
+                             'path': major + '\\', 'concept_name': major})
+            if trie.find(histology) is None or behavior == '3':
+                trie.insert({'lvl': 4, 'concept_cd': histology, 'c_visualattributes': 'LA',
+                             'path': major + '\\' + histology + '\\', 'concept_name': str(notes)})
+        return trie
+
 
 class OncologyMeta:
     morph3_info = ('ICD-O-2_CSV.zip', 'icd-o-3-morph.csv', ['code', 'label', 'notes'])
@@ -527,8 +1130,15 @@ class OncologyMeta:
 
     @classmethod
     def read_table(cls, cache: Path_T,
-                   zip: str, item: str, names: Opt[Sequence[str]]) -> tab.DataFrame:
-        import csv
+                   zip: str, item: str, names: Opt[Sequence[str]],
+                   meta_cache: Opt[MetaCache] = None) -> tab.DataFrame:
+        """Decode a table from a WHO ICD-O zip archive.
+
+        With a meta_cache, the decoded table is saved, keyed by a hash of the zip.
+        """
+        if meta_cache:
+            return meta_cache.table(f'OncologyMeta {zip} {item}', meta_cache.digest(cache / zip),
+                                    lambda: cls.read_table(cache, zip, item, names))
 
         archive = zipfile.ZipFile(cache / zip)
 
@@ -545,24 +1155,92 @@ class OncologyMeta:
 
     @classmethod
     def icd_o_topo(cls, topo: tab.DataFrame) -> tab.DataFrame:
-        major = topo[topo.Lvl == '3']
-        minor = topo[(topo.Lvl == '4')]
-        minor = minor.withColumn('major', minor.Kode.apply(lambda s: str(s).split('.')[0]))
-        out3 = tab.DataFrame.from_columns(dict(
-            lvl=major.Kode.const(3),
-            concept_cd=major.Kode,
-            c_visualattributes=major.Kode.const('FA'),
-            path=major.Kode.apply(lambda s: str(s) + '\\'),
-            concept_name=major.Title
-        ))
-        out4 = tab.DataFrame.from_columns(dict(
-            lvl=minor.Kode.const(4),
-            concept_cd=minor.Kode.apply(lambda v: str(v).replace('.', '')),
-            c_visualattributes=minor.Kode.const('LA'),
-            path=minor.apply('string', lambda major, Kode, **_: major + '\\' + Kode + '\\'),
-            concept_name=minor.Title
-        ))
-        return tab.concat([out3, out4])
+        return ICDOTrie.from_topo(topo).to_df()
+
+    @classmethod
+    def icd_o_morph(cls, morph: tab.DataFrame) -> tab.DataFrame:
+        return ICDOTrie.from_morph(morph).to_df()
+
+
+class ConceptClosure:
+    r"""Ancestor/descendant closure of ontology terms, by c_fullname prefix.
+
+    Terms are numbered in c_fullname order, which is a preorder walk
+    of the hierarchy, so each term's descendants are the contiguous
+    ids lft < id <= rgt (a nested set). One pass with a stack of open
+    ancestors gives both that and the closure pairs.
+
+    >>> terms = tab.DataFrame.from_records([
+    ...     dict(c_fullname='\\n\\', c_hlevel=1, c_basecode=None, c_name='top'),
+    ...     dict(c_fullname='\\n\\S1\\', c_hlevel=2, c_basecode=None, c_name='section'),
+    ...     dict(c_fullname='\\n\\S1\\400\\', c_hlevel=3, c_basecode='NAACCR|400:', c_name='site'),
+    ...     dict(c_fullname='\\n\\S1\\400\\C50\\', c_hlevel=4, c_basecode='NAACCR|400:C50', c_name='breast'),
+    ...     dict(c_fullname='\\n\\S2\\', c_hlevel=2, c_basecode=None, c_name='other')])
+    >>> cc = ConceptClosure.of(terms)
+    >>> for _, row in cc.terms.iterrows():
+    ...     print(row)
+    [0, '\\n\\', None, 'top', 1, 0, 4]
+    [1, '\\n\\S1\\', None, 'section', 2, 1, 3]
+    [2, '\\n\\S1\\400\\', 'NAACCR|400:', 'site', 3, 2, 3]
+    [3, '\\n\\S1\\400\\C50\\', 'NAACCR|400:C50', 'breast', 4, 3, 3]
+    [4, '\\n\\S2\\', None, 'other', 2, 4, 4]
+
+    The closure is reflexive (depth 0) so that rollups can choose to
+    include a term's own facts:
+
+    >>> sorted((a, d, depth) for _, [a, d, depth] in cc.closure.iterrows() if a == 1)
+    [(1, 1, 0), (1, 2, 1), (1, 3, 2)]
+    """
+    terms_schema: tab.Schema = {'columns': [
+        {'number': 1, 'name': 'term_id', 'datatype': 'number', 'null': []},
+        {'number': 2, 'name': 'c_fullname', 'datatype': 'string', 'null': []},
+        {'number': 3, 'name': 'c_basecode', 'datatype': 'string', 'null': ['']},
+        {'number': 4, 'name': 'c_name', 'datatype': 'string', 'null': ['']},
+        {'number': 5, 'name': 'c_hlevel', 'datatype': 'number', 'null': []},
+        {'number': 6, 'name': 'lft', 'datatype': 'number', 'null': []},
+        {'number': 7, 'name': 'rgt', 'datatype': 'number', 'null': []}]}
+    closure_schema: tab.Schema = {'columns': [
+        {'number': 1, 'name': 'ancestor_id', 'datatype': 'number', 'null': []},
+        {'number': 2, 'name': 'descendant_id', 'datatype': 'number', 'null': []},
+        {'number': 3, 'name': 'depth', 'datatype': 'number', 'null': []}]}
+
+    # for create_objects(indexes=...)
+    indexes: Mapping[str, Sequence[Sequence[str]]] = {
+        'concept_terms': [['term_id'], ['c_basecode']],
+        'concept_closure': [['ancestor_id'], ['descendant_id']],
+    }
+
+    def __init__(self, terms: tab.DataFrame, closure: tab.DataFrame) -> None:
+        self.terms = terms
+        self.closure = closure
+
+    @classmethod
+    def of(cls, ontology: tab.Relation) -> 'ConceptClosure':
+        cols = [c.lower() for c in ontology.columns]  # Oracle folds names to upper case
+        ix = [cols.index(name) for name in ['c_fullname', 'c_basecode', 'c_name', 'c_hlevel']]
+        rows = sorted(([row[i] for i in ix] for _, row in ontology.iterrows()),
+                      key=lambda row: str(row[0]))
+        terms: List[List[Opt[tab.Value]]] = []
+        pairs: List[List[Opt[tab.Value]]] = []
+        open_: List[Tuple[int, str, int]] = []  # (term_id, c_fullname, c_hlevel) of ancestors
+
+        def close(until: int) -> None:
+            while len(open_) > until:
+                term_id, _, _ = open_.pop()
+                terms[term_id][6] = len(terms) - 1
+
+        for term_id, [fullname, basecode, name, hlevel] in enumerate(rows):
+            path, level = str(fullname), int(cast(int, hlevel))
+            keep = len(open_)
+            while keep and not (path.startswith(open_[keep - 1][1]) and level > open_[keep - 1][2]):
+                keep -= 1
+            close(keep)
+            terms.append([term_id, path, basecode, name, level, term_id, term_id])
+            pairs.append([term_id, term_id, 0])
+            pairs.extend([anc_id, term_id, level - anc_level] for anc_id, _, anc_level in open_)
+            open_.append((term_id, path, level))
+        close(0)
+        return cls(tab.DataFrame(terms, cls.terms_schema), tab.DataFrame(pairs, cls.closure_schema))
 
 
 class NAACCR_I2B2(object):
@@ -570,13 +1248,19 @@ class NAACCR_I2B2(object):
     c_name = 'Cancer Cases (NAACCR Hierarchy)'
     sourcesystem_cd = 'heron-admin@kumc.edu'
 
-    tumor_item_type = _with_path(res.path(heron_load, 'tumor_item_type.csv'),
-                                 tab.read_csv)
+    @_lazy
+    def tumor_item_type(cls) -> tab.DataFrame:
+        return _with_path(res.path(heron_load, 'tumor_item_type.csv'),
+                          tab.read_csv)
 
-    seer_recode_terms = _with_path(res.path(heron_load, 'seer_recode_terms.csv'),
-                                   tab.read_csv)
+    @_lazy
+    def seer_recode_terms(cls) -> tab.DataFrame:
+        return _with_path(res.path(heron_load, 'seer_recode_terms.csv'),
+                          tab.read_csv)
 
-    cs_terms = _with_path(res.path(heron_load, 'cs-terms.csv'),
+    @_lazy
+    def cs_terms(cls) -> tab.DataFrame:
+        return _with_path(res.path(heron_load, 'cs-terms.csv'),
                           tab.read_csv).drop(['update_date', 'sourcesystem_cd'])
 
     tx_script = SqlScript(
@@ -586,8 +1270,10 @@ class NAACCR_I2B2(object):
 
     per_item_view = 'tumor_item_type'
 
-    per_section = _with_path(res.path(heron_load, 'section.csv'),
-                             tab.read_csv)
+    @_lazy
+    def per_section(cls) -> tab.DataFrame:
+        return _with_path(res.path(heron_load, 'section.csv'),
+                          tab.read_csv)
 
     ont_script = SqlScript(
         'naaccr_concepts_load.sql',
@@ -599,7 +1285,7 @@ class NAACCR_I2B2(object):
             ('item_concepts', [per_item_view]),
             ('code_concepts', [per_item_view, 'loinc_naaccr_answer', 'code_labels']),
             ('primary_site_concepts', ['icd_o_topo']),
-            # TODO: morphology
+            ('histology_concepts', ['icd_o_morph']),
             ('seer_recode_concepts', ['seer_site_terms', 'naaccr_top']),
             ('site_schema_concepts', ['cs_terms']),
             ('naaccr_ontology', []),
@@ -607,15 +1293,21 @@ class NAACCR_I2B2(object):
 
     @classmethod
     def ont_view_in(cls, spark: SparkSession_T, task_hash: str, update_date: dt.date,
-                    who_cache: Opt[Path_T] = None) -> DataFrame:
+                    who_cache: Opt[Path_T] = None,
+                    meta_cache: Opt[MetaCache] = None) -> DataFrame:
         if who_cache:
-            who_topo = OncologyMeta.read_table(who_cache, *OncologyMeta.topo_info)
+            who_topo = OncologyMeta.read_table(who_cache, *OncologyMeta.topo_info, meta_cache=meta_cache)
             icd_o_topo = OncologyMeta.icd_o_topo(who_topo)
+            who_morph = OncologyMeta.read_table(who_cache, *OncologyMeta.morph3_info, meta_cache=meta_cache)
+            icd_o_morph = OncologyMeta.icd_o_morph(who_morph)
         else:
-            log.warn('skipping WHO Topology terms')
+            log.warn('skipping WHO Topology and Morphology terms')
             icd_o_topo = tab.DataFrame.from_records([dict(
                 lvl=3, concept_cd='C00', c_visualattributes='FA',
                 path='abc', concept_path='LIP', concept_name='x')])
+            icd_o_morph = tab.DataFrame.from_records([dict(
+                lvl=3, concept_cd='800', c_visualattributes='FA',
+                path='800\\', concept_name='x')])
 
         top = tab.DataFrame.from_records([dict(
             c_hlevel=1,
@@ -625,13 +1317,19 @@ class NAACCR_I2B2(object):
             sourcesystem_cd=cls.sourcesystem_cd)])
         current_task = tab.DataFrame.from_records([dict(task_hash=task_hash)])
         views = create_objects(spark, cls.ont_script,
+                               indexes={
+                                   'tumor_item_type': [['naaccrNum']],
+                                   'loinc_naaccr_answer': [['code_value', 'answerlistid']],
+                                   'code_labels': [['item', 'code']],
+                               },
                                current_task=current_task,
                                naaccr_top=top,
                                section=cls.per_section,
                                tumor_item_type=cls.tumor_item_type,
                                loinc_naaccr_answer=LOINC_NAACCR.answer,
-                               code_labels=NAACCR_R.code_labels(),
+                               code_labels=NAACCR_R.code_labels(cache=meta_cache),
                                icd_o_topo=icd_o_topo,
+                               icd_o_morph=icd_o_morph,
                                cs_terms=cls.cs_terms,
                                seer_site_terms=cls.seer_recode_terms)
 
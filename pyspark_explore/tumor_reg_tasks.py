@@ -37,7 +37,8 @@ import eliot as el
 import luigi
 
 from sql_script import SQL, Environment, BindValue, Params
-from sql_script import DBSession, SqlScript, SqlScriptError, to_qmark
+from sql_script import DBSession, Profile, SqlScript, SqlScriptError, to_qmark
+from heron_staging.tumor_reg import csschema_index
 import heron_load
 import param_val as pv
 import tumor_reg_data as td
@@ -197,6 +198,12 @@ class JDBCTask(luigi.Task):
                 finally:
                     conn.close()
 
+    def loader_account(self, name: str) -> td.Account:
+        """Account (via the java Loader) with this task's connection settings."""
+        from subprocess import Popen  # ISSUE: AMBIENT
+        return td.Account(name, self.user, self.__password, Popen,
+                          url=self.db_url, driver=self.driver)
+
     # ISSUE: dates are not JSON serializable, so log_call doesn't grok.
     @el.log_call(include_args=['fname', 'variables'])
     def run_script(self,
@@ -372,6 +379,10 @@ class NAACCR_Ontology1(JDBCTask):
     )
     naaccr_version = pv.IntParam(default=18)  # ISSUE: ignored?
     jdbc_driver_jar = pv.StrParam(significant=False)
+    meta_cache = pv.StrParam(default='', significant=False,
+                             description='sqlite file for parsed NAACCR metadata (empty: no cache)')
+    incremental = pv.BoolParam(default=False, significant=False,
+                               description='publish only changes to terms already in table_name')
 
     # based on custom_meta
     col_to_type = dict(
@@ -414,24 +425,33 @@ class NAACCR_Ontology1(JDBCTask):
     def classpath(self) -> str:
         return self.jdbc_driver_jar
 
-    @property
-    def __password(self) -> str:
-        from os import environ  # ISSUE: ambient
-        return environ[self.passkey]
-
     def account(self) -> td.Account:
-        from subprocess import Popen  # ISSUE: AMBIENT
-        return td.Account('DEID', self.user, self.__password, Popen,
-                          url=self.db_url, driver=self.driver)
+        return self.loader_account('DEID')
 
     def run(self) -> None:
         conn = connect_mem(':memory:', detect_types=PARSE_COLNAMES)
         spark = DBSession(conn)
+        spark.profile = Profile(on_record=lambda stats: el.Message.log(message_type='sql_profile', **stats))
         update_date = dt.datetime.strptime(self.z_design_id[:10], '%Y-%m-%d').date()
+        meta_cache = None
+        if self.meta_cache:
+            from pathlib import Path  # ISSUE: ambient
+            meta_cache = tr_ont.MetaCache(Path(self.meta_cache), connect_mem)
         terms = tr_ont.NAACCR_I2B2.ont_view_in(
-            spark, who_cache=self.who_cache, task_hash=self.task_hash, update_date=update_date)
+            spark, who_cache=self.who_cache, task_hash=self.task_hash, update_date=update_date,
+            meta_cache=meta_cache)
+        el.Message.log(message_type='sql_profile_summary', summary=spark.profile.summary())
         cdw = self.account()
-        cdw.wr(self.table_name, td.case_fold(terms))
+        if not self.incremental:
+            cdw.wr(self.table_name, td.case_fold(terms))
+            return
+        published = cdw.query(fr"""
+          select * from {self.table_name}
+          where c_fullname like '{tr_ont.NAACCR_I2B2.top_folder}%'
+        """)
+        delta = td.TermDelta.of(published, td.case_fold(terms))
+        el.Message.log(message_type='ontology_delta', **delta.counts)
+        cdw.apply(self.table_name, delta)
 
 
 class ManualTask(luigi.Task):
@@ -456,9 +476,12 @@ class NAACCR_FlatFile(ManualTask):
 
     def check_version_param(self) -> None:
         """Only version 18 (180) is currently supported.
+
+        NAACCR1.registry has a 160 layout too, but _checkItem, TumorTable,
+        and the tasks downstream still decode by the v18 layout only.
         """
         if self.naaccrRecordVersion != 180:
-            raise NotImplementedError()
+            raise NotImplementedError(self.naaccrRecordVersion)
 
     def complete(self) -> bool:
         with task_action(self, 'complete') as ctx:
@@ -503,10 +526,8 @@ class NAACCR_FlatFile(ManualTask):
         >>> NAACCR_FlatFile._checkItem(record0, 'npiRegistryId', 'XXX')
         False
         '''
-        itemDef = tr_ont.NAACCR1.itemDef(naaccrId)
-        [startColumn, length] = [int(itemDef.attrib[it])
-                                 for it in ['startColumn', 'length']]
-        startColumn -= 1
+        itemDef = tr_ont.NAACCR1.index.by_id[naaccrId]
+        startColumn, length = itemDef['startColumn'] - 1, itemDef['length']
         actual = record[startColumn:startColumn + length]
         if actual != expected:
             log.warn('%s: expected %s [%s:%s] = {%s} but found {%s}',
@@ -565,11 +586,17 @@ class NAACCR_Visits(_NAACCR_JDBC):
     design_id = pv.StrParam('patient_num')
     table_name = "NAACCR_TUMORS"
     encounter_num_start = pv.IntParam(description='see client.cfg')
+    encounter_map = pv.StrParam(default='', significant=False,
+                                description='sqlite file of allocated encounter_nums (empty: renumber all)')
 
     def _data(self, spark: SparkSession,
               naaccr_text_lines: DataFrame) -> DataFrame:
-        tumors = td.TumorKeys.with_tumor_id(
-            td.TumorKeys.pat_tmr(spark, naaccr_text_lines))
+        tumors = td.TumorKeys.check_tumor_key(td.TumorKeys.with_tumor_id(
+            td.TumorKeys.pat_tmr(spark, naaccr_text_lines)))
+        if self.encounter_map:
+            from pathlib import Path  # ISSUE: ambient
+            enc = td.EncounterNums(Path(self.encounter_map), connect_mem, start=self.encounter_num_start)
+            return enc.with_encounter_num(tumors)
         tumors = td.TumorKeys.with_rownum(
             tumors, start=self.encounter_num_start)
         return tumors
@@ -611,18 +638,107 @@ class NAACCR_Facts(_NAACCR_JDBC):
         td.SEER_Recode.script.code,
         td.SiteSpecificFactors.script1.code,
         td.SiteSpecificFactors.script2.code))
+    cs_index = pv.StrParam(default='', significant=False,
+                           description='CS schema index from csterms.py (empty: use csschema.sql)')
+    fused = pv.BoolParam(default=False, significant=False,
+                         description='one pass over the flat file for all facts (needs cs_index)')
+
+    def _cs_index(self) -> Opt[csschema_index.SchemaIndex]:
+        if not self.cs_index:
+            return None
+        from pathlib import Path  # ISSUE: ambient
+        return csschema_index.SchemaIndex.loads(Path(self.cs_index).read_text())
 
     def _data(self, spark: SparkSession,
               naaccr_text_lines: DataFrame) -> DataFrame:
-        dd = tr_ont.ddictDF(spark)
+        cs_index = self._cs_index()
+        if self.fused:
+            if cs_index is None:
+                raise ValueError('fused needs cs_index')
+            # one pass over the flat file rather than one per kind of fact
+            flat_file = self._flat_file_task().flat_file
+
+            def lines() -> Iterator[str]:
+                with flat_file.open() as f:
+                    yield from f
+
+            return spark.createDataFrame(td.FusedObs(
+                lines, tr_ont.NAACCR1.registry, cs_index.schema))
+        dd = tr_ont.ddictDF()
         extract = td.naaccr_read_fwf(naaccr_text_lines, dd)
         item = td.ItemObs.make(spark, extract)
         seer = td.SEER_Recode.make(spark, extract)
-        ssf = td.SiteSpecificFactors.make(spark, extract)
+        ssf = td.SiteSpecificFactors.make(spark, extract, cs_index)
         # ISSUE: make these separate tables?
         return item.union(seer).union(ssf)
 
 
+class NAACCR_TotalNum(JDBCTask):
+    """Publish c_totalnum (rolled-up distinct patients) to the NAACCR ontology.
+
+    Completion is recorded by facts and ontology task_id (see
+    naaccr_totalnum_status.sql), so counts are recomputed for each
+    new export or ontology build.
+
+    The ontology keeps its own configured connection (e.g. the deid
+    database); facts (and completion status) use this task's, as in
+    NAACCR_Load.
+    """
+    dateCaseReportExported = pv.DateParam()
+    npiRegistryId = pv.StrParam()
+    jdbc_driver_jar = pv.StrParam(significant=False)
+
+    script_name = 'naaccr_totalnum_status.sql'
+    script = res.read_text(heron_load, script_name)
+    status_table = 'naaccr_totalnum_status'
+
+    @property
+    def classpath(self) -> str:
+        return self.jdbc_driver_jar
+
+    def requires(self) -> Dict[str, luigi.Task]:
+        return dict(
+            NAACCR_Ontology1=NAACCR_Ontology1(jdbc_driver_jar=self.jdbc_driver_jar),
+            NAACCR_Facts=NAACCR_Facts(db_url=self.db_url, user=self.user, passkey=self.passkey,
+                                      dateCaseReportExported=self.dateCaseReportExported,
+                                      npiRegistryId=self.npiRegistryId))
+
+    def _ontology(self) -> NAACCR_Ontology1:
+        return cast(NAACCR_Ontology1, self.requires()['NAACCR_Ontology1'])
+
+    def _facts(self) -> NAACCR_Facts:
+        return cast(NAACCR_Facts, self.requires()['NAACCR_Facts'])
+
+    def output(self) -> JDBCTableTarget:
+        query = f"""
+          (select 1 from {self.status_table}
+           where facts_task_id = '{self._facts().task_id}'
+           and ontology_task_id = '{self._ontology().task_id}')
+        """
+        return JDBCTableTarget(self, query)
+
+    def run(self) -> None:
+        ont_task, facts_task = self._ontology(), self._facts()
+        deid, cdw = ont_task.account(), facts_task.loader_account('CDW')
+        terms = deid.query(fr"""
+          select c_fullname, c_hlevel, c_basecode, c_name from {ont_task.table_name}
+          where c_fullname like '{tr_ont.NAACCR_I2B2.top_folder}%'
+        """)
+        facts = cdw.query(f"""
+          select distinct patientIdNumber, concept_cd from {facts_task.table_name}
+          where task_id = '{facts_task.task_id}'
+        """)
+        counts = td.PatientCounts(tr_ont.ConceptClosure.of(terms))
+        counts.add_all(facts)
+        el.Message.log(message_type='patient_counts', patients=len(counts.patient_ix), concepts=len(counts.bits))
+        deid.set_totalnum(ont_task.table_name, counts.totalnum())
+        with self.connection('totalnum status') as conn:
+            self.run_script(conn, self.script_name, self.script,
+                            script_params=dict(facts_task_id=facts_task.task_id,
+                                               ontology_task_id=ont_task.task_id,
+                                               patient_qty=len(counts.patient_ix)))
+
+
 class NAACCR_Summary(_NAACCR_JDBC):
     table_name = "NAACCR_EXPORT_STATS"
 
@@ -631,7 +747,7 @@ class NAACCR_Summary(_NAACCR_JDBC):
 
     def _data(self, spark: SparkSession,
               naaccr_text_lines: DataFrame) -> DataFrame:
-        dd = tr_ont.ddictDF(spark)
+        dd = tr_ont.ddictDF()
         extract = td.naaccr_read_fwf(naaccr_text_lines, dd)
         return td.DataSummary.stats(extract, spark).na.fill(0, subset=['sd'])
 
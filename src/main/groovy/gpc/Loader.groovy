@@ -71,30 +71,47 @@ class Loader {
         new JsonBuilder(results)
     }
 
+    /**
+     * Run one or more batch statements in one transaction.
+     *
+     * Each statement is a JSON header line, {"sql": ...}, followed by
+     * one JSON list of parameters per line.
+     */
     int load(Reader input) {
         def scanner = new Scanner(input)
         def parser = new JsonSlurper()
-        def header = parser.parseText(scanner.nextLine())
-        String stmt = header['sql']
-        log.info("batch insert: $stmt")
+        String headerLine = scanner.nextLine()
 
         setSessionDateFormat()
 
         def qty = 0
-        _sql.withBatch(batchSize, stmt) { BatchingPreparedStatementWrapper ps ->
-            List<Object> record
-            while (scanner.hasNextLine()) {
-                try {
-                    record = parser.parseText(scanner.nextLine()) as List
-                } catch (EOFException ignored) {
-                    break
+        _sql.withTransaction {
+            while (headerLine != null) {
+                def header = parser.parseText(headerLine)
+                String stmt = header['sql']
+                log.info("batch: $stmt")
+                headerLine = null
+                _sql.withBatch(batchSize, stmt) { BatchingPreparedStatementWrapper ps ->
+                    List<Object> record
+                    while (scanner.hasNextLine()) {
+                        String line = scanner.nextLine()
+                        if (line.startsWith('{')) {  // next statement
+                            headerLine = line
+                            break
+                        }
+                        try {
+                            record = parser.parseText(line) as List
+                        } catch (EOFException ignored) {
+                            break
+                        }
+                        // logger.info("insert record: $record")
+                        ps.addBatch(record)
+                        qty += 1
+                    }
                 }
-                // logger.info("insert record: $record")
-                ps.addBatch(record)
-                qty += 1
             }
         }
-        log.info("inserted $qty records")
+        log.info("loaded $qty records")
         qty
     }
 
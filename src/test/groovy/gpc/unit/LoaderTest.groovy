@@ -94,4 +94,27 @@ class LoaderTest extends TestCase {
             assert results.toString() == '[{"TOT":6}]'
         }
     }
+
+    void 'test Loader statements in one transaction'() {
+        def buf = new StringWriter()
+        buf << JsonOutput.toJson([sql: "delete from naaccr_tumors where tumor_id = ?"]) << "\n"
+        buf << JsonOutput.toJson([1]) << "\n"
+        buf << JsonOutput.toJson([sql: "insert into naaccr_tumors (tumor_id, dateOfDiagnosis, primarySite) values (?, ?, ?)"]) << "\n"
+        buf << JsonOutput.toJson([10, "2001-01-01", "C650"]) << "\n"
+        buf << JsonOutput.toJson([20, "2002-02-02", "C650", "extra"]) << "\n"
+
+        def account = DBConfig.inMemoryDB("A1")
+        account.withSql { Sql sql ->
+            def loader = new Loader(sql)
+            loader.runScript(Loader.getResource('naaccr_tables.sql'))
+            sql.execute "delete from naaccr_tumors"
+            sql.execute "insert into naaccr_tumors (tumor_id) values (1)"
+            shouldFail { -> loader.load(new StringReader(buf.toString())) }
+
+            // the delete is rolled back along with the failed insert
+            def results = new StringWriter()
+            results << loader.query('select sum(tumor_id) tot from naaccr_tumors')
+            assert results.toString() == '[{"TOT":1}]'
+        }
+    }
 }